@@ -0,0 +1 @@
+"""Performance benchmarks for robotframework-browser-recorder."""
@@ -0,0 +1,50 @@
+"""Compare the regex and AST parser backends on large generated scripts.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_backends --statements 1000 10000 100000
+
+For every size the script reports the best parse time of each backend over
+``--repeat`` runs, their ratio and how many action records differ between them.
+Differences are expected only where the regex parser is known to be lossy, e.g.
+locators inside ``expect()`` or chains that mix locator methods.
+"""
+
+import argparse
+import sys
+
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from benchmarks.bench_parser import best_time, build_code
+
+
+def main(argv=None) -> int:
+    """Run the comparison and print one row per input size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--statements", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    regex = PlaywrightToRobotConverter(parser="regex")
+    tree = PlaywrightToRobotConverter(parser="ast")
+
+    print(f"{'statements':>10} {'regex ms':>10} {'ast ms':>10} {'ast/regex':>10} {'differ':>7}")
+    for statements in args.statements:
+        code = build_code(statements)
+        regex_actions = regex._parse(code)
+        ast_actions = tree._parse(code)
+        differ = sum(1 for a, b in zip(regex_actions, ast_actions) if a != b)
+        differ += abs(len(regex_actions) - len(ast_actions))
+
+        regex_time = best_time(regex._parse, code, args.repeat)
+        ast_time = best_time(tree._parse, code, args.repeat)
+        print(
+            f"{statements:>10} {regex_time * 1000:>10.1f} {ast_time * 1000:>10.1f} "
+            f"{ast_time / regex_time:>10.2f} {differ:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Converter benchmark suite over synthetic codegen scripts of increasing size.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_converter --output bench.json
+    python -m benchmarks.bench_converter --sizes 100 10000 --baseline bench.json
+
+For every input size (in lines) the suite measures the best wall time of the parse
+stage, the generate stage and an end-to-end ``convert()`` call over ``--repeat`` runs,
+plus the peak traced memory of one ``convert()`` and one ``convert_stream()`` call.
+Results are written as JSON. With ``--baseline`` the run fails when a timing regresses by more than
+``--max-regression`` compared to an earlier result file.
+"""
+
+import argparse
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from robotframework_browser_recorder import __version__
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PARSERS,
+    PlaywrightToRobotConverter,
+)
+from benchmarks.corpus import generate_codegen_script
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000, 1000000]
+TIMINGS = ("parse_seconds", "generate_seconds", "convert_seconds")
+GENERATE_OPTIONS = {
+    "test_name": "Benchmark",
+    "suite_name": "Benchmark Suite",
+    "browser": "chromium",
+    "headless": True,
+}
+
+
+class _NullWriter:
+    """File-like sink that discards everything written to it."""
+
+    def write(self, data: str) -> int:
+        return len(data)
+
+
+def _best_of(repeat: int, func, *args) -> float:
+    """Return the fastest of ``repeat`` timed calls of ``func(*args)``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(lines: int, repeat: int = 3, parser: str = "regex", seed: int = 0) -> Dict:
+    """Benchmark the converter on one generated script.
+
+    Args:
+        lines: Size of the generated script in lines
+        repeat: Number of timed runs per stage; the best is reported
+        parser: Parser backend to benchmark
+        seed: Seed of the corpus generator
+
+    Returns:
+        Result record with timings in seconds and peak memory in bytes
+    """
+    code = generate_codegen_script(lines, seed=seed)
+    converter = PlaywrightToRobotConverter(parser=parser)
+    actions = converter._parse(code)
+
+    def generate() -> None:
+        converter._generate_robot_test(actions=actions, **GENERATE_OPTIONS)
+
+    def convert() -> None:
+        converter.convert(code, **GENERATE_OPTIONS)
+
+    parse_seconds = _best_of(repeat, converter._parse, code)
+    generate_seconds = _best_of(repeat, generate)
+    convert_seconds = _best_of(repeat, convert)
+
+    tracemalloc.start()
+    try:
+        convert()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    src = io.StringIO(code)
+    tracemalloc.start()
+    try:
+        converter.convert_stream(src, _NullWriter(), **GENERATE_OPTIONS)
+        stream_peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "lines": lines,
+        "source_bytes": len(code.encode("utf-8")),
+        "actions": len(actions),
+        "parse_seconds": parse_seconds,
+        "generate_seconds": generate_seconds,
+        "convert_seconds": convert_seconds,
+        "lines_per_second": lines / convert_seconds if convert_seconds else 0.0,
+        "peak_memory_bytes": peak_memory,
+        "stream_peak_memory_bytes": stream_peak_memory,
+    }
+
+
+def compare(results: List[Dict], baseline: Dict, max_regression: float) -> List[str]:
+    """Return a description of every timing that regressed beyond ``max_regression``."""
+    previous = {record["lines"]: record for record in baseline.get("results", [])}
+    regressions = []
+    for record in results:
+        old = previous.get(record["lines"])
+        if old is None:
+            continue
+        for key in TIMINGS + ("peak_memory_bytes", "stream_peak_memory_bytes"):
+            if old.get(key) and record[key] > old[key] * (1 + max_regression):
+                regressions.append(
+                    f"{record['lines']} lines: {key} {old[key]:.6g} -> {record[key]:.6g}"
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite, print a table and write the JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--parser", choices=PARSERS, default="regex")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write JSON results to this file")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'lines':>9} {'actions':>9} {'parse ms':>10} {'generate ms':>12} "
+        f"{'convert ms':>11} {'peak MiB':>9} {'stream KiB':>11}"
+    )
+    results = []
+    for lines in args.sizes:
+        record = measure(lines, repeat=args.repeat, parser=args.parser, seed=args.seed)
+        results.append(record)
+        print(
+            f"{record['lines']:>9} {record['actions']:>9} "
+            f"{record['parse_seconds'] * 1000:>10.1f} {record['generate_seconds'] * 1000:>12.1f} "
+            f"{record['convert_seconds'] * 1000:>11.1f} "
+            f"{record['peak_memory_bytes'] / 2**20:>9.1f} "
+            f"{record['stream_peak_memory_bytes'] / 2**10:>11.1f}"
+        )
+
+    report = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parser": args.parser,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Compare the precompiled dispatch parser against the original ``if/elif`` parser.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parser --statements 20000 --repeat 5
+
+Both parsers are fed the same synthetic recording. The script first checks that
+they produce identical actions and identical Robot output, then reports the best
+wall time of each over ``--repeat`` runs.
+"""
+
+import argparse
+import sys
+import time
+
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from benchmarks.legacy_parser import LegacyPlaywrightToRobotConverter
+
+STATEMENTS = (
+    'page.goto("https://example.com/step/{i}")',
+    'page.get_by_role("button", name="Next {i}").click()',
+    'page.get_by_role("row", name="Row {i}").get_by_role("link").click()',
+    'page.locator("#field-{i}").fill("value {i}")',
+    'page.fill("[data-test=\\"email-{i}\\"]", "user{i}@example.com")',
+    'page.get_by_placeholder("Search").fill("it\\\'s {i}")',
+    'page.get_by_label("Country").select_option("NL")',
+    'page.press("#search", "Enter")',
+    'page.get_by_test_id("agree-{i}").check()',
+    'page.locator("#newsletter").uncheck()',
+    'page.get_by_text("Menu {i}").hover()',
+    'page.dblclick("#file-{i}")',
+    'page.locator("#upload").set_input_files("doc{i}.pdf")',
+    'page.wait_for_load_state("networkidle")',
+    'page.screenshot(path="shot{i}.png")',
+    'expect(page.locator("#message")).to_be_visible()',
+    'expect(page.get_by_test_id("title")).to_have_text("Welcome {i}")',
+    'expect(page.locator("#email")).to_have_value("user{i}@example.com")',
+    'expect(page.locator("#agree")).to_be_checked()',
+    'expect(page).to_have_url("https://example.com/done/{i}")',
+    'expect(page).to_have_title("Done {i}")',
+    'expect(page.get_by_text("click here")).to_contain_text("go.click(now)")',
+    "# a comment line",
+    "context.close()",
+)
+
+
+def build_code(statements: int) -> str:
+    """Build a codegen-like script containing ``statements`` recorded steps."""
+    lines = [
+        "import re",
+        "from playwright.sync_api import Playwright, sync_playwright, expect",
+        "",
+        "",
+        "def run(playwright: Playwright) -> None:",
+        "    browser = playwright.chromium.launch(headless=False)",
+        "    context = browser.new_context()",
+        "    page = context.new_page()",
+    ]
+    for i in range(statements):
+        lines.append("    " + STATEMENTS[i % len(STATEMENTS)].format(i=i))
+    lines.append("    browser.close()")
+    return "\n".join(lines) + "\n"
+
+
+def best_time(func, code: str, repeat: int) -> float:
+    """Return the fastest of ``repeat`` timed calls of ``func(code)``."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(code)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None) -> int:
+    """Run the comparison and print a short report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--statements", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    code = build_code(args.statements)
+    new = PlaywrightToRobotConverter()
+    old = LegacyPlaywrightToRobotConverter()
+
+    if new._parse_playwright_code(code) != old._parse_playwright_code(code):
+        print("Parsers produced different actions", file=sys.stderr)
+        return 1
+    if new.convert(code) != old.convert(code):
+        print("Parsers produced different Robot output", file=sys.stderr)
+        return 1
+
+    old_time = best_time(old._parse_playwright_code, code, args.repeat)
+    new_time = best_time(new._parse_playwright_code, code, args.repeat)
+
+    print(f"statements: {args.statements}")
+    for label, elapsed in (("legacy parser", old_time), ("dispatch parser", new_time)):
+        rate = args.statements / elapsed
+        print(f"{label + ':':18} {elapsed * 1000:9.1f} ms  {rate:12.0f} stmt/s")
+    print(f"{'speed-up:':18} {old_time / new_time:9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Synthetic Playwright codegen scripts for benchmarks.
+
+The generated scripts look like real ``playwright codegen --target python`` output:
+the usual imports and ``run(playwright)`` scaffolding around a body of recorded steps.
+Steps are drawn from a weighted mix of navigations, (chained) locator clicks, fills,
+key presses, selects, checks and ``expect`` assertions, including values with escaped
+quotes. Generation is deterministic for a given size and seed.
+"""
+
+import random
+from typing import List
+
+HEADER = [
+    "import re",
+    "from playwright.sync_api import Playwright, sync_playwright, expect",
+    "",
+    "",
+    "def run(playwright: Playwright) -> None:",
+    "    browser = playwright.chromium.launch(headless=False)",
+    "    context = browser.new_context()",
+    "    page = context.new_page()",
+]
+
+FOOTER = [
+    "",
+    "    # ---------------------",
+    "    context.close()",
+    "    browser.close()",
+    "",
+    "",
+    "with sync_playwright() as playwright:",
+    "    run(playwright)",
+]
+
+ROLES = ("button", "link", "textbox", "checkbox", "row", "cell", "heading", "tab")
+WORDS = (
+    "Sign in",
+    "Next",
+    "Submit",
+    "Cart",
+    "Checkout",
+    "Profile",
+    "Search",
+    "Orders",
+    "Settings",
+    "Log out",
+    "Continue",
+    "Details",
+    "Save",
+    "Cancel",
+    "Home",
+    "Help",
+)
+NAMES = ("O\\'Brien", "Anne-Marie", "Zoë", "d\\'Artagnan", "Smith")
+QUOTED = ('say \\"hi\\"', 'the \\"best\\" deal', "plain text", "it\\'s done")
+
+# (weight, template). Templates receive ``i`` (step number) and random picks below.
+TEMPLATES = (
+    (4, '    page.goto("https://shop.example.com/{word_slug}/{i}")'),
+    (10, '    page.get_by_role("{role}", name="{word}").click()'),
+    (6, '    page.get_by_role("{role}", name="{word} {i}").get_by_text("{word2}").click()'),
+    (4, '    page.get_by_role("row", name="{word}").get_by_role("link").click()'),
+    (4, '    page.locator("[data-test=\\"{word_slug}\\"]").click()'),
+    (6, '    page.get_by_label("{word}").fill("{name}")'),
+    (5, '    page.get_by_placeholder("{word}").fill("{quoted}")'),
+    (4, '    page.locator("#{word_slug}-{i}").fill("value {i}")'),
+    (3, '    page.get_by_role("textbox", name="{word}").press("Enter")'),
+    (2, '    page.press("#{word_slug}", "Tab")'),
+    (2, '    page.get_by_label("{word}").select_option("{word2}")'),
+    (2, '    page.get_by_test_id("{word_slug}").check()'),
+    (1, '    page.get_by_text("{word}").hover()'),
+    (1, '    page.wait_for_load_state("networkidle")'),
+    (3, '    expect(page.locator("#{word_slug}")).to_be_visible()'),
+    (3, '    expect(page.locator("#{word_slug}")).to_have_text("{quoted}")'),
+    (2, '    expect(page.get_by_label("{word}")).to_have_value("{name}")'),
+    (2, '    expect(page).to_have_url("https://shop.example.com/{word_slug}/{i}")'),
+    (1, '    expect(page).to_have_title("{word} | Shop")'),
+    (1, "    page.close()"),
+)
+
+
+def generate_codegen_script(lines: int, seed: int = 0) -> str:
+    """Return a codegen-like script of about ``lines`` lines.
+
+    Args:
+        lines: Total number of lines, including scaffolding
+        seed: Seed for the random step mix
+
+    Returns:
+        Python source as produced by Playwright codegen
+    """
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in TEMPLATES]
+    templates = [template for _, template in TEMPLATES]
+    steps = max(0, lines - len(HEADER) - len(FOOTER))
+
+    body: List[str] = []
+    for i, template in enumerate(rng.choices(templates, weights=weights, k=steps)):
+        word = rng.choice(WORDS)
+        body.append(
+            template.format(
+                i=i,
+                role=rng.choice(ROLES),
+                word=word,
+                word2=rng.choice(WORDS),
+                word_slug=word.lower().replace(" ", "-"),
+                name=rng.choice(NAMES),
+                quoted=rng.choice(QUOTED),
+            )
+        )
+
+    return "\n".join(HEADER + body + FOOTER) + "\n"
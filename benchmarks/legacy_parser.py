@@ -0,0 +1,379 @@
+"""Frozen copy of the original line-by-line parser, used as a benchmark baseline.
+
+This is the ``if/elif`` parser that shipped before the precompiled dispatch engine.
+It recompiles its regexes on every call and is kept only so that benchmarks can
+compare throughput and check that the new engine produces identical actions.
+"""
+
+import re
+from typing import List, Dict, Tuple, Optional
+
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+
+class LegacyPlaywrightToRobotConverter(PlaywrightToRobotConverter):
+    """Converter using the original regex-per-call parser."""
+
+    def __init__(self):
+        """Initialize the converter without selector caches."""
+        super().__init__(selector_cache_size=0)
+
+    def _parse_playwright_code(self, code: str) -> List[Dict]:
+        """Parse Playwright Python code and extract actions.
+
+        Args:
+            code: Playwright Python code
+
+        Returns:
+            List of action dictionaries
+        """
+        actions = []
+        lines = code.split("\n")
+
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith("import"):
+                continue
+
+            if "page.goto(" in line:
+                url = self._extract_string_arg(line)
+                if url:
+                    actions.append({"type": "goto", "url": url})
+
+            elif ".click(" in line:
+                selector = self._extract_selector(line)
+                if selector:
+                    actions.append({"type": "click", "selector": selector})
+
+            elif ".fill(" in line:
+                selector, value = self._extract_fill_args(line)
+                if selector and value:
+                    actions.append({"type": "fill", "selector": selector, "value": value})
+
+            elif ".press(" in line:
+                selector, key = self._extract_press_args(line)
+                if selector and key:
+                    actions.append({"type": "press", "selector": selector, "key": key})
+
+            elif ".select_option(" in line:
+                selector, value = self._extract_select_args(line)
+                if selector and value:
+                    actions.append({"type": "select_option", "selector": selector, "value": value})
+
+            elif ".check(" in line:
+                selector = self._extract_selector(line)
+                if selector:
+                    actions.append({"type": "check", "selector": selector})
+
+            elif ".uncheck(" in line:
+                selector = self._extract_selector(line)
+                if selector:
+                    actions.append({"type": "uncheck", "selector": selector})
+
+            elif ".hover(" in line:
+                selector = self._extract_selector(line)
+                if selector:
+                    actions.append({"type": "hover", "selector": selector})
+
+            elif ".dblclick(" in line:
+                selector = self._extract_selector(line)
+                if selector:
+                    actions.append({"type": "dblclick", "selector": selector})
+
+            elif ".set_input_files(" in line or ".setInputFiles(" in line:
+                selector, file_path = self._extract_set_input_files_args(line)
+                if selector and file_path:
+                    actions.append(
+                        {"type": "set_input_files", "selector": selector, "file_path": file_path}
+                    )
+
+            elif "screenshot(" in line:
+                path = self._extract_string_arg(line, arg_name="path")
+                if path:
+                    actions.append({"type": "screenshot", "path": path})
+
+            elif "wait_for_load_state(" in line:
+                state = self._extract_string_arg(line) or "networkidle"
+                actions.append({"type": "wait_for_load_state", "state": state})
+
+            elif "expect(" in line:
+                # Handle Playwright expect assertions
+                if ".to_be_visible()" in line:
+                    selector = self._extract_expect_selector(line)
+                    if selector:
+                        actions.append({"type": "expect_visible", "selector": selector})
+
+                elif ".to_have_text(" in line or ".to_contain_text(" in line:
+                    selector = self._extract_expect_selector(line)
+                    text = self._extract_expect_text_value(line)
+                    if selector and text:
+                        actions.append({"type": "expect_text", "selector": selector, "text": text})
+
+                elif ".to_have_value(" in line:
+                    selector = self._extract_expect_selector(line)
+                    value = self._extract_expect_text_value(line)
+                    if selector and value:
+                        actions.append(
+                            {"type": "expect_value", "selector": selector, "value": value}
+                        )
+
+                elif ".to_be_checked()" in line:
+                    selector = self._extract_expect_selector(line)
+                    if selector:
+                        actions.append({"type": "expect_checked", "selector": selector})
+
+                elif ".to_have_url(" in line:
+                    url = self._extract_expect_text_value(line)
+                    if url:
+                        actions.append({"type": "expect_url", "url": url})
+
+                elif ".to_have_title(" in line:
+                    title = self._extract_expect_text_value(line)
+                    if title:
+                        actions.append({"type": "expect_title", "title": title})
+
+        return actions
+
+    def _extract_string_arg(self, line: str, arg_name: Optional[str] = None) -> Optional[str]:
+        """Extract a string argument from a function call."""
+        if arg_name:
+            pattern = rf'{arg_name}=["\']([^"\']+)["\']'
+        else:
+            pattern = r'["\']([^"\']+)["\']'
+
+        match = re.search(pattern, line)
+        return match.group(1) if match else None
+
+    def _extract_selector(self, line: str) -> Optional[str]:
+        """Extract selector from a Playwright action, handling chained locators.
+
+        Converts chained locators to Robot Framework >> syntax:
+        page.get_by_role("row").get_by_role("link") -> role=row >> role=link
+        """
+        # Find all locator methods in the line
+        locator_patterns = [
+            (r'locator\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', lambda s: s),
+            (
+                (
+                    r'get_by_role\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']'
+                    r'(?:,\s*name=["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\'])?\)'
+                ),
+                lambda s, n=None: f"role={s}[name='{n}']" if n else f"role={s}",
+            ),
+            (r'get_by_text\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', lambda s: f"text={s}"),
+            (r'get_by_label\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', lambda s: s),
+            (
+                r'get_by_placeholder\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)',
+                lambda s: f"placeholder={s}",
+            ),
+            (
+                r'get_by_test_id\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)',
+                lambda s: f"data-testid={s}",
+            ),
+        ]
+
+        selectors = []
+
+        for pattern_str, formatter in locator_patterns:
+            pattern = re.compile(pattern_str)
+            for match in pattern.finditer(line):
+                groups = match.groups()
+                # Unescape
+                groups = tuple(
+                    g.replace(r"\"", '"').replace(r"\'", "'") if g else None for g in groups
+                )
+                selector = formatter(*groups)
+                selectors.append(selector)
+
+        if selectors:
+            # Chain selectors with >>
+            return " >> ".join(selectors)
+
+        # Fallback pattern
+        match = re.search(r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', line)
+        if match:
+            selector = match.group(1)
+            selector = selector.replace(r"\"", '"').replace(r"\'", "'")
+            return selector
+
+        return None
+
+    def _extract_fill_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract selector and value from fill action.
+
+        Handles both:
+        - page.fill("selector", "value")
+        - page.locator("selector").fill("value")
+        """
+        parts = line.split(".fill(")
+        if len(parts) > 1:
+            # First check for locator chain: page.locator("selector").fill("value")
+            selector = self._extract_selector(line)
+            if selector:
+                # Extract the fill value (single argument)
+                value_pattern = r'\.fill\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+                value_match = re.search(value_pattern, line)
+                if value_match:
+                    value = value_match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                    return selector, value
+
+            # Fallback: Check for page.fill("selector", "value")
+            pattern = (
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+            )
+            match = re.search(pattern, parts[1])
+            if match:
+                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                value = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
+                return selector, value
+        return None, None
+
+    def _extract_press_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract selector and key from press action."""
+        # Extract both selector and key from .press(selector, key)
+        parts = line.split(".press(")
+        if len(parts) > 1:
+            # Match two quoted strings: .press("selector", "key")
+            pattern = (
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+            )
+            match = re.search(pattern, parts[1])
+            if match:
+                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                key = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
+                return selector, key
+        return None, None
+
+    def _extract_select_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract selector and value from select_option action.
+
+        Handles both:
+        - page.select_option("selector", "value")
+        - page.locator("selector").select_option("value")
+        """
+        parts = line.split(".select_option(")
+        if len(parts) > 1:
+            # First check for locator chain: page.locator("selector").select_option("value")
+            selector = self._extract_selector(line)
+            if selector:
+                # Extract the select value (single argument)
+                value_pattern = r'\.select_option\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+                value_match = re.search(value_pattern, line)
+                if value_match:
+                    value = value_match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                    return selector, value
+
+            # Fallback: Check for page.select_option("selector", "value")
+            pattern = (
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+            )
+            match = re.search(pattern, parts[1])
+            if match:
+                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                value = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
+                return selector, value
+        return None, None
+
+    def _extract_set_input_files_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
+        """Extract selector and file path from set_input_files action.
+
+        Handles both:
+        - page.set_input_files("selector", "file.pdf")
+        - page.locator("selector").set_input_files("file.pdf")
+        """
+        parts = line.split(".set_input_files(") or line.split(".setInputFiles(")
+        if len(parts) > 1:
+            # First check for locator chain
+            selector = self._extract_selector(line)
+            if selector:
+                # Extract the file path (single argument)
+                file_pattern = r'\.set_input_files\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+                file_match = re.search(file_pattern, line)
+                if not file_match:
+                    file_pattern = r'\.setInputFiles\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+                    file_match = re.search(file_pattern, line)
+                if file_match:
+                    file_path = file_match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                    return selector, file_path
+
+            # Fallback: Check for page.set_input_files("selector", "file")
+            pattern = (
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
+                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
+            )
+            match = re.search(pattern, parts[1])
+            if match:
+                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
+                file_path = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
+                return selector, file_path
+        return None, None
+
+    def _extract_expect_selector(self, line: str) -> Optional[str]:
+        """Extract selector from expect() statement.
+
+        Handles: expect(page.locator("selector")).to_be_visible()
+        """
+        # Pattern: expect(page.locator("selector") or expect(locator)
+        patterns = [
+            r'expect\(page\.locator\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']',
+            r'expect\(page\.get_by_[a-z_]+\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']',
+        ]
+
+        for pattern in patterns:
+            match = re.search(pattern, line)
+            if match:
+                selector = match.group(1)
+                selector = selector.replace(r"\"", '"').replace(r"\'", "'")
+                return selector
+        return None
+
+    def _extract_expect_text_value(self, line: str) -> Optional[str]:
+        """Extract text/value from expect assertion.
+
+        Handles: .to_have_text("value") or .to_contain_text("value")
+        """
+        # Find the last quoted string in the line (the assertion value)
+        pattern = r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*\)'
+        matches = list(re.finditer(pattern, line))
+        if matches:
+            # Get the last match (the assertion value, not the selector)
+            value = matches[-1].group(1)
+            value = value.replace(r"\"", '"').replace(r"\'", "'")
+            return value
+        return None
+
+    def _simplify_selector(self, selector: str) -> str:
+        """Simplify selector for Robot Framework syntax.
+
+        Converts:
+        - [data-test="value"] -> data-test=value
+        - [id="value"] -> id=value
+        - But preserves quotes in role/text selectors (role=button[name='I Accept'])
+        """
+        import re
+
+        # Don't simplify selectors that start with role=, text=, placeholder=, data-testid=
+        # These are already in the correct Robot Framework format
+        if selector.startswith(("role=", "text=", "placeholder=", "data-testid=")):
+            return selector
+
+        # Don't simplify chained selectors (containing >>)
+        if ">>" in selector:
+            return selector
+
+        # Pattern for [attribute="value"] or [attribute='value']
+        match = re.match(r'^\[([a-zA-Z-]+)=["\']([^"\']+)["\']\]$', selector)
+        if match:
+            attr, value = match.groups()
+            return f"{attr}={value}"
+
+        # Pattern for removing quotes from bracket selectors
+        # e.g., [data-test="value"] -> [data-test=value]
+        selector = re.sub(r'\[([a-zA-Z-]+)=["\']([^"\']+)["\']\]', r"[\1=\2]", selector)
+
+        return selector
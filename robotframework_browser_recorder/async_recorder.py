@@ -0,0 +1,230 @@
+"""Concurrent recording sessions orchestrated with asyncio."""
+
+import asyncio
+import functools
+import os
+import signal
+import subprocess
+import sys
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from robotframework_browser_recorder.capture import CodegenOutput
+from robotframework_browser_recorder.converter.playwright_to_robot import PlaywrightToRobotConverter
+from robotframework_browser_recorder.recorder import (
+    codegen_command,
+    codegen_target,
+    convert_recording,
+)
+
+# On POSIX, codegen runs in its own process group so that stopping a session also stops
+# the Node driver and the browser it starts.
+_PROCESS_GROUPS = sys.platform != "win32"
+
+
+class AsyncBrowserRecorder:
+    """Record browser interactions with a codegen subprocess managed by asyncio.
+
+    The asyncio counterpart of :class:`BrowserRecorder`: waiting for the session does
+    not block the event loop, and converting the recording runs in an executor, so many
+    recorders can run concurrently on one loop. Codegen is started in its own process
+    group; when the session times out or the awaiting task is cancelled, the whole
+    group, including the browser and the Node driver, is terminated and, if it does not
+    exit within ``kill_timeout``, killed.
+    """
+
+    def __init__(
+        self,
+        browser: str = "chromium",
+        output_file: Optional[str] = None,
+        test_name: Optional[str] = None,
+        url: Optional[str] = None,
+        parser: str = "regex",
+        capture: str = "file",
+        timeout: Optional[float] = None,
+        kill_timeout: float = 5.0,
+        executor: Optional[Executor] = None,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            browser: Browser to use (chromium, firefox, webkit)
+            output_file: Path to save the Robot Framework test file
+            test_name: Name of the test case
+            url: Initial URL to navigate to
+            parser: Parser backend of the converter (regex, ast or jsonl)
+            capture: Where codegen writes the recording, ``"file"`` or ``"memory"``
+                (see :class:`CodegenOutput`)
+            timeout: Seconds after which a session that is still running is stopped, or
+                None to wait until the browser is closed
+            kill_timeout: Seconds to wait for codegen to exit after it is asked to
+                terminate, before it is killed
+            executor: Executor that conversions run in; None for the loop's default
+                thread pool. The converter is shared, so it has to be a thread pool.
+        """
+        self.browser = browser
+        self.output_file = output_file or "recorded_test.robot"
+        self.test_name = test_name or "Recorded Test"
+        self.url = url
+        self.capture = capture
+        self.timeout = timeout
+        self.kill_timeout = kill_timeout
+        self.executor = executor
+        self.converter = PlaywrightToRobotConverter(parser=parser)
+
+    async def record(self) -> str:
+        """Record a session and convert it once the browser is closed.
+
+        Returns:
+            Path to the generated Robot Framework test file
+
+        Raises:
+            subprocess.TimeoutExpired: If the session ran longer than ``timeout``
+            subprocess.CalledProcessError: If codegen failed
+            ValueError: If nothing was recorded
+        """
+        target = codegen_target(self.converter.parser)
+        suffix = ".jsonl" if target == "jsonl" else ".py"
+        with CodegenOutput(suffix, self.capture) as output:
+            cmd = codegen_command(self.browser, output.path, self.url, target)
+            process = await asyncio.create_subprocess_exec(*cmd, start_new_session=_PROCESS_GROUPS)
+            try:
+                returncode = await asyncio.wait_for(process.wait(), self.timeout)
+            except asyncio.TimeoutError:
+                await _terminate(process, self.kill_timeout)
+                raise subprocess.TimeoutExpired(cmd, self.timeout) from None
+            except BaseException:
+                await _terminate(process, self.kill_timeout)
+                raise
+            if returncode:
+                raise subprocess.CalledProcessError(returncode, cmd)
+
+            output_path = Path(self.output_file)
+            await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                convert_recording,
+                self.converter,
+                output.path,
+                output_path,
+                self.test_name,
+            )
+            return str(output_path)
+
+    async def convert(self, playwright_code: str, test_name: Optional[str] = None) -> str:
+        """Convert Playwright code in the executor, without blocking the event loop.
+
+        Args:
+            playwright_code: Playwright Python code, or JSONL with the jsonl parser
+            test_name: Name of the test case; defaults to the recorder's test name
+
+        Returns:
+            Robot Framework test file content
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(
+                self.converter.convert,
+                playwright_code=playwright_code,
+                test_name=test_name or self.test_name,
+            ),
+        )
+
+
+async def _terminate(process: asyncio.subprocess.Process, kill_timeout: float) -> None:
+    """Stop ``process`` and its process group, also when cancelled meanwhile.
+
+    The group is sent SIGTERM at once and SIGKILL if ``process`` has not exited after
+    ``kill_timeout`` seconds. Cancelling the caller does not interrupt the shutdown; the
+    cancellation is raised once the process is gone.
+    """
+    if process.returncode is not None:
+        return
+    _signal(process, terminate=True)
+    stop = asyncio.ensure_future(_kill_after(process, kill_timeout))
+    cancelled = False
+    while not stop.done():
+        try:
+            await asyncio.shield(stop)
+        except asyncio.CancelledError:
+            cancelled = True
+    if cancelled:
+        raise asyncio.CancelledError()
+
+
+async def _kill_after(process: asyncio.subprocess.Process, kill_timeout: float) -> None:
+    """Wait for a terminated ``process`` to exit and kill it after ``kill_timeout`` seconds."""
+    try:
+        await asyncio.wait_for(process.wait(), kill_timeout)
+    except asyncio.TimeoutError:
+        _signal(process, terminate=False)
+        await process.wait()
+    # Children that outlived the leader, e.g. a browser that ignored SIGTERM.
+    _signal(process, terminate=False)
+
+
+def _signal(process: asyncio.subprocess.Process, terminate: bool) -> None:
+    """Send SIGTERM (``terminate``) or SIGKILL to the process group of ``process``."""
+    try:
+        if _PROCESS_GROUPS:
+            os.killpg(process.pid, signal.SIGTERM if terminate else signal.SIGKILL)
+        elif process.returncode is None:
+            if terminate:
+                process.terminate()
+            else:
+                process.kill()
+    except ProcessLookupError:
+        pass
+
+
+@dataclass
+class SessionResult:
+    """Outcome of one of several concurrent recording sessions."""
+
+    recorder: AsyncBrowserRecorder
+    output_file: Optional[str] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the session produced a test."""
+        return self.error is None
+
+
+async def record_concurrently(
+    recorders: Sequence[AsyncBrowserRecorder],
+    on_done: Optional[Callable[[SessionResult], None]] = None,
+) -> List[SessionResult]:
+    """Run several recording sessions at the same time.
+
+    Every session is converted as soon as its own browser is closed. A failing session
+    does not affect the others; cancelling the call terminates all codegen processes.
+
+    Args:
+        recorders: Sessions to run
+        on_done: Called with the result of each session as soon as it finishes
+
+    Returns:
+        Results in the order of ``recorders``
+    """
+
+    async def run(recorder: AsyncBrowserRecorder) -> SessionResult:
+        try:
+            result = SessionResult(recorder, output_file=await recorder.record())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            result = SessionResult(recorder, error=e)
+        if on_done is not None:
+            on_done(result)
+        return result
+
+    tasks = [asyncio.ensure_future(run(recorder)) for recorder in recorders]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,409 @@
+"""Batch conversion of existing Playwright codegen scripts to Robot Framework tests."""
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from robotframework_browser_recorder.cache import ConversionCache, file_digest
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PARSERS,
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.validation import ValidationIssue, validate_file
+
+# Per-process converters by parser backend and optimizer rules, created lazily so each
+# worker builds them once.
+_worker_converters: Dict[Tuple[str, Optional[Tuple[str, ...]]], PlaywrightToRobotConverter] = {}
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting a single source file."""
+
+    source: str
+    output: Optional[str] = None
+    status: str = "converted"
+    error: Optional[str] = None
+    issues: List[ValidationIssue] = field(default_factory=list)
+    optimizations: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class BatchSummary:
+    """Aggregated outcome of a batch conversion run."""
+
+    results: List[ConversionResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def _count(self, status: str) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def converted(self) -> int:
+        """Number of files converted successfully."""
+        return self._count("converted")
+
+    @property
+    def failed(self) -> int:
+        """Number of files that raised an error during conversion."""
+        return self._count("failed")
+
+    @property
+    def skipped(self) -> int:
+        """Number of files skipped because they contained no code."""
+        return self._count("skipped")
+
+    @property
+    def cached(self) -> int:
+        """Number of files served from the conversion cache without parsing."""
+        return self._count("cached")
+
+    @property
+    def invalid(self) -> int:
+        """Number of generated files with validation issues."""
+        return sum(1 for result in self.results if result.issues)
+
+    @property
+    def succeeded(self) -> List[ConversionResult]:
+        """Results of the files that were converted, cached or skipped without issues."""
+        return [r for r in self.results if r.status != "failed" and not r.issues]
+
+    @property
+    def unsuccessful(self) -> List[ConversionResult]:
+        """Results of the files that failed to convert or have validation issues."""
+        return [r for r in self.results if r.status == "failed" or r.issues]
+
+    @property
+    def files_per_second(self) -> float:
+        """Throughput over all processed files."""
+        return len(self.results) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def format(self) -> str:
+        """Return a one-line human-readable summary."""
+        summary = (
+            f"Processed {len(self.results)} files in {self.elapsed:.2f}s "
+            f"({self.files_per_second:.1f} files/s): {self.converted} converted, "
+            f"{self.cached} cached, {self.failed} failed, {self.skipped} skipped"
+        )
+        if self.invalid:
+            summary += f", {self.invalid} invalid"
+        optimizations = self.optimizations
+        if optimizations:
+            removed = ", ".join(f"{name} {count}" for name, count in optimizations.items())
+            summary += f"; removed {sum(optimizations.values())} steps ({removed})"
+        return summary
+
+    def format_files(self) -> str:
+        """Return which files succeeded and which failed, one file per line."""
+        lines = [f"Succeeded ({len(self.succeeded)}):"]
+        for result in self.succeeded:
+            target = f"-> {result.output}" if result.output else f"({result.status})"
+            lines.append(f"  {result.source} {target}")
+        lines.append(f"Failed ({len(self.unsuccessful)}):")
+        for result in self.unsuccessful:
+            if result.status == "failed":
+                reason = result.error
+            else:
+                reason = f"{len(result.issues)} validation issue(s)"
+            lines.append(f"  {result.source}: {reason}")
+        return "\n".join(lines)
+
+    @property
+    def optimizations(self) -> Dict[str, int]:
+        """Steps removed by each optimizer rule over all converted files."""
+        totals: Dict[str, int] = {}
+        for result in self.results:
+            for name, count in result.optimizations.items():
+                totals[name] = totals.get(name, 0) + count
+        return totals
+
+
+def name_from_path(path: str) -> str:
+    """Derive a readable test name from a file name, e.g. ``login_flow.py`` -> ``Login Flow``."""
+    words = Path(path).stem.replace("-", " ").replace("_", " ").split()
+    return " ".join(word.capitalize() for word in words) or "Recorded Test"
+
+
+def collect_sources(inputs: Iterable[str], pattern: str = "*.py") -> List[Tuple[str, str]]:
+    """Resolve files, directories and glob patterns to ``(source, root)`` pairs.
+
+    ``root`` is the directory that the output tree mirrors: the directory itself for
+    directory inputs, the non-wildcard prefix for globs and the parent for plain files.
+    Duplicate sources are only returned once.
+    """
+    sources = []
+    seen = set()
+
+    def add(source: Path, root: Path) -> None:
+        key = os.path.abspath(source)
+        if key not in seen:
+            seen.add(key)
+            sources.append((str(source), str(root)))
+
+    for item in inputs:
+        path = Path(item)
+        if glob.has_magic(item):
+            root = Path(".")
+            for part in path.parts:
+                if glob.has_magic(part):
+                    break
+                root = root / part
+            for name in sorted(glob.glob(item, recursive=True)):
+                if os.path.isfile(name):
+                    add(Path(name), root)
+        elif path.is_dir():
+            for match in sorted(path.rglob(pattern)):
+                if match.is_file():
+                    add(match, path)
+        else:
+            add(path, path.parent)
+
+    return sources
+
+
+def output_path_for(source: str, root: str, output_dir: Optional[str]) -> str:
+    """Return the ``.robot`` path for ``source``, mirroring its location below ``root``."""
+    source_path = Path(source)
+    if output_dir is None:
+        return str(source_path.with_suffix(".robot"))
+    relative = os.path.relpath(source_path, root)
+    return str((Path(output_dir) / relative).with_suffix(".robot"))
+
+
+def convert_file(
+    source: str,
+    output: str,
+    browser: str = "chromium",
+    headless: bool = False,
+    parser: str = "regex",
+    cache_dir: Optional[str] = None,
+    validate: bool = False,
+    optimize: Optional[Tuple[str, ...]] = None,
+) -> ConversionResult:
+    """Convert one codegen script and write the Robot Framework test to ``output``.
+
+    With ``cache_dir`` an unchanged source is served from the conversion cache without
+    parsing, and ``output`` is left untouched if it already holds the cached result.
+    With ``validate`` the written test is parsed by Robot Framework and any issues are
+    attached to the result; ``optimize`` names the optimizer rules to apply. Runs inside
+    worker processes, so it never raises; errors are reported in the result.
+    """
+    converter = worker_converter(parser, optimize)
+    result = _convert_file(converter, source, output, browser, headless, cache_dir)
+    if validate and result.output is not None:
+        try:
+            result.issues = validate_file(result.output, source, converter)
+        except Exception as e:
+            result.status = "failed"
+            result.error = f"validation failed: {e}"
+    return result
+
+
+def worker_converter(
+    parser: str, optimize: Optional[Tuple[str, ...]] = None
+) -> PlaywrightToRobotConverter:
+    """Return this process's converter for a parser backend and optimizer rules.
+
+    Converters are created on first use and kept for the lifetime of the process, so
+    worker processes of a pool reuse them for every job.
+    """
+    key = (parser, tuple(optimize) if optimize is not None else None)
+    converter = _worker_converters.get(key)
+    if converter is None:
+        optimizer = ActionOptimizer(optimize) if optimize is not None else None
+        converter = PlaywrightToRobotConverter(parser=parser, optimizer=optimizer)
+        _worker_converters[key] = converter
+    return converter
+
+
+def init_worker(parsers: Iterable[str] = PARSERS) -> None:
+    """Create the converters of ``parsers`` in a new worker process.
+
+    Meant as the ``initializer`` of a process pool, so that workers are ready before
+    their first job.
+    """
+    for parser in parsers:
+        worker_converter(parser)
+
+
+@contextmanager
+def _replace_output(output: str, mode: str = "w") -> Iterator[Any]:
+    """Open a temporary file next to ``output`` that replaces it once the block succeeds.
+
+    A conversion that fails partway leaves an existing output untouched instead of
+    truncated, like :meth:`ConversionCache.put` does for cache entries.
+    """
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
+def _convert_file(
+    converter: PlaywrightToRobotConverter,
+    source: str,
+    output: str,
+    browser: str,
+    headless: bool,
+    cache_dir: Optional[str],
+) -> ConversionResult:
+    """Convert one codegen script, see :func:`convert_file`."""
+
+    try:
+        test_name = name_from_path(source)
+        options: Dict[str, Any] = {
+            "test_name": test_name,
+            "suite_name": test_name,
+            "browser": browser,
+            "headless": headless,
+        }
+
+        cache = ConversionCache(cache_dir) if cache_dir else None
+        if cache is not None:
+            key = cache.key(file_digest(source), options, converter)
+            cached = cache.get(key)
+            if cached is not None:
+                if not _has_content(output, cached):
+                    with _replace_output(output, "wb") as dst:
+                        dst.write(cached)
+                return ConversionResult(source=source, output=output, status="cached")
+
+        if converter.optimizer is not None:
+            converter.optimizer.reset()
+        with open(source, "r", encoding="utf-8") as src:
+            if not any(line.strip() for line in src):
+                return ConversionResult(source=source, status="skipped", error="empty file")
+            src.seek(0)
+
+            with _replace_output(output) as dst:
+                converter.convert_stream(src, dst, **options)
+
+        if cache is not None:
+            cache.put(key, Path(output).read_bytes())
+
+        result = ConversionResult(source=source, output=output)
+        if converter.optimizer is not None:
+            result.optimizations = dict(converter.optimizer.report)
+        return result
+    except Exception as e:
+        return ConversionResult(source=source, status="failed", error=str(e))
+
+
+def _has_content(path: str, data: bytes) -> bool:
+    """Return whether the file at ``path`` exists and holds exactly ``data``."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _convert_job(job: Tuple) -> ConversionResult:
+    """Unpack a job tuple for ``ProcessPoolExecutor.map``."""
+    return convert_file(*job)
+
+
+class BatchConverter:
+    """Convert many Playwright codegen scripts to Robot Framework tests in parallel."""
+
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        jobs: Optional[int] = None,
+        browser: str = "chromium",
+        headless: bool = False,
+        pattern: str = "*.py",
+        parser: str = "regex",
+        cache_dir: Optional[str] = None,
+        cache_max_bytes: Optional[int] = None,
+        cache_max_age: Optional[float] = None,
+        validate: bool = False,
+        optimize: Optional[Iterable[str]] = None,
+    ):
+        """Initialize the batch converter.
+
+        Args:
+            output_dir: Directory for the generated tests; next to the sources if None
+            jobs: Number of worker processes (default: CPU count, 1 runs in-process)
+            browser: Browser type written to the generated tests
+            headless: Headless flag written to the generated tests
+            pattern: File pattern used when an input is a directory
+            parser: Parser backend of the converter (regex, ast or jsonl)
+            cache_dir: Directory of the conversion cache; no caching if None
+            cache_max_bytes: Evict the oldest cache entries beyond this total size
+            cache_max_age: Evict cache entries unused for this many seconds
+            validate: Check every generated test with Robot Framework's parser
+            optimize: Optimizer rules to apply, see
+                :data:`~robotframework_browser_recorder.converter.optimizer.RULES`;
+                no optimization if None
+
+        Raises:
+            ValueError: If ``jobs`` is negative or an optimizer rule is unknown
+        """
+        if optimize is not None:
+            optimize = tuple(ActionOptimizer(optimize).rules)
+        self.output_dir = output_dir
+        self.jobs = jobs or os.cpu_count() or 1
+        if self.jobs < 1:
+            raise ValueError("The number of jobs must be at least 1")
+        self.browser = browser
+        self.headless = headless
+        self.pattern = pattern
+        self.parser = parser
+        self.cache_dir = cache_dir
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_max_age = cache_max_age
+        self.validate = validate
+        self.optimize = optimize
+
+    def convert(self, inputs: Iterable[str]) -> BatchSummary:
+        """Convert all files matched by ``inputs``.
+
+        Args:
+            inputs: Files, directories or glob patterns
+
+        Returns:
+            Summary with one result per source file, in input order
+        """
+        start = time.perf_counter()
+        jobs = [
+            (
+                source,
+                output_path_for(source, root, self.output_dir),
+                self.browser,
+                self.headless,
+                self.parser,
+                self.cache_dir,
+                self.validate,
+                self.optimize,
+            )
+            for source, root in collect_sources(inputs, self.pattern)
+        ]
+
+        if self.jobs == 1 or len(jobs) <= 1:
+            results = [_convert_job(job) for job in jobs]
+        else:
+            workers = min(self.jobs, len(jobs))
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_convert_job, jobs, chunksize=chunksize))
+
+        if self.cache_dir and (self.cache_max_bytes is not None or self.cache_max_age is not None):
+            ConversionCache(self.cache_dir, self.cache_max_bytes, self.cache_max_age).evict()
+
+        return BatchSummary(results=results, elapsed=time.perf_counter() - start)
@@ -0,0 +1,225 @@
+"""Content-addressed on-disk cache of conversion results."""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Optional
+
+from robotframework_browser_recorder import __version__
+from robotframework_browser_recorder import converter as converter_package
+from robotframework_browser_recorder.converter.playwright_to_robot import PlaywrightToRobotConverter
+from robotframework_browser_recorder.converter.plugins import PluginRegistry
+
+_CHUNK_SIZE = 1 << 16
+
+# Distribution whose installed version is part of every cache key.
+_DISTRIBUTION = "robotframework-browser-recorder"
+
+
+@functools.lru_cache(maxsize=None)
+def package_version() -> str:
+    """Return the installed version of the package, or ``__version__`` from a source tree."""
+    try:
+        return metadata.version(_DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        return __version__
+
+
+@functools.lru_cache(maxsize=None)
+def converter_source_digest() -> str:
+    """Return the SHA-256 hex digest of the sources of the converter package."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(converter_package.__file__).parent.glob("*.py")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _code_digest(handler) -> str:
+    """Return a short digest of the bytecode of a handler, or "" if it has none."""
+    func = inspect.unwrap(getattr(handler, "__func__", handler))
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return ""
+    digest = hashlib.sha256(code.co_code)
+    digest.update(repr((code.co_consts, code.co_names)).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _describe_plugins(registry: PluginRegistry) -> Dict[str, str]:
+    """Describe the plugins of a converter without loading any.
+
+    Entry points carry the version of their distribution; registered plugins, which
+    may have none, get the digest of their hooks' bytecode.
+    """
+    description = registry.describe()
+    for name, plugin in registry.registered.items():
+        digest = f"{_code_digest(plugin.parse)}{_code_digest(plugin.convert)}"
+        description[name] = f"{description[name]}:{digest}"
+    return description
+
+
+def converter_fingerprint(converter: PlaywrightToRobotConverter) -> Dict:
+    """Describe everything about a converter that can change its output.
+
+    Besides the options this covers the installed package version, the sources of the
+    converter package, the bytecode of every handler and the plugin versions, so edited
+    or replaced handlers and upgraded plugins never reuse entries written by older code.
+    """
+    cls = type(converter)
+
+    def describe(handlers: Dict) -> Dict[str, str]:
+        return {
+            str(name): f"{getattr(handler, '__qualname__', repr(handler))}:{_code_digest(handler)}"
+            for name, handler in sorted(handlers.items(), key=lambda item: str(item[0]))
+        }
+
+    return {
+        "version": package_version(),
+        "sources": converter_source_digest(),
+        "class": f"{cls.__module__}.{cls.__qualname__}",
+        "parser": converter.parser,
+        "indent": converter.indent,
+        "action_mappings": describe(converter.action_mappings),
+        "parse_handlers": describe(converter.parse_handlers),
+        "optimizer": converter.optimizer.rules if converter.optimizer is not None else None,
+        "plugins": _describe_plugins(converter.plugins),
+    }
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """Store generated Robot Framework tests keyed by the hash of everything they depend on.
+
+    The key covers the input content, the package version, the conversion options and
+    the converter's code and mapping configuration, so a hit is always safe to reuse.
+    Entries are plain files below ``directory``; their modification time is refreshed
+    on every hit and :meth:`evict` drops the least recently used ones by age and total
+    size.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache entries; created on first write
+            max_bytes: Total size above which the oldest entries are evicted
+            max_age: Age in seconds after which unused entries are evicted
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def key(
+        self,
+        source_digest: str,
+        options: Dict,
+        converter: PlaywrightToRobotConverter,
+    ) -> str:
+        """Return the cache key for converting a source with the given options.
+
+        Args:
+            source_digest: Digest of the source, see :func:`file_digest`
+            options: Keyword arguments passed to ``convert`` (test_name, browser, ...)
+            converter: Converter that performs the conversion
+        """
+        payload = json.dumps(
+            {
+                "source": source_digest,
+                "options": options,
+                "converter": converter_fingerprint(converter),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Return the file that holds the entry for ``key``."""
+        return self.directory / key[:2] / f"{key}.robot"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached output for ``key``, or None on a miss."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` as the output for ``key``.
+
+        The entry is written to a temporary file and renamed into place, so parallel
+        workers never observe partially written entries.
+        """
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def evict(self) -> int:
+        """Remove entries older than ``max_age`` and the oldest beyond ``max_bytes``.
+
+        Returns:
+            Number of removed entries
+        """
+        if not self.directory.is_dir():
+            return 0
+
+        entries = []
+        for path in self.directory.glob("*/*.robot"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            expired = self.max_age is not None and now - mtime > self.max_age
+            oversized = self.max_bytes is not None and total > self.max_bytes
+            if not expired and not oversized:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,100 @@
+"""Where the codegen subprocess writes its recording: a temporary file or memory."""
+
+import os
+import sys
+import tempfile
+from typing import Optional
+
+# ``file`` records to a temporary file; ``memory`` to an anonymous in-memory file
+# where the platform supports it, and to a temporary file otherwise.
+CAPTURE_MODES = ("file", "memory")
+
+
+def memory_capture_supported() -> bool:
+    """Return whether codegen output can be captured in an anonymous in-memory file."""
+    return (
+        sys.platform.startswith("linux")
+        and hasattr(os, "memfd_create")
+        and os.path.isdir(f"/proc/{os.getpid()}/fd")
+    )
+
+
+def _fd_path(fd: int) -> str:
+    """Return the path of this process's descriptor ``fd`` that other processes can open."""
+    return f"/proc/{os.getpid()}/fd/{fd}"
+
+
+class CodegenOutput:
+    """Output file of a codegen subprocess.
+
+    Codegen rewrites its output file completely on every recorded step, so the output
+    has to be a file that can be truncated and reread, not a stream. In memory mode it
+    is an anonymous ``memfd`` file held open by this process. ``path`` names it through
+    this process's descriptor table (``/proc/<pid>/fd/<n>``), so codegen can open it
+    however many processes deep the writer runs: the ``playwright`` CLI is a wrapper
+    that starts Node with its inherited descriptors closed. Nothing is written to disk,
+    and the file disappears with this process, also when the recorder is killed. If the
+    in-memory file cannot be created or opened by path, a temporary file is used.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(self, suffix: str = ".py", mode: str = "file"):
+        """Create the output file.
+
+        Args:
+            suffix: File name suffix of a temporary file
+            mode: One of :data:`CAPTURE_MODES`
+
+        Raises:
+            ValueError: If ``mode`` is unknown
+        """
+        if mode not in CAPTURE_MODES:
+            raise ValueError(
+                f"Unknown capture mode {mode!r}, expected one of: {', '.join(CAPTURE_MODES)}"
+            )
+        self._fd = self._create_memory_file() if mode == "memory" else None
+        #: Whether the output is captured in memory rather than in a temporary file.
+        self.in_memory = self._fd is not None
+        if self._fd is not None:
+            self.path = _fd_path(self._fd)
+        else:
+            with tempfile.NamedTemporaryFile(mode="w+", suffix=suffix, delete=False) as tmp_file:
+                self.path = tmp_file.name
+
+    @staticmethod
+    def _create_memory_file() -> Optional[int]:
+        """Return the descriptor of a new in-memory file, or None if it is unusable."""
+        if not memory_capture_supported():
+            return None
+        try:
+            fd = os.memfd_create("rfbrowser-codegen")
+        except OSError:
+            return None
+        try:
+            # Hardened /proc mounts may hide descriptors; codegen could not open it then.
+            with open(_fd_path(fd), "rb"):
+                pass
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    def describe(self) -> str:
+        """Return where the recording goes, for messages to the user."""
+        return "memory" if self.in_memory else f"temporary file: {self.path}"
+
+    def close(self) -> None:
+        """Release the in-memory file or delete the temporary file."""
+        if self.in_memory:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        elif os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def __enter__(self) -> "CodegenOutput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,12 +1,568 @@
-"""Main CLI entry point for Robot Framework Browser Recorder."""
+"""Main CLI entry point for Robot Framework Browser Recorder.
+
+Only argument parsing happens at import time. The converter, the recorders and their
+dependencies (asyncio, subprocess, multiprocessing, ...) are imported by the subcommand
+that needs them, which keeps ``--help`` and ``--version`` fast; see
+``tests/test_cli_startup.py`` for the import time budget.
+"""
 
 import argparse
+import re
 import sys
-from robotframework_browser_recorder.recorder import BrowserRecorder
 
+from robotframework_browser_recorder import __version__
+
+
+def parse_rules(value):
+    """Parse an ``--optimize`` value: ``all`` or a comma-separated list of rule names."""
+    from robotframework_browser_recorder.converter.optimizer import RULES
+
+    if value == "all":
+        return list(RULES)
+    rules = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in rules if name not in RULES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown rule(s) {', '.join(unknown)}, choose from: all, {', '.join(RULES)}"
+        )
+    return rules
+
+
+def _int_at_least(value, minimum, expected):
+    """Parse ``value`` as an integer of at least ``minimum``, else report ``expected``."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"invalid value {value!r}, expected {expected}")
+    return number
+
+
+def positive_int(value):
+    """Parse a count such as ``--jobs 8`` that must be at least 1."""
+    return _int_at_least(value, 1, "a positive integer")
+
+
+def non_negative_int(value):
+    """Parse a count such as ``--max-queue 0`` that must not be negative."""
+    return _int_at_least(value, 0, "a non-negative integer")
+
+
+def parse_weights(value):
+    """Parse a ``--weights`` value such as ``goto=2.5,wait=1``."""
+    from robotframework_browser_recorder.sharding import RuntimeWeights
+
+    try:
+        return RuntimeWeights.parse(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def add_optimize_argument(parser):
+    """Add the ``--optimize [RULES]`` option to ``parser``."""
+    from robotframework_browser_recorder.converter.optimizer import RULES
 
-def main():
+    parser.add_argument(
+        "--optimize",
+        nargs="?",
+        const=list(RULES),
+        default=None,
+        type=parse_rules,
+        metavar="RULES",
+        help="Remove redundant steps with all optimizer rules, or only the given "
+        f"comma-separated ones ({', '.join(RULES)})",
+    )
+
+
+def convert_main(argv):
+    """Entry point for ``rfbrowser-record convert``: batch-convert existing scripts."""
+    parser = argparse.ArgumentParser(
+        prog="rfbrowser-record convert",
+        description="Convert existing Playwright codegen scripts to Robot Framework tests",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Convert every script below recordings/ into tests/, mirroring the tree
+  rfbrowser-record convert recordings/ --output-dir tests/
+
+  # Convert matching files with 8 worker processes
+  rfbrowser-record convert "recordings/**/*_flow.py" --output-dir tests/ --jobs 8
+
+  # Fail when Robot Framework cannot parse a generated test
+  rfbrowser-record convert recordings/ --output-dir tests/ --validate
+        """,
+    )
+
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Playwright Python files, directories or glob patterns",
+    )
+
+    parser.add_argument(
+        "--output-dir",
+        "-d",
+        type=str,
+        default=None,
+        help="Directory for generated tests (default: next to each source file)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+
+    parser.add_argument(
+        "--browser",
+        "-b",
+        type=str,
+        choices=["chromium", "firefox", "webkit"],
+        default="chromium",
+        help="Browser written to the generated tests (default: chromium)",
+    )
+
+    parser.add_argument(
+        "--parser",
+        type=str,
+        choices=["regex", "ast", "jsonl"],
+        default="regex",
+        help="Parser backend for the Playwright code (default: regex); jsonl reads the "
+        "JSON lines target of codegen from *.jsonl files",
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Generate tests that run the browser headless",
+    )
+
+    add_optimize_argument(parser)
+
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Check every generated test with Robot Framework's parser; "
+        "exit with status 1 on issues",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Reuse results for unchanged inputs from this cache directory",
+    )
+
+    parser.add_argument(
+        "--cache-max-size",
+        type=float,
+        default=None,
+        help="Evict the oldest cache entries beyond this size in MB",
+    )
+
+    parser.add_argument(
+        "--cache-max-age",
+        type=float,
+        default=None,
+        help="Evict cache entries that were not used for this many days",
+    )
+
+    args = parser.parse_args(argv)
+
+    from robotframework_browser_recorder.batch import BatchConverter
+
+    converter = BatchConverter(
+        output_dir=args.output_dir,
+        jobs=args.jobs,
+        browser=args.browser,
+        headless=args.headless,
+        parser=args.parser,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=(
+            int(args.cache_max_size * 1024 * 1024) if args.cache_max_size is not None else None
+        ),
+        cache_max_age=args.cache_max_age * 86400 if args.cache_max_age is not None else None,
+        validate=args.validate,
+        optimize=args.optimize,
+        pattern="*.jsonl" if args.parser == "jsonl" else "*.py",
+    )
+
+    try:
+        summary = converter.convert(args.inputs)
+    except KeyboardInterrupt:
+        print("\nConversion cancelled by user.", file=sys.stderr)
+        sys.exit(130)
+
+    for result in summary.results:
+        for issue in result.issues:
+            print(issue.format(result.output, result.source), file=sys.stderr)
+
+    print(summary.format())
+    if summary.failed or summary.invalid:
+        print(summary.format_files(), file=sys.stderr)
+        sys.exit(1)
+
+
+def suite_main(argv):
+    """Entry point for ``rfbrowser-record suite``: combine scripts into one suite."""
+    parser = argparse.ArgumentParser(
+        prog="rfbrowser-record suite",
+        description="Combine Playwright codegen scripts into one Robot Framework suite "
+        "that launches the browser once",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # One test per script below recordings/, sharing a single browser
+  rfbrowser-record suite recordings/ --output nightly.robot --headless
+
+  # Four shards of similar runtime for pabot, weights learned from an earlier run
+  rfbrowser-record suite recordings/ --shards 4 --output shards/ --timings output.xml
+  pabot --ordering shards/pabot_order.txt shards/
+        """,
+    )
+
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Playwright Python files, directories or glob patterns; one test per file",
+    )
+
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        default=None,
+        help="Output file path for the suite (default: recorded_suite.robot), or the "
+        "output directory with --shards (default: shards)",
+    )
+
+    parser.add_argument(
+        "--browser",
+        "-b",
+        type=str,
+        choices=["chromium", "firefox", "webkit"],
+        default="chromium",
+        help="Browser launched in the Suite Setup (default: chromium)",
+    )
+
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the browser headless",
+    )
+
+    parser.add_argument(
+        "--parser",
+        type=str,
+        choices=["regex", "ast", "jsonl"],
+        default="regex",
+        help="Parser backend for the Playwright code (default: regex); jsonl reads the "
+        "JSON lines target of codegen from *.jsonl files",
+    )
+
+    add_optimize_argument(parser)
+
+    parser.add_argument(
+        "--extract-keywords",
+        nargs="?",
+        type=int,
+        const=3,
+        default=None,
+        metavar="MIN_STEPS",
+        help="Move runs of at least MIN_STEPS steps (default: 3) that repeat across tests "
+        "into keywords",
+    )
+
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Split the tests into N suites of similar estimated runtime and write a "
+        "pabot ordering file",
+    )
+
+    parser.add_argument(
+        "--weights",
+        type=parse_weights,
+        default=None,
+        metavar="SPEC",
+        help="Runtime estimate in seconds per test, goto, wait and interaction, "
+        "e.g. goto=2.5,wait=1 (default: test=1,goto=1.5,wait=1,interaction=0.25)",
+    )
+
+    parser.add_argument(
+        "--timings",
+        action="append",
+        default=None,
+        metavar="OUTPUT_XML",
+        help="Learn the runtime weights from the output.xml of earlier runs; may be repeated",
+    )
+
+    args = parser.parse_args(argv)
+    if args.shards is not None and args.shards < 1:
+        parser.error("--shards must be at least 1")
+
+    from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+    from robotframework_browser_recorder.converter.playwright_to_robot import (
+        PlaywrightToRobotConverter,
+    )
+    from robotframework_browser_recorder.keywords import KeywordExtractor
+    from robotframework_browser_recorder.sharding import RuntimeWeights, write_shards
+    from robotframework_browser_recorder.suite import SuiteBuilder
+
+    optimizer = ActionOptimizer(args.optimize) if args.optimize is not None else None
+    extractor = None
+    if args.extract_keywords is not None:
+        try:
+            extractor = KeywordExtractor(min_length=args.extract_keywords)
+        except ValueError as e:
+            parser.error(str(e))
+    builder = SuiteBuilder(
+        converter=PlaywrightToRobotConverter(parser=args.parser, optimizer=optimizer),
+        browser=args.browser,
+        headless=args.headless,
+        keyword_extractor=extractor,
+    )
+    try:
+        tests = builder.add_files(args.inputs, "*.jsonl" if args.parser == "jsonl" else "*.py")
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if not tests:
+        print("Error: no Playwright scripts found", file=sys.stderr)
+        sys.exit(1)
+
+    if args.shards is None:
+        output_file = builder.write(args.output or "recorded_suite.robot")
+        print(f"Wrote {len(tests)} tests to {output_file}")
+        if builder.keywords:
+            print(f"Extracted {len(builder.keywords)} keywords from repeated steps")
+        return
+
+    weights = args.weights
+    if args.timings:
+        try:
+            weights = RuntimeWeights.from_output_xml(args.timings, defaults=weights)
+        except Exception as e:
+            print(f"Error: cannot read timings: {e}", file=sys.stderr)
+            sys.exit(1)
+    shards, ordering = write_shards(builder, args.output or "shards", args.shards, weights)
+    for path, shard in shards:
+        print(f"Wrote {len(shard.tests)} tests to {path} (~{shard.runtime:.1f}s)")
+    print(f"Wrote pabot ordering to {ordering}")
+
+
+SESSION_KEYS = ("browser", "url", "name", "output")
+_SESSION_KEY_RE = re.compile(r"(?:^|,)({})=".format("|".join(SESSION_KEYS)))
+
+
+def parse_session(spec):
+    """Parse a ``--session`` value such as ``browser=firefox,url=https://x,output=x.robot``.
+
+    Values may contain commas; a comma only starts a new field when it is followed by
+    one of the known keys.
+    """
+    matches = list(_SESSION_KEY_RE.finditer(spec))
+    if not matches or matches[0].start() != 0:
+        raise argparse.ArgumentTypeError(
+            f"invalid session {spec!r}, expected comma-separated {'/'.join(SESSION_KEYS)}=VALUE"
+        )
+    fields = {}
+    for match, following in zip(matches, matches[1:] + [None]):
+        start = match.end()
+        end = following.start() if following is not None else len(spec)
+        fields[match.group(1)] = spec[start:end]
+    if fields.get("browser", "chromium") not in ("chromium", "firefox", "webkit"):
+        raise argparse.ArgumentTypeError(f"invalid browser in session {spec!r}")
+    return fields
+
+
+def sessions_main(argv):
+    """Entry point for ``rfbrowser-record sessions``: record several sessions at once."""
+    parser = argparse.ArgumentParser(
+        prog="rfbrowser-record sessions",
+        description="Record several browser sessions concurrently",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Record a login flow in Firefox and a checkout flow in WebKit at the same time
+  rfbrowser-record sessions \\
+    --session "browser=firefox,url=https://example.com/login,name=Login,output=login.robot" \\
+    --session "browser=webkit,url=https://example.com/shop,name=Checkout,output=checkout.robot"
+        """,
+    )
+
+    parser.add_argument(
+        "--session",
+        "-s",
+        dest="sessions",
+        metavar="SPEC",
+        action="append",
+        type=parse_session,
+        required=True,
+        help="Session as comma-separated browser=, url=, name= and output= fields; "
+        "repeat for every session",
+    )
+
+    parser.add_argument(
+        "--parser",
+        type=str,
+        choices=["regex", "ast", "jsonl"],
+        default="regex",
+        help="Parser backend for the Playwright code (default: regex); jsonl records "
+        "codegen's structured JSON lines target instead of a Python script",
+    )
+
+    parser.add_argument(
+        "--capture",
+        type=str,
+        choices=["file", "memory"],
+        default="file",
+        help="Capture codegen's output in a temporary file or in memory, without writing "
+        "to disk (Linux; other platforms fall back to a temporary file) (default: file)",
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Stop sessions that are still running after this many seconds",
+    )
+
+    args = parser.parse_args(argv)
+
+    import asyncio
+
+    from robotframework_browser_recorder.async_recorder import (
+        AsyncBrowserRecorder,
+        record_concurrently,
+    )
+
+    recorders = [
+        AsyncBrowserRecorder(
+            browser=session.get("browser", "chromium"),
+            output_file=session.get("output") or f"recorded_test_{index}.robot",
+            test_name=session.get("name"),
+            url=session.get("url"),
+            parser=args.parser,
+            capture=args.capture,
+            timeout=args.timeout,
+        )
+        for index, session in enumerate(args.sessions, 1)
+    ]
+
+    def report(result):
+        name = f"{result.recorder.test_name} ({result.recorder.browser})"
+        if result.ok:
+            print(f"{name}: saved to {result.output_file}")
+        else:
+            print(f"{name}: failed: {result.error}", file=sys.stderr)
+
+    print(f"Recording {len(recorders)} sessions. Close each browser window when done.")
+    try:
+        results = asyncio.run(record_concurrently(recorders, on_done=report))
+    except KeyboardInterrupt:
+        print("\nRecording cancelled by user.", file=sys.stderr)
+        sys.exit(130)
+
+    if not all(result.ok for result in results):
+        sys.exit(1)
+
+
+def serve_main(argv):
+    """Entry point for ``rfbrowser-record serve``: run the local conversion server."""
+    parser = argparse.ArgumentParser(
+        prog="rfbrowser-record serve",
+        description="Convert Playwright code over HTTP on localhost with warm worker processes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Serve on http://127.0.0.1:8765 with one worker per CPU
+  rfbrowser-record serve
+
+  # Convert a script
+  curl -s http://127.0.0.1:8765/convert -d '{"code": "page.goto(\\"https://example.com\\")"}'
+
+  # Latency percentiles and throughput
+  curl -s http://127.0.0.1:8765/metrics
+        """,
+    )
+
+    parser.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=None,
+        help="Port on 127.0.0.1 to listen on (default: 8765, 0 picks a free port)",
+    )
+
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=positive_int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+
+    parser.add_argument(
+        "--max-queue",
+        type=non_negative_int,
+        default=64,
+        help="Requests that may wait for a busy worker before further ones are "
+        "rejected with 503 (default: 64)",
+    )
+
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Log every request to stderr",
+    )
+
+    args = parser.parse_args(argv)
+
+    from robotframework_browser_recorder.server import DEFAULT_PORT, ConversionServer
+
+    try:
+        server = ConversionServer(
+            port=DEFAULT_PORT if args.port is None else args.port,
+            workers=args.workers,
+            max_queue=args.max_queue,
+            verbose=args.verbose,
+        )
+        server.start()
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Serving conversions on {server.url} with {server.workers} workers")
+    print("POST /convert, GET /metrics, GET /health. Press Ctrl-C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer stopped.", file=sys.stderr)
+    finally:
+        server.close()
+
+
+def main(argv=None):
     """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "convert":
+        return convert_main(argv[1:])
+    if argv and argv[0] == "sessions":
+        return sessions_main(argv[1:])
+    if argv and argv[0] == "suite":
+        return suite_main(argv[1:])
+    if argv and argv[0] == "serve":
+        return serve_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Record browser interactions and generate Robot Framework tests",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -20,6 +576,22 @@ Examples:
 
   # Record with custom output file
   rfbrowser-record --url https://example.com --output my_test.robot
+
+  # Show where the time went (add "json" for machine-readable output)
+  rfbrowser-record --url https://example.com --profile
+
+  # Record several sessions concurrently (see: rfbrowser-record sessions --help)
+  rfbrowser-record sessions -s "browser=firefox,url=https://example.com,output=a.robot" \\
+    -s "browser=webkit,url=https://example.com,output=b.robot"
+
+  # Combine codegen scripts into one suite (see: rfbrowser-record suite --help)
+  rfbrowser-record suite recordings/ --output nightly.robot
+
+  # Convert existing codegen scripts (see: rfbrowser-record convert --help)
+  rfbrowser-record convert recordings/ --output-dir tests/
+
+  # Serve conversions over HTTP on localhost (see: rfbrowser-record serve --help)
+  rfbrowser-record serve --port 8765
         """,
     )
 
@@ -56,23 +628,90 @@ Examples:
         help="Name of the test case (default: Recorded Test)",
     )
 
+    parser.add_argument(
+        "--parser",
+        type=str,
+        choices=["regex", "ast", "jsonl"],
+        default="regex",
+        help="Parser backend for the Playwright code (default: regex); jsonl records "
+        "codegen's structured JSON lines target instead of a Python script",
+    )
+
+    parser.add_argument(
+        "--engine",
+        type=str,
+        choices=["codegen", "inprocess"],
+        default="codegen",
+        help="Record with the playwright codegen CLI or in-process through the Playwright "
+        "Python API (default: codegen)",
+    )
+
+    parser.add_argument(
+        "--capture",
+        type=str,
+        choices=["file", "memory"],
+        default="file",
+        help="Capture codegen's output in a temporary file or in memory, without writing "
+        "to disk (Linux; other platforms fall back to a temporary file) (default: file)",
+    )
+
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Keep the output file up to date while recording",
+    )
+
+    add_optimize_argument(parser)
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="table",
+        choices=["table", "json"],
+        default=None,
+        help="Print time spent per stage when done, as a table (default) or as JSON",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help="Append a JSON metrics record of the session to this file",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
-        version="%(prog)s 0.1.0",
+        version=f"%(prog)s {__version__}",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+    from robotframework_browser_recorder.profiling import Profiler
+    from robotframework_browser_recorder.recorder import BrowserRecorder
 
+    profiler = Profiler() if args.profile else None
+    optimizer = ActionOptimizer(args.optimize) if args.optimize is not None else None
     recorder = BrowserRecorder(
         browser=args.browser,
         output_file=args.output,
         test_name=args.test_name,
         url=args.url,
+        live=args.live,
+        parser=args.parser,
+        profiler=profiler,
+        metrics_sink=args.metrics,
+        engine=args.engine,
+        optimizer=optimizer,
+        capture=args.capture,
     )
 
     try:
         output_file = recorder.record()
+        if optimizer is not None:
+            print(optimizer.format())
         print("\nSuccess! You can now run your test with:")
         print(f"  robot {output_file}")
 
@@ -82,6 +721,17 @@ Examples:
     except Exception as e:
         print(f"\nError: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        if profiler is not None:
+            print_profile(profiler, args.profile)
+
+
+def print_profile(profiler, output_format):
+    """Print the per-stage breakdown of ``profiler`` to stderr."""
+    if output_format == "json":
+        print(profiler.to_json(), file=sys.stderr)
+    else:
+        print(f"\n{profiler.format()}", file=sys.stderr)
 
 
 if __name__ == "__main__":
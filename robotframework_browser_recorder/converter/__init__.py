@@ -1,7 +1,60 @@
-"""Converters for transforming Playwright code to Robot Framework tests."""
+"""Converters for transforming Playwright code to Robot Framework tests.
 
-from robotframework_browser_recorder.converter.playwright_to_robot import (
-    PlaywrightToRobotConverter,
-)
+The names below are imported from their modules on first access, so importing a light
+submodule such as ``converter.optimizer`` does not load the whole converter.
+"""
 
-__all__ = ["PlaywrightToRobotConverter"]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from robotframework_browser_recorder.converter.actions import Action, ActionType
+    from robotframework_browser_recorder.converter.ast_parser import AstPlaywrightParser
+    from robotframework_browser_recorder.converter.incremental import ConversionState
+    from robotframework_browser_recorder.converter.jsonl import JsonlActionParser
+    from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+    from robotframework_browser_recorder.converter.plugins import ActionPlugin, PluginRegistry
+    from robotframework_browser_recorder.converter.playwright_to_robot import (
+        PARSERS,
+        PlaywrightToRobotConverter,
+    )
+
+# Public name -> submodule defining it.
+_EXPORTS = {
+    "Action": "actions",
+    "ActionOptimizer": "optimizer",
+    "ActionPlugin": "plugins",
+    "ActionType": "actions",
+    "AstPlaywrightParser": "ast_parser",
+    "ConversionState": "incremental",
+    "JsonlActionParser": "jsonl",
+    "PARSERS": "playwright_to_robot",
+    "PluginRegistry": "plugins",
+    "PlaywrightToRobotConverter": "playwright_to_robot",
+}
+
+__all__ = [
+    "Action",
+    "ActionOptimizer",
+    "ActionPlugin",
+    "ActionType",
+    "AstPlaywrightParser",
+    "ConversionState",
+    "JsonlActionParser",
+    "PARSERS",
+    "PluginRegistry",
+    "PlaywrightToRobotConverter",
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,141 @@
+"""Typed action records produced by the parsers and consumed by the generator."""
+
+import sys
+from collections.abc import Mapping
+from enum import Enum
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+
+class ActionType(str, Enum):
+    """Kind of a recorded action.
+
+    Members are strings, so ``ActionType.CLICK == "click"`` and they can be used as
+    keys of dictionaries keyed by the plain type name.
+    """
+
+    GOTO = "goto"
+    CLICK = "click"
+    FILL = "fill"
+    TYPE = "type"
+    PRESS = "press"
+    SELECT_OPTION = "select_option"
+    CHECK = "check"
+    UNCHECK = "uncheck"
+    HOVER = "hover"
+    DBLCLICK = "dblclick"
+    SET_INPUT_FILES = "set_input_files"
+    SCREENSHOT = "screenshot"
+    WAIT_FOR_LOAD_STATE = "wait_for_load_state"
+    EXPECT_VISIBLE = "expect_visible"
+    EXPECT_TEXT = "expect_text"
+    EXPECT_VALUE = "expect_value"
+    EXPECT_CHECKED = "expect_checked"
+    EXPECT_URL = "expect_url"
+    EXPECT_TITLE = "expect_title"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Lookup of the shared enum member for a type name.
+ACTION_TYPES: Dict[str, ActionType] = {member.value: member for member in ActionType}
+
+# Name under which ``Action.value`` appears in the dictionary view, per action type.
+VALUE_FIELDS: Dict[str, str] = {
+    ActionType.GOTO: "url",
+    ActionType.FILL: "value",
+    ActionType.TYPE: "text",
+    ActionType.PRESS: "key",
+    ActionType.SELECT_OPTION: "value",
+    ActionType.SET_INPUT_FILES: "file_path",
+    ActionType.SCREENSHOT: "path",
+    ActionType.WAIT_FOR_LOAD_STATE: "state",
+    ActionType.EXPECT_TEXT: "text",
+    ActionType.EXPECT_VALUE: "value",
+    ActionType.EXPECT_URL: "url",
+    ActionType.EXPECT_TITLE: "title",
+}
+
+
+class Action(Mapping):
+    """A single recorded action.
+
+    Every action has a ``type``, an optional target ``selector`` and an optional
+    ``value`` holding its argument (URL, text, key, file path, ...). The record uses
+    ``__slots__`` to keep large recordings small, and is also a read-only mapping with
+    the keys of the original dictionary format, e.g.
+    ``{"type": "press", "selector": "#q", "key": "Enter"}``.
+
+    Parsers also record the 1-based source ``line`` of the statement, when known. It is
+    not part of the dictionary view and not compared.
+    """
+
+    __slots__ = ("type", "selector", "value", "line")
+
+    def __init__(
+        self,
+        type: Union[ActionType, str],
+        selector: Optional[str] = None,
+        value: Optional[str] = None,
+        line: Optional[int] = None,
+    ):
+        """Initialize the action.
+
+        Args:
+            type: Action type; plain names are mapped to :class:`ActionType`
+            selector: Target selector, if the action has one
+            value: Argument of the action, if it has one
+            line: Source line of the statement the action was parsed from
+        """
+        self.type = ACTION_TYPES.get(type) or sys.intern(type)
+        self.selector = selector
+        self.value = value
+        self.line = line
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Action":
+        """Create an action from the dictionary format."""
+        type_ = data["type"]
+        value_field = VALUE_FIELDS.get(type_, "value")
+        return cls(type_, data.get("selector"), data.get(value_field))
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the action in the dictionary format."""
+        return dict(self._items())
+
+    def _items(self) -> Tuple[Tuple[str, str], ...]:
+        """Return the ``(key, value)`` pairs of the dictionary view."""
+        items: Tuple[Tuple[str, str], ...] = (("type", self.type),)
+        if self.selector is not None:
+            items += (("selector", self.selector),)
+        if self.value is not None:
+            items += ((VALUE_FIELDS.get(self.type, "value"), self.value),)
+        return items
+
+    def __getitem__(self, key: str):
+        for name, item in self._items():
+            if name == key:
+                return item
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._items())
+
+    def __len__(self) -> int:
+        return len(self._items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Action):
+            return (self.type, self.selector, self.value) == (
+                other.type,
+                other.selector,
+                other.value,
+            )
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Action({self.to_dict()!r})"
@@ -0,0 +1,388 @@
+"""Parse Playwright Python code with the ``ast`` module instead of line regexes."""
+
+import ast
+from typing import Callable, Dict, List, Optional
+
+from robotframework_browser_recorder.converter.actions import Action
+
+# Selector segment builders for locator methods, keyed by method name. Each receives the
+# literal positional arguments and keyword arguments of the call.
+_LOCATOR_FORMATTERS: Dict[str, Callable[[List, Dict], Optional[str]]] = {}
+
+
+def _locator_formatter(*names):
+    """Register a selector segment builder for the given locator method names."""
+
+    def register(func):
+        for name in names:
+            _LOCATOR_FORMATTERS[name] = func
+        return func
+
+    return register
+
+
+def _with_has_text(selector: str, kwargs: Dict) -> str:
+    """Append a ``has_text=`` filter as a ``:has-text()`` pseudo-class."""
+    has_text = kwargs.get("has_text")
+    if isinstance(has_text, str):
+        return f'{selector}:has-text("{has_text}")'
+    return selector
+
+
+@_locator_formatter("locator")
+def _format_locator(args, kwargs):
+    """``locator("css")`` -> ``css``."""
+    if args and isinstance(args[0], str):
+        return _with_has_text(args[0], kwargs)
+    return None
+
+
+@_locator_formatter("get_by_role")
+def _format_role(args, kwargs):
+    """``get_by_role("button", name="Go")`` -> ``role=button[name='Go']``."""
+    if not args or not isinstance(args[0], str):
+        return None
+    name = kwargs.get("name")
+    if not isinstance(name, str) or not name:
+        return f"role={args[0]}"
+    flag = " s" if kwargs.get("exact") is True else ""
+    return f"role={args[0]}[name='{name}'{flag}]"
+
+
+@_locator_formatter("get_by_text")
+def _format_text(args, kwargs):
+    """``get_by_text("Go")`` -> ``text=Go``, or ``text="Go"`` for an exact match."""
+    if not args or not isinstance(args[0], str):
+        return None
+    if kwargs.get("exact") is True:
+        return f'text="{args[0]}"'
+    return f"text={args[0]}"
+
+
+@_locator_formatter("get_by_label")
+def _format_label(args, kwargs):
+    """``get_by_label("Email")`` -> ``Email``."""
+    return args[0] if args and isinstance(args[0], str) else None
+
+
+@_locator_formatter("get_by_placeholder")
+def _format_placeholder(args, kwargs):
+    """``get_by_placeholder("Search")`` -> ``placeholder=Search``."""
+    return f"placeholder={args[0]}" if args and isinstance(args[0], str) else None
+
+
+@_locator_formatter("get_by_test_id")
+def _format_test_id(args, kwargs):
+    """``get_by_test_id("login")`` -> ``data-testid=login``."""
+    return f"data-testid={args[0]}" if args and isinstance(args[0], str) else None
+
+
+@_locator_formatter("nth")
+def _format_nth(args, kwargs):
+    """``nth(2)`` -> ``nth=2``."""
+    return f"nth={args[0]}" if args and isinstance(args[0], int) else None
+
+
+class AstPlaywrightParser:
+    """Extract converter actions from Playwright code by walking its syntax tree.
+
+    Produces the same actions as
+    :meth:`PlaywrightToRobotConverter._parse_playwright_code`, but also understands
+    statements split over several lines, f-strings, chained ``first``/``last``/``nth``
+    and the ``exact=``/``has_text=`` keyword arguments of locators. Chained locators
+    are joined in source order, and locators inside ``expect()`` are formatted the
+    same way as locators of actions.
+    """
+
+    def __init__(
+        self,
+        fallback: Optional[Callable[[str], List[Action]]] = None,
+        plugins=None,
+        plugin_parser: Optional[Callable[[str, str], Optional[Action]]] = None,
+    ):
+        """Initialize the parser.
+
+        Args:
+            fallback: Parser used for code that is not valid Python, e.g. a snippet
+                or a script that is still being written
+            plugins: Registry of action plugins, see
+                :class:`~robotframework_browser_recorder.converter.plugins.PluginRegistry`
+            plugin_parser: Called with a plugin's method name and the statement joined
+                into one line, for statements calling a method that has a plugin
+        """
+        self.fallback = fallback
+        self.plugins = plugins
+        self.plugin_parser = plugin_parser
+        self.action_handlers = {
+            "goto": self._parse_goto,
+            "click": self._parse_selector_action,
+            "fill": self._parse_value_action,
+            "press": self._parse_press,
+            "select_option": self._parse_value_action,
+            "check": self._parse_selector_action,
+            "uncheck": self._parse_selector_action,
+            "hover": self._parse_selector_action,
+            "dblclick": self._parse_selector_action,
+            "set_input_files": self._parse_value_action,
+            "screenshot": self._parse_screenshot,
+            "wait_for_load_state": self._parse_wait_for_load_state,
+        }
+        self.expect_handlers = {
+            "to_be_visible": ("expect_visible", self._parse_expect_selector),
+            "to_have_text": ("expect_text", self._parse_expect_value),
+            "to_contain_text": ("expect_text", self._parse_expect_value),
+            "to_have_value": ("expect_value", self._parse_expect_value),
+            "to_be_checked": ("expect_checked", self._parse_expect_selector),
+            "to_have_url": ("expect_url", self._parse_expect_page),
+            "to_have_title": ("expect_title", self._parse_expect_page),
+        }
+
+    def parse(self, code: str) -> List[Action]:
+        """Parse Playwright Python code and extract actions.
+
+        Only the body of ``run(playwright)`` is walked when the script defines it,
+        otherwise all module-level statements are.
+
+        Args:
+            code: Playwright Python code
+
+        Returns:
+            List of actions
+        """
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            if self.fallback is None:
+                raise
+            return self.fallback(code)
+
+        body = tree.body
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "run":
+                body = node.body
+                break
+
+        # Source lines are only needed to hand plugin statements over as text.
+        lines = code.splitlines() if self.plugins is not None and self.plugins.names else None
+        actions: List[Action] = []
+        self._walk(body, actions, lines)
+        return actions
+
+    def _walk(
+        self, body: List[ast.stmt], actions: List[Action], lines: Optional[List[str]]
+    ) -> None:
+        """Collect actions from a statement list, descending into ``with`` blocks.
+
+        Args:
+            body: Statements to walk
+            actions: List the actions are appended to
+            lines: Source lines when plugins are registered, otherwise None
+        """
+        for stmt in body:
+            if isinstance(stmt, ast.Expr):
+                action = None
+                if lines:
+                    method = self._plugin_method(stmt.value)
+                    if method is not None:
+                        start, end = stmt.lineno - 1, stmt.end_lineno
+                        statement = " ".join(line.strip() for line in lines[start:end])
+                        action = self.plugin_parser(method, statement)
+                if action is None:
+                    action = self._parse_call(stmt.value)
+                if action:
+                    action.line = stmt.lineno
+                    actions.append(action)
+            elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+                self._walk(stmt.body, actions, lines)
+
+    def _plugin_method(self, node: ast.expr) -> Optional[str]:
+        """Return the innermost method of a call chain that has a plugin, if any.
+
+        This is the first such method in the source text, like the line parser picks.
+        """
+        names = self.plugins.names
+        found = None
+        while True:
+            if isinstance(node, ast.Await):
+                node = node.value
+            elif isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Attribute):
+                    if func.attr in names:
+                        found = func.attr
+                    node = func.value
+                elif isinstance(func, ast.Name) and func.id == "expect" and node.args:
+                    node = node.args[0]
+                else:
+                    return found
+            elif isinstance(node, ast.Attribute):
+                node = node.value
+            else:
+                return found
+
+    def _parse_call(self, node: ast.expr) -> Optional[Action]:
+        """Dispatch an expression statement on its outermost method name."""
+        if isinstance(node, ast.Await):
+            node = node.value
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            return None
+
+        method = node.func.attr
+        receiver = node.func.value
+        if (
+            isinstance(receiver, ast.Call)
+            and isinstance(receiver.func, ast.Name)
+            and receiver.func.id == "expect"
+        ):
+            entry = self.expect_handlers.get(method)
+            if entry is None or not receiver.args:
+                return None
+            action_type, handler = entry
+            segments = self._selector_segments(receiver.args[0])
+            if segments is None:
+                return None
+            return handler(action_type, node, segments)
+
+        handler = self.action_handlers.get(method)
+        if handler is None:
+            return None
+        segments = self._selector_segments(receiver)
+        if segments is None:
+            return None
+        return handler(method, node, segments)
+
+    def _selector_segments(self, node: ast.expr) -> Optional[List[str]]:
+        """Turn a locator chain such as ``page.get_by_role(...).first`` into selector parts.
+
+        Returns:
+            Selector segments from outermost to innermost locator, an empty list for a
+            bare page object, or None if the chain contains something unsupported
+        """
+        segments: List[str] = []
+        while True:
+            if isinstance(node, ast.Name):
+                segments.reverse()
+                return segments
+            if isinstance(node, ast.Attribute):
+                if node.attr == "first":
+                    segments.append("nth=0")
+                elif node.attr == "last":
+                    segments.append("nth=-1")
+                node = node.value
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+                formatter = _LOCATOR_FORMATTERS.get(node.func.attr)
+                if formatter is None:
+                    return None
+                segment = formatter(*self._arguments(node))
+                if segment is None:
+                    return None
+                segments.append(segment)
+                node = node.func.value
+            else:
+                return None
+
+    def _arguments(self, call: ast.Call):
+        """Return the literal positional and keyword arguments of a call."""
+        args = [self._literal(arg) for arg in call.args]
+        kwargs = {kw.arg: self._literal(kw.value) for kw in call.keywords if kw.arg}
+        return args, kwargs
+
+    def _literal(self, node: ast.expr):
+        """Evaluate a literal argument.
+
+        Strings, numbers and booleans are returned as is. Variables and f-string
+        placeholders become Robot Framework ``${name}`` variables. Anything else is None.
+        """
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            return f"${{{node.id}}}"
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            value = self._literal(node.operand)
+            return -value if isinstance(value, (int, float)) else None
+        if isinstance(node, ast.JoinedStr):
+            parts = []
+            for value in node.values:
+                if isinstance(value, ast.FormattedValue):
+                    value = value.value
+                part = self._literal(value)
+                if not isinstance(part, str):
+                    return None
+                parts.append(part)
+            return "".join(parts)
+        return None
+
+    def _string_arg(self, call: ast.Call, index: int = 0, name: Optional[str] = None):
+        """Return a string argument by position or keyword name, or None."""
+        args, kwargs = self._arguments(call)
+        value = kwargs.get(name) if name else None
+        if value is None and len(args) > index:
+            value = args[index]
+        return value if isinstance(value, str) else None
+
+    def _parse_goto(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse ``page.goto(url)``."""
+        url = self._string_arg(call, name="url")
+        return Action(action_type, value=url) if url else None
+
+    def _parse_selector_action(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse an action whose only argument is its target selector."""
+        if segments:
+            selector = " >> ".join(segments)
+        else:
+            selector = self._string_arg(call, name="selector")
+        return Action(action_type, selector) if selector else None
+
+    def _parse_value_action(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse ``fill``, ``select_option`` and ``set_input_files``."""
+        if segments:
+            selector = " >> ".join(segments)
+            value = self._string_arg(call)
+        else:
+            selector = self._string_arg(call, name="selector")
+            value = self._string_arg(call, 1)
+        if not selector or not value:
+            return None
+        return Action(action_type, selector, value)
+
+    def _parse_press(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse ``press`` on a page or a locator."""
+        if segments:
+            selector = " >> ".join(segments)
+            key = self._string_arg(call, name="key")
+        else:
+            selector = self._string_arg(call, name="selector")
+            key = self._string_arg(call, 1, name="key")
+        if not selector or not key:
+            return None
+        return Action(action_type, selector, key)
+
+    def _parse_screenshot(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse ``screenshot(path=...)``."""
+        path = self._arguments(call)[1].get("path")
+        return Action(action_type, value=path) if isinstance(path, str) and path else None
+
+    def _parse_wait_for_load_state(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse ``wait_for_load_state``, defaulting to ``networkidle``."""
+        state = self._string_arg(call, name="state") or "networkidle"
+        return Action(action_type, value=state)
+
+    def _parse_expect_selector(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse an assertion that only needs the asserted locator."""
+        if not segments:
+            return None
+        return Action(action_type, " >> ".join(segments))
+
+    def _parse_expect_value(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse a text or value assertion on a locator."""
+        value = self._string_arg(call)
+        if not segments or not value:
+            return None
+        return Action(action_type, " >> ".join(segments), value)
+
+    def _parse_expect_page(self, action_type: str, call: ast.Call, segments: List[str]):
+        """Parse a page-level URL or title assertion."""
+        value = self._string_arg(call)
+        if segments or not value:
+            return None
+        return Action(action_type, value=value)
@@ -0,0 +1,73 @@
+"""Parse state that lets a conversion resume from an earlier one."""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from robotframework_browser_recorder.converter.actions import Action
+
+
+def line_digest(line: str) -> bytes:
+    """Return a stable fingerprint of one source line."""
+    return hashlib.blake2b(line.encode("utf-8"), digest_size=16).digest()
+
+
+def source_digest(line_digests: List[bytes]) -> str:
+    """Return a fingerprint of a whole source from its line fingerprints."""
+    return hashlib.blake2b(b"".join(line_digests), digest_size=16).hexdigest()
+
+
+@dataclass
+class ConversionState:
+    """Result of a conversion, kept so that a later conversion can reuse it.
+
+    ``action_counts[i]`` and ``emitted_counts[i]`` hold the number of actions and Robot
+    body lines produced by source lines ``0..i``, which is what allows the output of an
+    unchanged prefix to be reused as is.
+    """
+
+    options: Dict = field(default_factory=dict)
+    fingerprint: str = ""
+    line_digests: List[bytes] = field(default_factory=list)
+    action_counts: List[int] = field(default_factory=list)
+    emitted_counts: List[int] = field(default_factory=list)
+    actions: List[Action] = field(default_factory=list)
+    header: List[str] = field(default_factory=list)
+    lines: List[str] = field(default_factory=list)
+    reparsed_lines: int = 0
+
+    def common_prefix(self, line_digests: List[bytes]) -> int:
+        """Return the number of leading source lines shared with ``line_digests``."""
+        old = self.line_digests
+        limit = min(len(old), len(line_digests))
+        prefix = 0
+        while prefix < limit and old[prefix] == line_digests[prefix]:
+            prefix += 1
+        return prefix
+
+    def to_dict(self) -> Dict:
+        """Return a JSON-serializable representation of the state."""
+        return {
+            "options": self.options,
+            "fingerprint": self.fingerprint,
+            "line_digests": [digest.hex() for digest in self.line_digests],
+            "action_counts": self.action_counts,
+            "emitted_counts": self.emitted_counts,
+            "actions": [action.to_dict() for action in self.actions],
+            "header": self.header,
+            "lines": self.lines,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ConversionState":
+        """Create a state from the output of :meth:`to_dict`."""
+        return cls(
+            options=data["options"],
+            fingerprint=data["fingerprint"],
+            line_digests=[bytes.fromhex(digest) for digest in data["line_digests"]],
+            action_counts=list(data["action_counts"]),
+            emitted_counts=list(data["emitted_counts"]),
+            actions=[Action.from_dict(action) for action in data["actions"]],
+            header=list(data["header"]),
+            lines=list(data["lines"]),
+        )
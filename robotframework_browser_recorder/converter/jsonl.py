@@ -0,0 +1,213 @@
+"""Parse the JSON lines action stream of ``playwright codegen --target jsonl``."""
+
+import json
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from robotframework_browser_recorder.converter.actions import Action, ActionType
+
+# Key combinations are written as ``Control+a``; codegen stores the modifier keys as a
+# bit mask.
+_MODIFIERS = ((1, "Alt"), (2, "Control"), (4, "Meta"), (8, "Shift"))
+
+# Selector segment builders for the ``kind`` of a JSONL locator object. Each receives
+# the locator's ``body`` and ``options``.
+_LOCATOR_KINDS: Dict[str, Callable[[str, Dict], str]] = {
+    "default": lambda body, options: body,
+    "role": lambda body, options: _format_role(body, options),
+    "text": lambda body, options: f'text="{body}"' if options.get("exact") else f"text={body}",
+    "label": lambda body, options: body,
+    "placeholder": lambda body, options: f"placeholder={body}",
+    "test-id": lambda body, options: f"data-testid={body}",
+    "alt": lambda body, options: f'[alt="{body}"]',
+    "title": lambda body, options: f'[title="{body}"]',
+    "nth": lambda body, options: f"nth={body}",
+    "first": lambda body, options: "nth=0",
+    "last": lambda body, options: "nth=-1",
+}
+
+
+def _format_role(role: str, options: Dict) -> str:
+    """Format a role locator like ``get_by_role`` is converted."""
+    name = options.get("name")
+    if not isinstance(name, str):
+        attrs = {attr.get("name"): attr.get("value") for attr in options.get("attrs") or ()}
+        name = attrs.get("name")
+    if not isinstance(name, str) or not name:
+        return f"role={role}"
+    flag = " s" if options.get("exact") else ""
+    return f"role={role}[name='{name}'{flag}]"
+
+
+def format_locator(locator: Dict) -> Optional[str]:
+    """Turn a JSONL locator object into a selector in the converter's format.
+
+    Locators are chained through ``next`` and joined with `` >> ``, like chained
+    locators in Python code; ``has-text`` filters become a ``:has-text()`` pseudo-class.
+
+    Returns:
+        The selector, or None if the locator uses a kind without an equivalent, such as
+        frames or ``and``/``or`` combinations
+    """
+    segments: List[str] = []
+    while locator:
+        kind = locator.get("kind")
+        body = locator.get("body")
+        options = locator.get("options") or {}
+        if kind == "has-text" and segments and isinstance(body, str):
+            segments[-1] += f':has-text("{body}")'
+        else:
+            formatter = _LOCATOR_KINDS.get(kind)
+            # Regular expression bodies are serialized as objects and have no equivalent.
+            if formatter is None or not isinstance(body, (str, int, type(None))):
+                return None
+            segments.append(formatter("" if body is None else str(body), options))
+        locator = locator.get("next")
+    return " >> ".join(segments) if segments else None
+
+
+class JsonlActionParser:
+    """Map the actions of Playwright's JSONL codegen target to converter actions.
+
+    Every line is one ``json.loads`` call: the recorded action is read from its fields
+    instead of being recovered from Python source. Each action carries the raw
+    Playwright ``selector`` and a structured ``locator``; the locator is preferred and
+    the raw selector is used when it has no equivalent. The header line with the
+    browser options and actions without a Robot Framework counterpart are skipped.
+    """
+
+    def __init__(self):
+        """Initialize the parser."""
+        self.action_handlers = {
+            "openPage": self._parse_navigate,
+            "navigate": self._parse_navigate,
+            "click": self._parse_click,
+            "fill": self._parse_value("text"),
+            "press": self._parse_press,
+            "check": self._parse_selector_action,
+            "uncheck": self._parse_selector_action,
+            "hover": self._parse_selector_action,
+            "select": self._parse_first_value("options"),
+            "setInputFiles": self._parse_first_value("files"),
+            "assertVisible": self._parse_selector_action,
+            "assertText": self._parse_value("text"),
+            "assertValue": self._parse_value("value"),
+            "assertChecked": self._parse_assert_checked,
+        }
+        # Action names of the stream that differ from the converter's action types.
+        self.action_types = {
+            "openPage": ActionType.GOTO,
+            "navigate": ActionType.GOTO,
+            "select": ActionType.SELECT_OPTION,
+            "setInputFiles": ActionType.SET_INPUT_FILES,
+            "assertVisible": ActionType.EXPECT_VISIBLE,
+            "assertText": ActionType.EXPECT_TEXT,
+            "assertValue": ActionType.EXPECT_VALUE,
+            "assertChecked": ActionType.EXPECT_CHECKED,
+        }
+
+    def parse(self, text: str) -> List[Action]:
+        """Parse a complete JSONL recording."""
+        return list(self.iter_actions(text.split("\n")))
+
+    def iter_actions(self, lines: Iterable[str]) -> Iterator[Action]:
+        """Parse JSONL lines one by one and yield their actions."""
+        parse_line = self.parse_line
+        for line in lines:
+            action = parse_line(line)
+            if action is not None:
+                yield action
+
+    def parse_line(self, line: str) -> Optional[Action]:
+        """Parse one JSONL line, returning its action if it has one.
+
+        Lines that are empty, not valid JSON (e.g. a line still being written) or not
+        an action are ignored.
+        """
+        line = line.strip()
+        if not line.startswith("{"):
+            return None
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(entry, dict):
+            return None
+        name = entry.get("name")
+        handler = self.action_handlers.get(name)
+        if handler is None:
+            return None
+        return handler(self.action_types.get(name, name), entry)
+
+    def _selector(self, entry: Dict) -> Optional[str]:
+        """Return the target selector of an action."""
+        locator = entry.get("locator")
+        if isinstance(locator, dict):
+            selector = format_locator(locator)
+            if selector:
+                return selector
+        selector = entry.get("selector")
+        return selector if isinstance(selector, str) and selector else None
+
+    def _parse_navigate(self, action_type: str, entry: Dict) -> Optional[Action]:
+        """Parse ``openPage`` and ``navigate``; the blank page of a new tab is skipped."""
+        url = entry.get("url")
+        if not isinstance(url, str) or not url or url == "about:blank":
+            return None
+        return Action(action_type, value=url)
+
+    def _parse_selector_action(self, action_type: str, entry: Dict) -> Optional[Action]:
+        """Parse an action whose only argument is its target selector."""
+        selector = self._selector(entry)
+        return Action(action_type, selector) if selector else None
+
+    def _parse_click(self, action_type: str, entry: Dict) -> Optional[Action]:
+        """Parse ``click``, which is a double click for a ``clickCount`` of 2."""
+        if entry.get("clickCount") == 2:
+            action_type = ActionType.DBLCLICK
+        return self._parse_selector_action(action_type, entry)
+
+    def _parse_value(self, field: str):
+        """Return a handler for actions with a selector and the string value ``field``."""
+
+        def parse(action_type: str, entry: Dict) -> Optional[Action]:
+            selector = self._selector(entry)
+            value = entry.get(field)
+            if not selector or not isinstance(value, str):
+                return None
+            return Action(action_type, selector, value)
+
+        return parse
+
+    def _parse_first_value(self, field: str):
+        """Return a handler for actions with a list ``field``; its first item is used."""
+
+        def parse(action_type: str, entry: Dict) -> Optional[Action]:
+            selector = self._selector(entry)
+            values = entry.get(field)
+            if not selector or not isinstance(values, list) or not values:
+                return None
+            return Action(action_type, selector, str(values[0]))
+
+        return parse
+
+    def _parse_press(self, action_type: str, entry: Dict) -> Optional[Action]:
+        """Parse ``press``, prefixing the key with its modifiers, e.g. ``Control+a``.
+
+        A press whose ``modifiers`` is not a number is ignored like any invalid line.
+        """
+        selector = self._selector(entry)
+        key = entry.get("key")
+        if not selector or not isinstance(key, str) or not key:
+            return None
+        try:
+            modifiers = int(entry.get("modifiers") or 0)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        keys = [name for bit, name in _MODIFIERS if modifiers & bit] + [key]
+        return Action(action_type, selector, "+".join(keys))
+
+    def _parse_assert_checked(self, action_type: str, entry: Dict) -> Optional[Action]:
+        """Parse ``assertChecked``; only asserting a checked state has an equivalent."""
+        if entry.get("checked") is False:
+            return None
+        return self._parse_selector_action(action_type, entry)
@@ -0,0 +1,160 @@
+"""Optional rewrite pass that removes redundant steps from a recorded action stream."""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from robotframework_browser_recorder.converter.actions import Action, ActionType
+
+# A rule looks at two adjacent actions and returns the single action that replaces
+# both of them, or None if it does not apply.
+Rule = Callable[[Action, Action], Optional[Action]]
+
+# Registered rules by name, in the order they are tried.
+RULES: Dict[str, Rule] = {}
+
+
+def _rule(name: str):
+    """Register a rewrite rule under ``name``."""
+
+    def register(func: Rule) -> Rule:
+        RULES[name] = func
+        return func
+
+    return register
+
+
+def _is_character(key: Optional[str]) -> bool:
+    """Return whether a ``press`` key types a single printable, non-space character.
+
+    Spaces are left as presses: merged into a value they could end it, and Robot
+    Framework strips trailing spaces from cells and reads two of them as a separator.
+    """
+    return key is not None and len(key) == 1 and key.isprintable() and not key.isspace()
+
+
+@_rule("click_before_fill")
+def _click_before_fill(previous: Action, current: Action) -> Optional[Action]:
+    """``click(x)`` then ``fill(x, v)`` -> ``fill(x, v)``; filling focuses the field."""
+    if (
+        previous.type == ActionType.CLICK
+        and current.type == ActionType.FILL
+        and previous.selector == current.selector
+    ):
+        return current
+    return None
+
+
+@_rule("repeated_fill")
+def _repeated_fill(previous: Action, current: Action) -> Optional[Action]:
+    """``fill(x, a)`` then ``fill(x, b)`` -> ``fill(x, b)``."""
+    if (
+        previous.type == ActionType.FILL
+        and current.type == ActionType.FILL
+        and previous.selector == current.selector
+    ):
+        return current
+    return None
+
+
+@_rule("duplicate_goto")
+def _duplicate_goto(previous: Action, current: Action) -> Optional[Action]:
+    """``goto(u)`` then ``goto(u)`` -> ``goto(u)``."""
+    if (
+        previous.type == ActionType.GOTO
+        and current.type == ActionType.GOTO
+        and previous.value == current.value
+    ):
+        return previous
+    return None
+
+
+@_rule("merge_presses")
+def _merge_presses(previous: Action, current: Action) -> Optional[Action]:
+    """Join character key presses on one field into a single typed or filled value.
+
+    ``press(x, "a")`` then ``press(x, "b")`` -> ``type(x, "ab")``, and a character
+    pressed right after ``fill(x, v)`` is appended to the filled value.
+    """
+    if (
+        current.type != ActionType.PRESS
+        or previous.selector != current.selector
+        or not _is_character(current.value)
+    ):
+        return None
+    if previous.type in (ActionType.FILL, ActionType.TYPE):
+        value = (previous.value or "") + current.value
+        return Action(previous.type, previous.selector, value, previous.line)
+    if previous.type == ActionType.PRESS and _is_character(previous.value):
+        value = previous.value + current.value
+        return Action(ActionType.TYPE, previous.selector, value, previous.line)
+    return None
+
+
+class ActionOptimizer:
+    """Remove redundant steps from parsed actions before Robot Framework generation.
+
+    Rules from :data:`RULES` are applied to every pair of adjacent actions in a single
+    streaming pass; when a rule merges a pair, the result is compared with the next
+    action again, so runs like repeated fills collapse completely. ``report`` counts
+    the steps removed per rule over all optimized streams.
+    """
+
+    def __init__(self, rules: Optional[Iterable[str]] = None):
+        """Initialize the optimizer.
+
+        Args:
+            rules: Names of the rules to enable, in :data:`RULES` order; all if None
+
+        Raises:
+            ValueError: If a rule name is unknown
+        """
+        names = list(RULES) if rules is None else list(rules)
+        unknown = [name for name in names if name not in RULES]
+        if unknown:
+            raise ValueError(
+                f"Unknown optimizer rule(s) {', '.join(unknown)}, "
+                f"expected any of: {', '.join(RULES)}"
+            )
+        self.rules: List[str] = [name for name in RULES if name in names]
+        self.report: Dict[str, int] = {name: 0 for name in self.rules}
+
+    @property
+    def removed(self) -> int:
+        """Total number of removed steps."""
+        return sum(self.report.values())
+
+    def reset(self) -> None:
+        """Reset the per-rule counts."""
+        self.report = {name: 0 for name in self.rules}
+
+    def optimize(self, actions: Iterable[Action]) -> List[Action]:
+        """Return the optimized list of ``actions``."""
+        return list(self.iter_optimize(actions))
+
+    def iter_optimize(self, actions: Iterable[Action]) -> Iterator[Action]:
+        """Optimize ``actions`` lazily, holding back at most one action."""
+        rules = [(name, RULES[name]) for name in self.rules]
+        report = self.report
+        pending: Optional[Action] = None
+        for action in actions:
+            if not isinstance(action, Action):
+                action = Action.from_dict(action)
+            if pending is not None:
+                for name, rule in rules:
+                    merged = rule(pending, action)
+                    if merged is not None:
+                        report[name] += 1
+                        pending = merged
+                        break
+                else:
+                    yield pending
+                    pending = action
+            else:
+                pending = action
+        if pending is not None:
+            yield pending
+
+    def format(self) -> str:
+        """Return a human-readable report of the removed steps per rule."""
+        lines = [f"Optimizer removed {self.removed} steps:"]
+        lines.extend(f"  {name}: {count}" for name, count in self.report.items())
+        return "\n".join(lines)
@@ -1,19 +1,203 @@
 """Convert Playwright Python code to Robot Framework Browser library syntax."""
 
+import functools
 import re
-from typing import List, Dict, Tuple, Optional
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.converter.ast_parser import AstPlaywrightParser
+from robotframework_browser_recorder.converter.incremental import (
+    ConversionState,
+    line_digest,
+    source_digest,
+)
+from robotframework_browser_recorder.converter.jsonl import JsonlActionParser
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.plugins import PluginRegistry, default_registry
+from robotframework_browser_recorder.profiling import Profiler
+
+# Available parser backends: line-by-line regexes or a walk over the Python syntax tree
+# for Python scripts, and the JSON lines action stream of codegen's ``jsonl`` target.
+PARSERS = ("regex", "ast", "jsonl")
+
+# Backends that parse their input line by line, so it can be converted as a stream.
+LINE_PARSERS = ("regex", "jsonl")
+
+# A quoted string literal with backslash escapes, capturing the unquoted body.
+_QUOTED = r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']'
+
+# Substrings that identify the action of a statement, in precedence order. When a
+# line contains several of them the earliest entry wins, so e.g. a ``.click(`` inside
+# an ``expect(...)`` line is still treated as a click.
+_ACTION_TOKENS = (
+    ("goto", "page.goto("),
+    ("click", ".click("),
+    ("fill", ".fill("),
+    ("press", ".press("),
+    ("select_option", ".select_option("),
+    ("check", ".check("),
+    ("uncheck", ".uncheck("),
+    ("hover", ".hover("),
+    ("dblclick", ".dblclick("),
+    ("set_input_files", ".set_input_files("),
+    ("set_input_files", ".setInputFiles("),
+    ("screenshot", "screenshot("),
+    ("wait_for_load_state", "wait_for_load_state("),
+    ("expect", "expect("),
+)
+
+# Assertion matchers recognised inside ``expect(...)`` statements, in precedence order.
+_EXPECT_TOKENS = (
+    ("expect_visible", ".to_be_visible()"),
+    ("expect_text", ".to_have_text("),
+    ("expect_text", ".to_contain_text("),
+    ("expect_value", ".to_have_value("),
+    ("expect_checked", ".to_be_checked()"),
+    ("expect_url", ".to_have_url("),
+    ("expect_title", ".to_have_title("),
+)
+
+
+def _compile_tokens(tokens):
+    """Compile ``(name, token)`` pairs into one scanning regex and a precedence table."""
+    pattern = re.compile("|".join(re.escape(token) for _, token in tokens))
+    priority = {}
+    for index, (name, token) in enumerate(tokens):
+        priority[token] = (index, name)
+    return pattern, priority
+
+
+_ACTION_RE, _ACTION_PRIORITY = _compile_tokens(_ACTION_TOKENS)
+_EXPECT_RE, _EXPECT_PRIORITY = _compile_tokens(_EXPECT_TOKENS)
+_EXPECT_MATCHERS = frozenset(name for name, _ in _EXPECT_TOKENS)
+
+# Method calls in a statement, matched against the names of action plugins.
+_CALL_RE = re.compile(r"\.(\w+)\(")
+
+_STRING_ARG_RE = re.compile(r'["\']([^"\']+)["\']')
+_NAMED_STRING_ARG_RES: Dict[str, "re.Pattern[str]"] = {}
+
+# Locator methods, their regex and how a match is rendered as a Robot selector. The
+# literal is checked with ``in`` before running the regex, which skips most patterns.
+_LOCATOR_PATTERNS = (
+    ("locator(", re.compile(rf"locator\({_QUOTED}\)"), lambda s: s),
+    (
+        "get_by_role(",
+        re.compile(rf"get_by_role\({_QUOTED}(?:,\s*name={_QUOTED})?\)"),
+        lambda s, n=None: f"role={s}[name='{n}']" if n else f"role={s}",
+    ),
+    ("get_by_text(", re.compile(rf"get_by_text\({_QUOTED}\)"), lambda s: f"text={s}"),
+    ("get_by_label(", re.compile(rf"get_by_label\({_QUOTED}\)"), lambda s: s),
+    (
+        "get_by_placeholder(",
+        re.compile(rf"get_by_placeholder\({_QUOTED}\)"),
+        lambda s: f"placeholder={s}",
+    ),
+    (
+        "get_by_test_id(",
+        re.compile(rf"get_by_test_id\({_QUOTED}\)"),
+        lambda s: f"data-testid={s}",
+    ),
+)
+
+_SELECTOR_FALLBACK_RE = re.compile(rf"{_QUOTED}\)")
+_TWO_ARGS_RE = re.compile(rf"{_QUOTED}\s*,\s*{_QUOTED}\)")
+_FILL_VALUE_RE = re.compile(rf"\.fill\({_QUOTED}\)")
+_SELECT_VALUE_RE = re.compile(rf"\.select_option\({_QUOTED}\)")
+_SET_INPUT_FILES_RE = re.compile(rf"\.set_input_files\({_QUOTED}\)")
+_SET_INPUT_FILES_CAMEL_RE = re.compile(rf"\.setInputFiles\({_QUOTED}\)")
+_EXPECT_SELECTOR_RES = (
+    re.compile(rf"expect\(page\.locator\({_QUOTED}"),
+    re.compile(rf"expect\(page\.get_by_[a-z_]+\({_QUOTED}"),
+)
+_EXPECT_VALUE_RE = re.compile(rf"{_QUOTED}\s*\)")
+_ATTRIBUTE_SELECTOR_RE = re.compile(r'^\[([a-zA-Z-]+)=["\']([^"\']+)["\']\]$')
+_QUOTED_ATTRIBUTE_RE = re.compile(r'\[([a-zA-Z-]+)=["\']([^"\']+)["\']\]')
+
+
+def _unescape(value: str) -> str:
+    """Undo the quote escaping of a Python string literal body."""
+    return value.replace(r"\"", '"').replace(r"\'", "'")
+
+
+def _locator_expression(line: str, call: str) -> str:
+    """Return the part of ``line`` before its last ``call``, e.g. ``".fill("``.
+
+    This is the locator expression an action or assertion targets. Selectors are cached
+    by it, so statements that only differ in the filled value or the asserted text
+    share one cache entry.
+    """
+    end = line.rfind(call)
+    return line[:end] if end != -1 else line
+
+
+def _match_token(pattern, priority, line: str) -> Optional[str]:
+    """Return the name of the highest-precedence token found in ``line``."""
+    best = None
+    for match in pattern.finditer(line):
+        candidate = priority[match.group(0)]
+        if best is None or candidate < best:
+            best = candidate
+    return best[1] if best else None
+
+
+# Pure selector helpers that are memoized per converter instance. They are called with
+# the locator expression of a statement (see ``_locator_expression``) or, for actions
+# without a value, with the whole statement.
+_CACHED_METHODS = ("_extract_selector", "_extract_expect_selector", "_simplify_selector")
 
 
 class PlaywrightToRobotConverter:
     """Converts Playwright Python code to Robot Framework test cases."""
 
-    def __init__(self):
-        """Initialize the converter with keyword mappings."""
+    def __init__(
+        self,
+        parser: str = "regex",
+        selector_cache_size: Optional[int] = 4096,
+        profiler: Optional[Profiler] = None,
+        optimizer: Optional[ActionOptimizer] = None,
+        plugins: Optional[PluginRegistry] = None,
+    ):
+        """Initialize the converter with keyword mappings.
+
+        Args:
+            parser: Parser backend, ``"regex"`` (line based) or ``"ast"`` (syntax tree)
+                for Python code, ``"jsonl"`` for codegen's JSON lines target
+            selector_cache_size: Entries kept in each selector cache, None for
+                unbounded, 0 to disable caching
+            profiler: Profiler that times the parse, extract, simplify, generate and
+                write stages; without one the converter runs unmodified
+            optimizer: Optimizer that removes redundant steps between parsing and
+                generation; without one every parsed action is converted
+            plugins: Registry of action plugins; the installed entry points if None
+        """
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser {parser!r}, expected one of: {', '.join(PARSERS)}")
+        self.parser = parser
         self.indent = "    "
+        self.selector_cache_size = selector_cache_size
+        self.profiler = profiler
+        self.optimizer = optimizer
+        self.plugins = plugins if plugins is not None else default_registry()
+        # Handlers of the plugins loaded so far, bound to this converter. They are kept
+        # apart from the built-in tables, which describe the converter for caching.
+        self._plugin_parsers: Dict[str, Callable[[str, str], Optional[Action]]] = {}
+        self._plugin_converters: Dict[str, Callable[[Action], Optional[str]]] = {}
+        if profiler is not None:
+            # Wrapped below the cache, so only selectors that miss the cache are counted.
+            self._simplify_selector = profiler.wrap(self._simplify_selector, "simplify")
+        if selector_cache_size != 0:
+            # Recordings repeat the same locators many times; the caches live as long as
+            # the converter, so they are shared by all convert() calls on it.
+            for name in _CACHED_METHODS:
+                method = functools.lru_cache(maxsize=selector_cache_size)(getattr(self, name))
+                setattr(self, name, method)
         self.action_mappings = {
             "goto": self._convert_goto,
             "click": self._convert_click,
             "fill": self._convert_fill,
+            "type": self._convert_type,
             "press": self._convert_press,
             "select_option": self._convert_select_option,
             "check": self._convert_check,
@@ -36,6 +220,71 @@ class PlaywrightToRobotConverter:
             "expect_url": self._convert_expect_url,
             "expect_title": self._convert_expect_title,
         }
+        self.parse_handlers = {
+            "goto": self._parse_goto,
+            "click": self._parse_selector_action,
+            "fill": self._parse_fill,
+            "press": self._parse_press,
+            "select_option": self._parse_select_option,
+            "check": self._parse_selector_action,
+            "uncheck": self._parse_selector_action,
+            "hover": self._parse_selector_action,
+            "dblclick": self._parse_selector_action,
+            "set_input_files": self._parse_set_input_files,
+            "screenshot": self._parse_screenshot,
+            "wait_for_load_state": self._parse_wait_for_load_state,
+            "expect": self._parse_expect,
+            "expect_visible": self._parse_expect_selector,
+            "expect_text": self._parse_expect_text,
+            "expect_value": self._parse_expect_value,
+            "expect_checked": self._parse_expect_selector,
+            "expect_url": self._parse_expect_page,
+            "expect_title": self._parse_expect_page,
+        }
+        self.ast_parser = AstPlaywrightParser(
+            # Unprofiled, since the fallback runs inside the AST parser's parse stage.
+            fallback=self._parse_lines,
+            plugins=self.plugins,
+            plugin_parser=self._parse_plugin,
+        )
+        self.jsonl_parser = JsonlActionParser()
+        if parser == "jsonl":
+            # Every line is a complete action, so the line parser reads JSON instead.
+            self._parse_line = self.jsonl_parser.parse_line
+        if profiler is not None:
+            self._install_profiler(profiler)
+
+    def _install_profiler(self, profiler: Profiler) -> None:
+        """Wrap the parse, per-action-type extract and generate stages with timers.
+
+        The line parsers record their parse stage in :meth:`_iter_actions`, once per
+        pass over a script; the AST backend once per parsed module. Assertion matchers
+        are left unwrapped: they only run inside the timed ``expect`` dispatch, and
+        timing both would count every assertion twice.
+        """
+        self.ast_parser.parse = profiler.wrap(self.ast_parser.parse, "parse")
+        self.parse_handlers = {
+            method: (
+                handler if method in _EXPECT_MATCHERS else profiler.wrap(handler, "extract", method)
+            )
+            for method, handler in self.parse_handlers.items()
+        }
+        self.action_mappings = {
+            action_type: profiler.wrap(handler, "generate", action_type)
+            for action_type, handler in self.action_mappings.items()
+        }
+
+    def cache_info(self) -> Dict[str, "functools._CacheInfo"]:
+        """Return hit/miss statistics of the selector caches, keyed by method name."""
+        if self.selector_cache_size == 0:
+            return {}
+        return {name: getattr(self, name).cache_info() for name in _CACHED_METHODS}
+
+    def cache_clear(self) -> None:
+        """Empty the selector caches and reset their statistics."""
+        if self.selector_cache_size != 0:
+            for name in _CACHED_METHODS:
+                getattr(self, name).cache_clear()
 
     def convert(
         self,
@@ -57,7 +306,7 @@ class PlaywrightToRobotConverter:
         Returns:
             Robot Framework test case as a string
         """
-        actions = self._parse_playwright_code(playwright_code)
+        actions = self._optimize(self._parse(playwright_code))
         robot_test = self._generate_robot_test(
             actions=actions,
             test_name=test_name,
@@ -67,130 +316,439 @@ class PlaywrightToRobotConverter:
         )
         return robot_test
 
-    def _parse_playwright_code(self, code: str) -> List[Dict]:
+    def convert_actions(
+        self,
+        actions: Iterable[Union[Action, Dict]],
+        test_name: str = "Recorded Test",
+        suite_name: str = "Recorded Test Suite",
+        browser: str = "chromium",
+        headless: bool = False,
+    ) -> str:
+        """Convert already recorded actions to a Robot Framework test.
+
+        This skips parsing altogether, for recorders that capture actions as structured
+        events instead of Python source. Actions in the dictionary format are accepted.
+
+        Args:
+            actions: Recorded actions
+            test_name: Name for the test case
+            suite_name: Name for the test suite
+            browser: Browser type (chromium, firefox, webkit)
+            headless: Whether to run in headless mode
+
+        Returns:
+            Robot Framework test case as a string
+        """
+        return self._generate_robot_test(
+            actions=self._optimize(actions),
+            test_name=test_name,
+            suite_name=suite_name,
+            browser=browser,
+            headless=headless,
+        )
+
+    def iter_robot_lines(
+        self,
+        lines: Iterable[str],
+        test_name: str = "Recorded Test",
+        suite_name: str = "Recorded Test Suite",
+        browser: str = "chromium",
+        headless: bool = False,
+    ) -> Iterator[str]:
+        """Convert Playwright code line by line, yielding Robot Framework lines.
+
+        Only one source line is held at a time, so memory use does not grow with the
+        size of the script. Statements are parsed with the line parser regardless of
+        the selected backend, since the AST parser needs the whole module.
+
+        Args:
+            lines: Lines of Python code generated by Playwright codegen
+            test_name: Name for the test case
+            suite_name: Name for the test suite
+            browser: Browser type (chromium, firefox, webkit)
+            headless: Whether to run in headless mode
+
+        Yields:
+            Lines of the Robot Framework test, without line endings
+        """
+        return self._iter_robot_test(
+            self._optimize(self._iter_actions(lines)), test_name, suite_name, browser, headless
+        )
+
+    def convert_stream(
+        self,
+        src: TextIO,
+        dst: TextIO,
+        test_name: str = "Recorded Test",
+        suite_name: str = "Recorded Test Suite",
+        browser: str = "chromium",
+        headless: bool = False,
+    ) -> int:
+        """Convert Playwright code read from ``src`` and write the test to ``dst``.
+
+        The output is identical to :meth:`convert`. With a line parser neither the
+        source nor the result is ever held in memory as a whole; the AST backend needs
+        the whole module, so its source is read at once. Each line of the test is
+        written with one ``dst.write`` call, which is the profiled ``write`` stage.
+
+        Args:
+            src: Readable text file object with the Playwright code
+            dst: Writable text file object for the Robot Framework test
+            test_name: Name for the test case
+            suite_name: Name for the test suite
+            browser: Browser type (chromium, firefox, webkit)
+            headless: Whether to run in headless mode
+
+        Returns:
+            Number of lines written
+        """
+        actions = self._optimize(self._read_actions(src))
+        lines = self._iter_robot_test(actions, test_name, suite_name, browser, headless)
+        return self._write_lines(lines, dst)
+
+    def _read_actions(self, lines: Iterable[str]) -> Iterable[Action]:
+        """Parse source lines with the selected backend, lazily for the line parsers."""
+        if self.parser in LINE_PARSERS:
+            return self._iter_actions(lines)
+        return self._parse("".join(lines))
+
+    def _write_lines(self, lines: Iterable[str], dst: TextIO) -> int:
+        """Write ``lines`` to ``dst`` with one (profiled) write each; return their number."""
+        write = dst.write
+        if self.profiler is not None:
+            write = self.profiler.wrap(write, "write")
+        written = 0
+        for line in lines:
+            write(f"{line}\n")
+            written += 1
+        return written
+
+    def convert_incremental(
+        self,
+        playwright_code: str,
+        previous: Optional[ConversionState] = None,
+        test_name: str = "Recorded Test",
+        suite_name: str = "Recorded Test Suite",
+        browser: str = "chromium",
+        headless: bool = False,
+    ) -> Tuple[str, ConversionState]:
+        """Convert Playwright code, reusing the work of an earlier conversion.
+
+        Source lines up to the first line that differs from ``previous`` keep their
+        parsed actions and Robot lines; only the remaining lines are parsed again. An
+        appended recording therefore costs time proportional to the new steps, while a
+        rewritten history simply shares a shorter (possibly empty) prefix. The output is
+        always identical to :meth:`convert`.
+
+        The AST backend parses whole modules and optimizer rules may merge steps across
+        lines, so with ``parser="ast"`` or an optimizer the code is fully reparsed unless
+        it is unchanged.
+
+        Args:
+            playwright_code: Python code generated by Playwright codegen
+            previous: State returned by an earlier call, or None for a full conversion
+            test_name: Name for the test case
+            suite_name: Name for the test suite
+            browser: Browser type (chromium, firefox, webkit)
+            headless: Whether to run in headless mode
+
+        Returns:
+            Tuple of the Robot Framework test and the state to pass to the next call
+        """
+        options = {
+            "test_name": test_name,
+            "suite_name": suite_name,
+            "browser": browser,
+            "headless": headless,
+            "parser": self.parser,
+        }
+        source_lines = playwright_code.split("\n")
+        line_digests = [line_digest(line) for line in source_lines]
+        fingerprint = source_digest(line_digests)
+
+        if previous is not None and previous.options != options:
+            previous = None
+        if previous is not None and previous.fingerprint == fingerprint:
+            state = ConversionState(
+                options=options,
+                fingerprint=fingerprint,
+                line_digests=previous.line_digests,
+                action_counts=previous.action_counts,
+                emitted_counts=previous.emitted_counts,
+                actions=previous.actions,
+                header=previous.header,
+                lines=previous.lines,
+            )
+            return "\n".join(state.header + state.lines + [""]), state
+
+        header = self._generate_header(test_name, suite_name, browser, headless)
+        if self.parser == "ast" or self.optimizer is not None:
+            actions = self._optimize(self._parse(playwright_code))
+            lines = list(self._iter_robot_test(actions, test_name, suite_name, browser, headless))
+            body_start = len(header)
+            state = ConversionState(
+                options=options,
+                fingerprint=fingerprint,
+                actions=actions,
+                header=header,
+                lines=lines[body_start:],
+                reparsed_lines=len(source_lines),
+            )
+            return "\n".join(lines + [""]), state
+
+        prefix = previous.common_prefix(line_digests) if previous is not None else 0
+        if prefix:
+            action_counts = previous.action_counts[:prefix]
+            emitted_counts = previous.emitted_counts[:prefix]
+            actions = previous.actions[: action_counts[-1]]
+            lines = previous.lines[: emitted_counts[-1]]
+        else:
+            action_counts, emitted_counts, actions, lines = [], [], [], []
+
+        parse_line = self._parse_line
+        convert_action = self._convert_action
+        for line in source_lines[prefix:]:
+            action = parse_line(line)
+            if action is not None:
+                actions.append(action)
+                robot_line = convert_action(action)
+                if robot_line:
+                    lines.append(f"{self.indent}{robot_line}")
+            action_counts.append(len(actions))
+            emitted_counts.append(len(lines))
+
+        state = ConversionState(
+            options=options,
+            fingerprint=fingerprint,
+            line_digests=line_digests,
+            action_counts=action_counts,
+            emitted_counts=emitted_counts,
+            actions=actions,
+            header=header,
+            lines=lines,
+            reparsed_lines=len(source_lines) - prefix,
+        )
+        return "\n".join(header + lines + [""]), state
+
+    def _optimize(self, actions: Iterable[Action]) -> Iterable[Action]:
+        """Apply the optimizer to ``actions``, preserving lists and lazy iterables."""
+        if self.optimizer is None:
+            return actions
+        if isinstance(actions, list):
+            return self.optimizer.optimize(actions)
+        return self.optimizer.iter_optimize(actions)
+
+    def _parse(self, code: str) -> List[Action]:
+        """Parse Playwright code with the selected parser backend."""
+        if self.parser == "ast":
+            return self.ast_parser.parse(code)
+        return self._parse_playwright_code(code)
+
+    def _parse_playwright_code(self, code: str) -> List[Action]:
         """Parse Playwright Python code and extract actions.
 
+        Each line is scanned once for its action method, which is then dispatched
+        through ``parse_handlers``.
+
         Args:
             code: Playwright Python code
 
         Returns:
-            List of action dictionaries
+            List of actions
         """
-        actions = []
-        lines = code.split("\n")
+        return list(self._iter_actions(code.split("\n")))
 
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#") or line.startswith("import"):
-                continue
+    def _parse_lines(self, code: str) -> List[Action]:
+        """Parse Playwright code line by line without recording a parse stage."""
+        return list(self._iter_lines(code.split("\n")))
+
+    def _iter_actions(self, lines: Iterable[str]) -> Iterator[Action]:
+        """Parse Playwright source lines one by one and yield their actions.
+
+        With a profiler, the time spent parsing is recorded as one call of the
+        ``parse`` stage when the iteration ends.
+        """
+        if self.profiler is None:
+            return self._iter_lines(lines)
+        return self._iter_profiled_lines(lines)
+
+    def _iter_profiled_lines(self, lines: Iterable[str]) -> Iterator[Action]:
+        """Yield the actions of ``lines``, timing only the parsing between yields."""
+        perf_counter = time.perf_counter
+        actions = self._iter_lines(lines)
+        seconds = 0.0
+        try:
+            while True:
+                start = perf_counter()
+                try:
+                    action = next(actions)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += perf_counter() - start
+                yield action
+        finally:
+            self.profiler.record("parse", seconds)
+
+    def _iter_lines(self, lines: Iterable[str]) -> Iterator[Action]:
+        """Parse source lines one by one and yield their actions, numbered by line."""
+        parse_line = self._parse_line
+        for number, line in enumerate(lines, 1):
+            action = parse_line(line)
+            if action is not None:
+                action.line = number
+                yield action
+
+    def _parse_line(self, line: str) -> Optional[Action]:
+        """Parse a single source line, returning its action if it has one."""
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("import"):
+            return None
+
+        if self.plugins.names:
+            # The first method call with a plugin decides; plugins precede built-ins.
+            names = self.plugins.names
+            for match in _CALL_RE.finditer(line):
+                if match.group(1) in names:
+                    action = self._parse_plugin(match.group(1), line)
+                    if action is not None:
+                        return action
+                    break
+
+        method = _match_token(_ACTION_RE, _ACTION_PRIORITY, line)
+        if method is None:
+            return None
+
+        return self.parse_handlers[method](method, line) or None
+
+    def _parse_plugin(self, method: str, line: str) -> Optional[Action]:
+        """Parse a statement with the plugin for ``method``, loading it on first use."""
+        handler = self._plugin_parsers.get(method)
+        if handler is None:
+            plugin = self.plugins.get(method)
+            if plugin is None:
+                return None
+            handler = functools.partial(plugin.parse, self)
+            if self.profiler is not None:
+                handler = self.profiler.wrap(handler, "extract", method)
+            self._plugin_parsers[method] = handler
+        return handler(method, line) or None
+
+    def _plugin_converter(self, action_type: str) -> Optional[Callable[[Action], Optional[str]]]:
+        """Return the plugin handler generating lines for ``action_type``, if any."""
+        handler = self._plugin_converters.get(action_type)
+        if handler is None and self.plugins.names:
+            plugin = self.plugins.for_action_type(action_type)
+            if plugin is None:
+                return None
+            handler = functools.partial(plugin.convert, self)
+            if self.profiler is not None:
+                handler = self.profiler.wrap(handler, "generate", action_type)
+            self._plugin_converters[action_type] = handler
+        return handler
+
+    def _parse_goto(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``page.goto(url)`` statement."""
+        url = self._extract_string_arg(line)
+        if url:
+            return Action(action_type, value=url)
+        return None
 
-            if "page.goto(" in line:
-                url = self._extract_string_arg(line)
-                if url:
-                    actions.append({"type": "goto", "url": url})
-
-            elif ".click(" in line:
-                selector = self._extract_selector(line)
-                if selector:
-                    actions.append({"type": "click", "selector": selector})
-
-            elif ".fill(" in line:
-                selector, value = self._extract_fill_args(line)
-                if selector and value:
-                    actions.append({"type": "fill", "selector": selector, "value": value})
-
-            elif ".press(" in line:
-                selector, key = self._extract_press_args(line)
-                if selector and key:
-                    actions.append({"type": "press", "selector": selector, "key": key})
-
-            elif ".select_option(" in line:
-                selector, value = self._extract_select_args(line)
-                if selector and value:
-                    actions.append({"type": "select_option", "selector": selector, "value": value})
-
-            elif ".check(" in line:
-                selector = self._extract_selector(line)
-                if selector:
-                    actions.append({"type": "check", "selector": selector})
-
-            elif ".uncheck(" in line:
-                selector = self._extract_selector(line)
-                if selector:
-                    actions.append({"type": "uncheck", "selector": selector})
-
-            elif ".hover(" in line:
-                selector = self._extract_selector(line)
-                if selector:
-                    actions.append({"type": "hover", "selector": selector})
-
-            elif ".dblclick(" in line:
-                selector = self._extract_selector(line)
-                if selector:
-                    actions.append({"type": "dblclick", "selector": selector})
-
-            elif ".set_input_files(" in line or ".setInputFiles(" in line:
-                selector, file_path = self._extract_set_input_files_args(line)
-                if selector and file_path:
-                    actions.append(
-                        {"type": "set_input_files", "selector": selector, "file_path": file_path}
-                    )
-
-            elif "screenshot(" in line:
-                path = self._extract_string_arg(line, arg_name="path")
-                if path:
-                    actions.append({"type": "screenshot", "path": path})
-
-            elif "wait_for_load_state(" in line:
-                state = self._extract_string_arg(line) or "networkidle"
-                actions.append({"type": "wait_for_load_state", "state": state})
-
-            elif "expect(" in line:
-                # Handle Playwright expect assertions
-                if ".to_be_visible()" in line:
-                    selector = self._extract_expect_selector(line)
-                    if selector:
-                        actions.append({"type": "expect_visible", "selector": selector})
-
-                elif ".to_have_text(" in line or ".to_contain_text(" in line:
-                    selector = self._extract_expect_selector(line)
-                    text = self._extract_expect_text_value(line)
-                    if selector and text:
-                        actions.append({"type": "expect_text", "selector": selector, "text": text})
-
-                elif ".to_have_value(" in line:
-                    selector = self._extract_expect_selector(line)
-                    value = self._extract_expect_text_value(line)
-                    if selector and value:
-                        actions.append(
-                            {"type": "expect_value", "selector": selector, "value": value}
-                        )
-
-                elif ".to_be_checked()" in line:
-                    selector = self._extract_expect_selector(line)
-                    if selector:
-                        actions.append({"type": "expect_checked", "selector": selector})
-
-                elif ".to_have_url(" in line:
-                    url = self._extract_expect_text_value(line)
-                    if url:
-                        actions.append({"type": "expect_url", "url": url})
-
-                elif ".to_have_title(" in line:
-                    title = self._extract_expect_text_value(line)
-                    if title:
-                        actions.append({"type": "expect_title", "title": title})
-
-        return actions
+    def _parse_selector_action(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse an action whose only argument is its target selector."""
+        selector = self._extract_selector(line)
+        if selector:
+            return Action(action_type, selector)
+        return None
+
+    def _parse_fill(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``fill`` statement."""
+        selector, value = self._extract_fill_args(line)
+        if selector and value:
+            return Action(action_type, selector, value)
+        return None
+
+    def _parse_press(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``press`` statement."""
+        selector, key = self._extract_press_args(line)
+        if selector and key:
+            return Action(action_type, selector, key)
+        return None
+
+    def _parse_select_option(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``select_option`` statement."""
+        selector, value = self._extract_select_args(line)
+        if selector and value:
+            return Action(action_type, selector, value)
+        return None
+
+    def _parse_set_input_files(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``set_input_files`` statement."""
+        selector, file_path = self._extract_set_input_files_args(line)
+        if selector and file_path:
+            return Action(action_type, selector, file_path)
+        return None
+
+    def _parse_screenshot(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``screenshot(path=...)`` statement."""
+        path = self._extract_string_arg(line, arg_name="path")
+        if path:
+            return Action(action_type, value=path)
+        return None
+
+    def _parse_wait_for_load_state(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``wait_for_load_state`` statement."""
+        state = self._extract_string_arg(line) or "networkidle"
+        return Action(action_type, value=state)
+
+    def _parse_expect(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a Playwright ``expect`` assertion by dispatching on its matcher."""
+        matcher = _match_token(_EXPECT_RE, _EXPECT_PRIORITY, line)
+        if matcher is None:
+            return None
+        return self.parse_handlers[matcher](matcher, line)
+
+    def _parse_expect_selector(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse an assertion that only needs the asserted locator."""
+        selector = self._extract_expect_selector(_locator_expression(line, ").to_"))
+        if selector:
+            return Action(action_type, selector)
+        return None
+
+    def _parse_expect_text(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``to_have_text``/``to_contain_text`` assertion."""
+        selector = self._extract_expect_selector(_locator_expression(line, ").to_"))
+        text = self._extract_expect_text_value(line)
+        if selector and text:
+            return Action(action_type, selector, text)
+        return None
+
+    def _parse_expect_value(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a ``to_have_value`` assertion."""
+        selector = self._extract_expect_selector(_locator_expression(line, ").to_"))
+        value = self._extract_expect_text_value(line)
+        if selector and value:
+            return Action(action_type, selector, value)
+        return None
+
+    def _parse_expect_page(self, action_type: str, line: str) -> Optional[Action]:
+        """Parse a page-level ``to_have_url``/``to_have_title`` assertion."""
+        value = self._extract_expect_text_value(line)
+        if value:
+            return Action(action_type, value=value)
+        return None
 
     def _extract_string_arg(self, line: str, arg_name: Optional[str] = None) -> Optional[str]:
         """Extract a string argument from a function call."""
         if arg_name:
-            pattern = rf'{arg_name}=["\']([^"\']+)["\']'
+            pattern = _NAMED_STRING_ARG_RES.get(arg_name)
+            if pattern is None:
+                pattern = re.compile(rf'{arg_name}=["\']([^"\']+)["\']')
+                _NAMED_STRING_ARG_RES[arg_name] = pattern
         else:
-            pattern = r'["\']([^"\']+)["\']'
+            pattern = _STRING_ARG_RE
 
-        match = re.search(pattern, line)
+        match = pattern.search(line)
         return match.group(1) if match else None
 
     def _extract_selector(self, line: str) -> Optional[str]:
@@ -199,51 +757,23 @@ class PlaywrightToRobotConverter:
         Converts chained locators to Robot Framework >> syntax:
         page.get_by_role("row").get_by_role("link") -> role=row >> role=link
         """
-        # Find all locator methods in the line
-        locator_patterns = [
-            (r'locator\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', lambda s: s),
-            (
-                (
-                    r'get_by_role\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']'
-                    r'(?:,\s*name=["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\'])?\)'
-                ),
-                lambda s, n=None: f"role={s}[name='{n}']" if n else f"role={s}",
-            ),
-            (r'get_by_text\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', lambda s: f"text={s}"),
-            (r'get_by_label\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', lambda s: s),
-            (
-                r'get_by_placeholder\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)',
-                lambda s: f"placeholder={s}",
-            ),
-            (
-                r'get_by_test_id\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)',
-                lambda s: f"data-testid={s}",
-            ),
-        ]
-
         selectors = []
 
-        for pattern_str, formatter in locator_patterns:
-            pattern = re.compile(pattern_str)
+        for literal, pattern, formatter in _LOCATOR_PATTERNS:
+            if literal not in line:
+                continue
             for match in pattern.finditer(line):
-                groups = match.groups()
-                # Unescape
-                groups = tuple(
-                    g.replace(r"\"", '"').replace(r"\'", "'") if g else None for g in groups
-                )
-                selector = formatter(*groups)
-                selectors.append(selector)
+                groups = tuple(_unescape(g) if g else None for g in match.groups())
+                selectors.append(formatter(*groups))
 
         if selectors:
             # Chain selectors with >>
             return " >> ".join(selectors)
 
         # Fallback pattern
-        match = re.search(r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)', line)
+        match = _SELECTOR_FALLBACK_RE.search(line)
         if match:
-            selector = match.group(1)
-            selector = selector.replace(r"\"", '"').replace(r"\'", "'")
-            return selector
+            return _unescape(match.group(1))
 
         return None
 
@@ -257,25 +787,17 @@ class PlaywrightToRobotConverter:
         parts = line.split(".fill(")
         if len(parts) > 1:
             # First check for locator chain: page.locator("selector").fill("value")
-            selector = self._extract_selector(line)
+            selector = self._extract_selector(_locator_expression(line, ".fill("))
             if selector:
                 # Extract the fill value (single argument)
-                value_pattern = r'\.fill\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-                value_match = re.search(value_pattern, line)
+                value_match = _FILL_VALUE_RE.search(line)
                 if value_match:
-                    value = value_match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                    return selector, value
+                    return selector, _unescape(value_match.group(1))
 
             # Fallback: Check for page.fill("selector", "value")
-            pattern = (
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-            )
-            match = re.search(pattern, parts[1])
+            match = _TWO_ARGS_RE.search(parts[1])
             if match:
-                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                value = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
-                return selector, value
+                return _unescape(match.group(1)), _unescape(match.group(2))
         return None, None
 
     def _extract_press_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
@@ -284,15 +806,9 @@ class PlaywrightToRobotConverter:
         parts = line.split(".press(")
         if len(parts) > 1:
             # Match two quoted strings: .press("selector", "key")
-            pattern = (
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-            )
-            match = re.search(pattern, parts[1])
+            match = _TWO_ARGS_RE.search(parts[1])
             if match:
-                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                key = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
-                return selector, key
+                return _unescape(match.group(1)), _unescape(match.group(2))
         return None, None
 
     def _extract_select_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
@@ -305,25 +821,17 @@ class PlaywrightToRobotConverter:
         parts = line.split(".select_option(")
         if len(parts) > 1:
             # First check for locator chain: page.locator("selector").select_option("value")
-            selector = self._extract_selector(line)
+            selector = self._extract_selector(_locator_expression(line, ".select_option("))
             if selector:
                 # Extract the select value (single argument)
-                value_pattern = r'\.select_option\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-                value_match = re.search(value_pattern, line)
+                value_match = _SELECT_VALUE_RE.search(line)
                 if value_match:
-                    value = value_match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                    return selector, value
+                    return selector, _unescape(value_match.group(1))
 
             # Fallback: Check for page.select_option("selector", "value")
-            pattern = (
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-            )
-            match = re.search(pattern, parts[1])
+            match = _TWO_ARGS_RE.search(parts[1])
             if match:
-                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                value = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
-                return selector, value
+                return _unescape(match.group(1)), _unescape(match.group(2))
         return None, None
 
     def _extract_set_input_files_args(self, line: str) -> Tuple[Optional[str], Optional[str]]:
@@ -336,28 +844,19 @@ class PlaywrightToRobotConverter:
         parts = line.split(".set_input_files(") or line.split(".setInputFiles(")
         if len(parts) > 1:
             # First check for locator chain
-            selector = self._extract_selector(line)
+            selector = self._extract_selector(_locator_expression(line, ".set_input_files("))
             if selector:
                 # Extract the file path (single argument)
-                file_pattern = r'\.set_input_files\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-                file_match = re.search(file_pattern, line)
+                file_match = _SET_INPUT_FILES_RE.search(line)
                 if not file_match:
-                    file_pattern = r'\.setInputFiles\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-                    file_match = re.search(file_pattern, line)
+                    file_match = _SET_INPUT_FILES_CAMEL_RE.search(line)
                 if file_match:
-                    file_path = file_match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                    return selector, file_path
+                    return selector, _unescape(file_match.group(1))
 
             # Fallback: Check for page.set_input_files("selector", "file")
-            pattern = (
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*,\s*'
-                r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\)'
-            )
-            match = re.search(pattern, parts[1])
+            match = _TWO_ARGS_RE.search(parts[1])
             if match:
-                selector = match.group(1).replace(r"\"", '"').replace(r"\'", "'")
-                file_path = match.group(2).replace(r"\"", '"').replace(r"\'", "'")
-                return selector, file_path
+                return _unescape(match.group(1)), _unescape(match.group(2))
         return None, None
 
     def _extract_expect_selector(self, line: str) -> Optional[str]:
@@ -366,17 +865,10 @@ class PlaywrightToRobotConverter:
         Handles: expect(page.locator("selector")).to_be_visible()
         """
         # Pattern: expect(page.locator("selector") or expect(locator)
-        patterns = [
-            r'expect\(page\.locator\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']',
-            r'expect\(page\.get_by_[a-z_]+\(["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, line)
+        for pattern in _EXPECT_SELECTOR_RES:
+            match = pattern.search(line)
             if match:
-                selector = match.group(1)
-                selector = selector.replace(r"\"", '"').replace(r"\'", "'")
-                return selector
+                return _unescape(match.group(1))
         return None
 
     def _extract_expect_text_value(self, line: str) -> Optional[str]:
@@ -384,14 +876,12 @@ class PlaywrightToRobotConverter:
 
         Handles: .to_have_text("value") or .to_contain_text("value")
         """
-        # Find the last quoted string in the line (the assertion value)
-        pattern = r'["\']([^"\'\\]*(?:\\.[^"\'\\]*)*)["\']\s*\)'
-        matches = list(re.finditer(pattern, line))
-        if matches:
-            # Get the last match (the assertion value, not the selector)
-            value = matches[-1].group(1)
-            value = value.replace(r"\"", '"').replace(r"\'", "'")
-            return value
+        # Find the last quoted string in the line (the assertion value, not the selector)
+        value = None
+        for match in _EXPECT_VALUE_RE.finditer(line):
+            value = match.group(1)
+        if value is not None:
+            return _unescape(value)
         return None
 
     def _simplify_selector(self, selector: str) -> str:
@@ -402,8 +892,6 @@ class PlaywrightToRobotConverter:
         - [id="value"] -> id=value
         - But preserves quotes in role/text selectors (role=button[name='I Accept'])
         """
-        import re
-
         # Don't simplify selectors that start with role=, text=, placeholder=, data-testid=
         # These are already in the correct Robot Framework format
         if selector.startswith(("role=", "text=", "placeholder=", "data-testid=")):
@@ -414,122 +902,164 @@ class PlaywrightToRobotConverter:
             return selector
 
         # Pattern for [attribute="value"] or [attribute='value']
-        match = re.match(r'^\[([a-zA-Z-]+)=["\']([^"\']+)["\']\]$', selector)
+        match = _ATTRIBUTE_SELECTOR_RE.match(selector)
         if match:
             attr, value = match.groups()
             return f"{attr}={value}"
 
         # Pattern for removing quotes from bracket selectors
         # e.g., [data-test="value"] -> [data-test=value]
-        selector = re.sub(r'\[([a-zA-Z-]+)=["\']([^"\']+)["\']\]', r"[\1=\2]", selector)
+        return _QUOTED_ATTRIBUTE_RE.sub(r"[\1=\2]", selector)
 
-        return selector
-
-    def _convert_goto(self, action: Dict) -> str:
+    def _convert_goto(self, action: Action) -> str:
         """Convert goto action to Robot Framework."""
-        url = action.get("url", "")
+        url = action.value or ""
         return f"New Page{self.indent}{url}"
 
-    def _convert_click(self, action: Dict) -> str:
+    def _convert_click(self, action: Action) -> str:
         """Convert click action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Click{self.indent}{selector}"
 
-    def _convert_fill(self, action: Dict) -> str:
-        """Convert fill action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
-        value = action.get("value", "")
+    def _convert_fill(self, action: Action) -> str:
+        """Convert fill action to Robot Framework; clearing a field fills in ``${EMPTY}``."""
+        selector = self._simplify_selector(action.selector or "")
+        value = action.value or "${EMPTY}"
         return f"Fill Text{self.indent}{selector}{self.indent}{value}"
 
-    def _convert_press(self, action: Dict) -> str:
+    def _convert_type(self, action: Action) -> str:
+        """Convert typed text (merged key presses) to Robot Framework."""
+        selector = self._simplify_selector(action.selector or "")
+        text = action.value or ""
+        return f"Type Text{self.indent}{selector}{self.indent}{text}{self.indent}clear=False"
+
+    def _convert_press(self, action: Action) -> str:
         """Convert press action to Robot Framework."""
-        key = action.get("key", "")
+        key = action.value or ""
+        if key == " ":
+            key = "${SPACE}"
         return f"Keyboard Key{self.indent}press{self.indent}{key}"
 
-    def _convert_select_option(self, action: Dict) -> str:
+    def _convert_select_option(self, action: Action) -> str:
         """Convert select_option to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
-        value = action.get("value", "")
+        selector = self._simplify_selector(action.selector or "")
+        value = action.value or ""
         return f"Select Options By{self.indent}{selector}{self.indent}value{self.indent}{value}"
 
-    def _convert_check(self, action: Dict) -> str:
+    def _convert_check(self, action: Action) -> str:
         """Convert check action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Check Checkbox{self.indent}{selector}"
 
-    def _convert_uncheck(self, action: Dict) -> str:
+    def _convert_uncheck(self, action: Action) -> str:
         """Convert uncheck action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Uncheck Checkbox{self.indent}{selector}"
 
-    def _convert_hover(self, action: Dict) -> str:
+    def _convert_hover(self, action: Action) -> str:
         """Convert hover action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Hover{self.indent}{selector}"
 
-    def _convert_dblclick(self, action: Dict) -> str:
+    def _convert_dblclick(self, action: Action) -> str:
         """Convert double-click action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Click{self.indent}{selector}{self.indent}clickCount=2"
 
-    def _convert_set_input_files(self, action: Dict) -> str:
+    def _convert_set_input_files(self, action: Action) -> str:
         """Convert set_input_files action to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
-        file_path = action.get("file_path", "")
+        selector = self._simplify_selector(action.selector or "")
+        file_path = action.value or ""
         return f"Upload File By Selector{self.indent}{selector}{self.indent}{file_path}"
 
-    def _convert_wait_for_load_state(self, action: Dict) -> str:
+    def _convert_wait_for_load_state(self, action: Action) -> str:
         """Convert wait_for_load_state to Robot Framework."""
-        state = action.get("state", "networkidle")
+        state = action.value or "networkidle"
         return f"Wait For Load State{self.indent}{state}"
 
-    def _convert_screenshot(self, action: Dict) -> str:
+    def _convert_screenshot(self, action: Action) -> str:
         """Convert screenshot action to Robot Framework."""
-        path = action.get("path", "screenshot.png")
+        path = action.value or "screenshot.png"
         return f"Take Screenshot{self.indent}{path}"
 
-    def _convert_expect_visible(self, action: Dict) -> str:
+    def _convert_expect_visible(self, action: Action) -> str:
         """Convert expect visible assertion to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Get Element States{self.indent}{selector}{self.indent}validate{self.indent}visible"
 
-    def _convert_expect_text(self, action: Dict) -> str:
-        """Convert expect text assertion to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
-        text = action.get("text", "")
+    def _convert_expect_text(self, action: Action) -> str:
+        """Convert expect text assertion to Robot Framework; no text expects ``${EMPTY}``."""
+        selector = self._simplify_selector(action.selector or "")
+        text = action.value or "${EMPTY}"
         return f"Get Text{self.indent}{selector}{self.indent}=={self.indent}{text}"
 
-    def _convert_expect_value(self, action: Dict) -> str:
-        """Convert expect value assertion to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
-        value = action.get("value", "")
+    def _convert_expect_value(self, action: Action) -> str:
+        """Convert expect value assertion to Robot Framework; no value expects ``${EMPTY}``."""
+        selector = self._simplify_selector(action.selector or "")
+        value = action.value or "${EMPTY}"
         return (
             f"Get Property{self.indent}{selector}{self.indent}"
             f"value{self.indent}=={self.indent}{value}"
         )
 
-    def _convert_expect_checked(self, action: Dict) -> str:
+    def _convert_expect_checked(self, action: Action) -> str:
         """Convert expect checked assertion to Robot Framework."""
-        selector = self._simplify_selector(action.get("selector", ""))
+        selector = self._simplify_selector(action.selector or "")
         return f"Get Checkbox State{self.indent}{selector}{self.indent}=={self.indent}checked"
 
-    def _convert_expect_url(self, action: Dict) -> str:
+    def _convert_expect_url(self, action: Action) -> str:
         """Convert expect URL assertion to Robot Framework."""
-        url = action.get("url", "")
+        url = action.value or ""
         return f"Get Url{self.indent}=={self.indent}{url}"
 
-    def _convert_expect_title(self, action: Dict) -> str:
+    def _convert_expect_title(self, action: Action) -> str:
         """Convert expect title assertion to Robot Framework."""
-        title = action.get("title", "")
+        title = action.value or ""
         return f"Get Title{self.indent}=={self.indent}{title}"
 
-    def _convert_locator(self, action: Dict) -> str:
+    def _convert_locator(self, action: Action) -> str:
         """Handle locator-based actions."""
         return ""
 
+    def _convert_action(self, action: Union[Action, Dict]) -> Optional[str]:
+        """Convert a single parsed action to a Robot Framework keyword line.
+
+        Actions in the dictionary format are accepted as well.
+
+        Returns:
+            The keyword line without indentation, or None if the action emits nothing
+        """
+        if not isinstance(action, Action):
+            action = Action.from_dict(action)
+        converter = self.action_mappings.get(action.type)
+        if converter is None:
+            converter = self._plugin_converter(action.type)
+            if converter is None:
+                return None
+        return converter(action) or None
+
+    def _generate_header(
+        self,
+        test_name: str,
+        suite_name: str,
+        browser: str,
+        headless: bool,
+    ) -> List[str]:
+        """Generate the settings section and the browser setup steps of the test."""
+        return [
+            "*** Settings ***",
+            "Library    Browser",
+            "",
+            "",
+            "*** Test Cases ***",
+            test_name,
+            f"{self.indent}New Browser{self.indent}{browser}{self.indent}headless={headless}",
+            f"{self.indent}New Context{self.indent}viewport={{'width': 1920, 'height': 1080}}",
+        ]
+
     def _generate_robot_test(
         self,
-        actions: List[Dict],
+        actions: List[Action],
         test_name: str,
         suite_name: str,
         browser: str,
@@ -547,29 +1077,25 @@ class PlaywrightToRobotConverter:
         Returns:
             Complete Robot Framework test as string
         """
-        lines = [
-            "*** Settings ***",
-            "Library    Browser",
-            "",
-            "",
-            "*** Test Cases ***",
-            test_name,
-        ]
+        lines = list(self._iter_robot_test(actions, test_name, suite_name, browser, headless))
+        lines.append("")
+        return "\n".join(lines)
 
-        lines.append(
-            f"{self.indent}New Browser{self.indent}{browser}{self.indent}headless={headless}"
-        )
-        lines.append(
-            f"{self.indent}New Context{self.indent}viewport={{'width': 1920, 'height': 1080}}"
-        )
+    def _iter_robot_test(
+        self,
+        actions: Iterable[Action],
+        test_name: str,
+        suite_name: str,
+        browser: str,
+        headless: bool,
+    ) -> Iterator[str]:
+        """Yield the lines of the Robot Framework test file for ``actions``."""
+        yield from self._generate_header(test_name, suite_name, browser, headless)
+        yield from self._iter_test_body(actions)
 
+    def _iter_test_body(self, actions: Iterable[Action]) -> Iterator[str]:
+        """Yield the indented keyword lines of a test case for ``actions``."""
         for action in actions:
-            action_type = action.get("type")
-            if action_type in self.action_mappings:
-                converter = self.action_mappings[action_type]
-                robot_line = converter(action)
-                if robot_line:
-                    lines.append(f"{self.indent}{robot_line}")
-
-        lines.append("")
-        return "\n".join(lines)
+            robot_line = self._convert_action(action)
+            if robot_line:
+                yield f"{self.indent}{robot_line}"
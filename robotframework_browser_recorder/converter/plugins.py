@@ -0,0 +1,164 @@
+"""Registry of third-party action plugins, loaded lazily from entry points."""
+
+import warnings
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from robotframework_browser_recorder.converter.actions import Action
+
+# Entry point group of action plugins. The entry point name is the Playwright method a
+# plugin handles, e.g. ``drag_to = my_package.plugins:DragTo``.
+ENTRY_POINT_GROUP = "robotframework_browser_recorder.actions"
+
+
+class ActionPlugin:
+    """Base class of action plugins.
+
+    A plugin parses statements calling the Playwright method it is registered for and
+    generates Robot Framework lines for the action types listed in ``action_types``.
+    Both hooks receive the converter, so plugins can reuse its selector helpers such as
+    ``converter._extract_selector`` and ``converter._simplify_selector``.
+    """
+
+    #: Action types :meth:`convert` generates lines for. Types the built-in mappings
+    #: already handle are left to them.
+    action_types: Tuple[str, ...] = ()
+
+    def parse(self, converter, method: str, line: str) -> Optional[Action]:
+        """Return the action of a statement calling ``method``.
+
+        Args:
+            converter: Converter parsing the statement
+            method: Method name the plugin is registered for
+            line: The statement, stripped and joined into one line
+
+        Returns:
+            The action, or None to leave the statement to the built-in parser
+        """
+        return None
+
+    def convert(self, converter, action: Action) -> Optional[str]:
+        """Return the Robot Framework keyword line of ``action``, without indentation."""
+        return None
+
+
+class PluginRegistry:
+    """Action plugins by Playwright method name.
+
+    Only the names of the entry points are read up front; a plugin's module is
+    imported the first time its method is seen in a statement, or when an action of a
+    type no loaded plugin handles has to be converted.
+    """
+
+    def __init__(self, entry_points: Iterable = (), versions: Optional[Dict[str, str]] = None):
+        """Initialize the registry.
+
+        Args:
+            entry_points: Entry points (objects with ``name``, ``value`` and ``load()``)
+                whose loaded object is an :class:`ActionPlugin` instance or class
+            versions: Version of the distribution providing each entry point, by name
+        """
+        versions = versions or {}
+        self._entry_points = {entry_point.name: entry_point for entry_point in entry_points}
+        # Where each plugin comes from, stable across loading.
+        self._sources = {
+            name: f"{point.value}=={versions[name]}" if name in versions else point.value
+            for name, point in self._entry_points.items()
+        }
+        self._plugins: Dict[str, ActionPlugin] = {}
+        #: Plugins added with :meth:`register`, by method name.
+        self.registered: Dict[str, ActionPlugin] = {}
+        self._types: Dict[str, ActionPlugin] = {}
+        self._all_loaded = not self._entry_points
+        #: Method names with a plugin, loaded or not.
+        self.names: FrozenSet[str] = frozenset(self._entry_points)
+
+    @classmethod
+    def from_entry_points(cls, group: str = ENTRY_POINT_GROUP) -> "PluginRegistry":
+        """Create a registry from the installed entry points of ``group``.
+
+        Entry points are read per distribution to know their versions; like
+        ``metadata.entry_points()``, the first distribution on the path wins a name.
+        """
+        from importlib import metadata
+
+        entry_points = []
+        versions: Dict[str, str] = {}
+        for dist in metadata.distributions():
+            for entry_point in dist.entry_points:
+                if entry_point.group == group and entry_point.name not in versions:
+                    entry_points.append(entry_point)
+                    versions[entry_point.name] = dist.version
+        return cls(entry_points, versions)
+
+    def register(self, name: str, plugin: ActionPlugin) -> None:
+        """Register an already loaded plugin for the method ``name``."""
+        self._entry_points.pop(name, None)
+        cls = type(plugin)
+        self._sources[name] = f"{cls.__module__}:{cls.__qualname__}"
+        self.registered[name] = plugin
+        self._add(name, plugin)
+        self.names = self.names | {name}
+
+    def get(self, name: str) -> Optional[ActionPlugin]:
+        """Return the plugin for the method ``name``, loading it if needed.
+
+        A plugin that fails to load is reported with a warning and dropped.
+        """
+        plugin = self._plugins.get(name)
+        if plugin is not None:
+            return plugin
+        entry_point = self._entry_points.pop(name, None)
+        if entry_point is None:
+            return None
+        try:
+            plugin = entry_point.load()
+            if isinstance(plugin, type):
+                plugin = plugin()
+        except Exception as e:
+            warnings.warn(f"Could not load action plugin {name!r} ({entry_point.value}): {e}")
+            self.names = self.names - {name}
+            del self._sources[name]
+            return None
+        self._add(name, plugin)
+        return plugin
+
+    def for_action_type(self, action_type: str) -> Optional[ActionPlugin]:
+        """Return the plugin generating lines for ``action_type``, loading it if needed.
+
+        A plugin named like the action type is tried first; otherwise all remaining
+        plugins are loaded once.
+        """
+        plugin = self._types.get(action_type)
+        if plugin is None and not self._all_loaded:
+            self.get(action_type)
+            plugin = self._types.get(action_type)
+            if plugin is None:
+                for name in list(self._entry_points):
+                    self.get(name)
+                self._all_loaded = True
+                plugin = self._types.get(action_type)
+        return plugin
+
+    def describe(self) -> Dict[str, str]:
+        """Return where each plugin comes from, by method name, without loading any.
+
+        Entry points are described as ``module:attr==version`` when the version of
+        their distribution is known, registered plugins as ``module:class``.
+        """
+        return dict(sorted(self._sources.items()))
+
+    def _add(self, name: str, plugin: ActionPlugin) -> None:
+        self._plugins[name] = plugin
+        for action_type in getattr(plugin, "action_types", ()):
+            self._types.setdefault(action_type, plugin)
+
+
+_default_registry: Optional[PluginRegistry] = None
+
+
+def default_registry() -> PluginRegistry:
+    """Return the process-wide registry of the installed entry points."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = PluginRegistry.from_entry_points()
+    return _default_registry
@@ -0,0 +1,280 @@
+"""In-process recording engine driving the browser through the Playwright Python API."""
+
+import sys
+from typing import Dict, List, Optional
+
+from robotframework_browser_recorder.converter.actions import Action, ActionType
+
+# Name of the binding through which the page script reports recorded events.
+BINDING_NAME = "__rfbrowserRecord"
+
+# Keys that are recorded as ``press`` actions; other keys end up in ``fill`` values.
+RECORDED_KEYS = ("Enter", "Tab", "Escape")
+
+# Event types the page script may report.
+_EVENT_TYPES = frozenset(
+    {
+        ActionType.CLICK,
+        ActionType.DBLCLICK,
+        ActionType.FILL,
+        ActionType.PRESS,
+        ActionType.CHECK,
+        ActionType.UNCHECK,
+        ActionType.SELECT_OPTION,
+        ActionType.SET_INPUT_FILES,
+    }
+)
+
+
+# Actions whose navigations are not recorded as separate ``goto`` steps.
+_NAVIGATING_TYPES = frozenset({ActionType.CLICK, ActionType.DBLCLICK, ActionType.PRESS})
+
+# Injected into every frame. Reports user interactions as ``{type, selector, value}``
+# events, with selectors in the formats the converter already produces.
+RECORDER_SCRIPT = """
+(() => {
+  const report = window.%(binding)s;
+  if (!report || window.__rfbrowserRecorderInstalled) return;
+  window.__rfbrowserRecorderInstalled = true;
+
+  const quote = (value) => value.replace(/'/g, "\\\\'");
+  const text = (el) => (el.innerText || el.textContent || "").trim().replace(/\\s+/g, " ");
+  const roles = {A: "link", BUTTON: "button", SELECT: "combobox", TEXTAREA: "textbox"};
+  const inputRoles = {checkbox: "checkbox", radio: "radio", submit: "button", button: "button"};
+
+  function role(el) {
+    if (el.getAttribute("role")) return el.getAttribute("role");
+    if (el.tagName === "INPUT") return inputRoles[el.type] || "textbox";
+    return roles[el.tagName] || null;
+  }
+
+  function labelOf(el) {
+    if (el.getAttribute("aria-label")) return el.getAttribute("aria-label");
+    if (el.labels && el.labels.length) return text(el.labels[0]);
+    return null;
+  }
+
+  function cssPath(el) {
+    const parts = [];
+    for (; el && el.nodeType === 1 && el !== document.body; el = el.parentElement) {
+      let part = el.tagName.toLowerCase();
+      const siblings = el.parentElement ? Array.from(el.parentElement.children) : [];
+      const same = siblings.filter((sibling) => sibling.tagName === el.tagName);
+      if (same.length > 1) part += `:nth-of-type(${same.indexOf(el) + 1})`;
+      parts.unshift(part);
+    }
+    return parts.join(" > ");
+  }
+
+  function selector(el) {
+    for (const attr of ["data-testid", "data-test-id", "data-test"]) {
+      const value = el.getAttribute(attr);
+      if (value) return attr === "data-testid" ? `data-testid=${value}` : `[${attr}="${value}"]`;
+    }
+    if (el.id && /^[A-Za-z][\\w-]*$/.test(el.id)) return `#${el.id}`;
+    const elementRole = role(el);
+    const label = labelOf(el);
+    if (elementRole && label) return `role=${elementRole}[name='${quote(label)}']`;
+    if (el.getAttribute("placeholder")) return `placeholder=${el.getAttribute("placeholder")}`;
+    if (el.getAttribute("name")) return `[name="${el.getAttribute("name")}"]`;
+    const content = text(el);
+    if (elementRole && content && content.length <= 80) {
+      return `role=${elementRole}[name='${quote(content)}']`;
+    }
+    if (content && content.length <= 80 && !el.children.length) return `text=${content}`;
+    return cssPath(el);
+  }
+
+  function target(event) {
+    const el = event.composedPath ? event.composedPath()[0] : event.target;
+    if (!(el instanceof Element)) return null;
+    return el.closest("a, button, input, select, textarea, label, [role]") || el;
+  }
+
+  const isToggle = (el) => el.tagName === "INPUT" && /^(checkbox|radio)$/.test(el.type);
+  const isField = (el) => el.tagName === "SELECT" || (el.tagName === "INPUT" && el.type === "file");
+
+  document.addEventListener("click", (event) => {
+    const el = target(event);
+    if (!el || event.detail > 1 || isToggle(el) || isField(el)) return;
+    report({type: "click", selector: selector(el)});
+  }, true);
+
+  document.addEventListener("dblclick", (event) => {
+    const el = target(event);
+    if (el) report({type: "dblclick", selector: selector(el)});
+  }, true);
+
+  document.addEventListener("input", (event) => {
+    const el = target(event);
+    if (!el || isToggle(el) || isField(el)) return;
+    const value = el.isContentEditable ? text(el) : el.value;
+    report({type: "fill", selector: selector(el), value: value});
+  }, true);
+
+  document.addEventListener("change", (event) => {
+    const el = target(event);
+    if (!el) return;
+    if (isToggle(el)) {
+      report({type: el.checked ? "check" : "uncheck", selector: selector(el)});
+    } else if (el.tagName === "SELECT") {
+      report({type: "select_option", selector: selector(el), value: el.value});
+    } else if (el.type === "file" && el.files.length) {
+      report({type: "set_input_files", selector: selector(el), value: el.files[0].name});
+    }
+  }, true);
+
+  document.addEventListener("keydown", (event) => {
+    const el = target(event);
+    if (el && %(keys)s.includes(event.key)) {
+      report({type: "press", selector: selector(el), value: event.key});
+    }
+  }, true);
+})();
+""" % {
+    "binding": BINDING_NAME,
+    "keys": "[" + ", ".join(f'"{key}"' for key in RECORDED_KEYS) + "]",
+}
+
+
+class ActionCollector:
+    """Turn recorded page events into converter actions.
+
+    Consecutive ``fill`` events for the same field are merged into one action holding
+    the final value, like codegen does, and main frame navigations that are not the
+    result of a recorded interaction become ``goto`` actions.
+    """
+
+    def __init__(self):
+        """Initialize an empty recording."""
+        self.actions: List[Action] = []
+
+    def add_event(self, event: Dict) -> Optional[Action]:
+        """Add one event reported by the page script.
+
+        Args:
+            event: Dictionary with ``type``, ``selector`` and an optional ``value``
+
+        Returns:
+            The new or updated action, or None if the event was ignored
+        """
+        action_type = event.get("type")
+        selector = event.get("selector")
+        if action_type not in _EVENT_TYPES or not selector:
+            return None
+
+        value = event.get("value")
+        last = self.actions[-1] if self.actions else None
+        if (
+            action_type == ActionType.FILL
+            and last is not None
+            and last.type == ActionType.FILL
+            and last.selector == selector
+        ):
+            last.value = value
+            return last
+
+        action = Action(action_type, selector, value)
+        self.actions.append(action)
+        return action
+
+    def add_navigation(self, url: str) -> Optional[Action]:
+        """Add a navigation of the main frame to ``url``.
+
+        Navigations caused by the last recorded action (following a link, submitting a
+        form) are replayed by that action and are therefore not recorded.
+        """
+        if not url or url == "about:blank":
+            return None
+        last = self.actions[-1] if self.actions else None
+        if last is not None and (
+            last.type in _NAVIGATING_TYPES or (last.type == ActionType.GOTO and last.value == url)
+        ):
+            return None
+        action = Action(ActionType.GOTO, value=url)
+        self.actions.append(action)
+        return action
+
+
+class InProcessRecorder:
+    """Record a browser session without the ``playwright codegen`` CLI.
+
+    The browser is launched through the ``playwright`` package in this process. A page
+    script reports every interaction through an exposed binding, so recorded steps
+    arrive as structured events and are turned into :class:`Action` records directly,
+    without generating and re-parsing Python source. The session ends when the last
+    page is closed.
+    """
+
+    def __init__(
+        self,
+        browser: str = "chromium",
+        url: Optional[str] = None,
+        inspector: bool = True,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            browser: Browser to use (chromium, firefox, webkit)
+            url: Initial URL to navigate to
+            inspector: Also open the Playwright Inspector next to the browser
+        """
+        self.browser = browser
+        self.url = url
+        self.inspector = inspector
+        self.collector = ActionCollector()
+
+    def record(self) -> List[Action]:
+        """Run the recording session until the browser is closed.
+
+        Returns:
+            Recorded actions in the order they were performed
+        """
+        from playwright.sync_api import sync_playwright
+
+        collector = self.collector
+        with sync_playwright() as playwright:
+            browser = getattr(playwright, self.browser).launch(headless=False)
+            try:
+                context = browser.new_context()
+                if self.inspector:
+                    self._enable_inspector(context)
+                context.expose_binding(
+                    BINDING_NAME, lambda source, event: collector.add_event(event)
+                )
+                context.add_init_script(RECORDER_SCRIPT)
+
+                page = context.new_page()
+                context.on("page", self._watch_navigations)
+                self._watch_navigations(page)
+                if self.url:
+                    page.goto(self.url)
+
+                while context.pages:
+                    context.pages[0].wait_for_event("close", timeout=0)
+            finally:
+                browser.close()
+        return collector.actions
+
+    def _watch_navigations(self, page) -> None:
+        """Record main frame navigations of ``page``."""
+        page.on(
+            "framenavigated",
+            lambda frame: frame.parent_frame is None and self.collector.add_navigation(frame.url),
+        )
+
+    @staticmethod
+    def _enable_inspector(context) -> None:
+        """Open the Playwright Inspector for ``context``.
+
+        Playwright has no public API for this; the private hook used by ``codegen`` is
+        called when it exists, and recording continues without the Inspector otherwise.
+        """
+        impl = getattr(context, "_impl_obj", None)
+        enable = getattr(impl, "_enable_recorder", None)
+        if enable is None:
+            return
+        try:
+            context._sync(enable(language="python", mode="inspecting"))
+        except Exception as e:
+            print(f"Warning: could not open the Playwright Inspector: {e}", file=sys.stderr)
@@ -0,0 +1,220 @@
+"""Extraction of repeated step sequences into user keywords."""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+# Rolling hash over step ids: polynomial hash modulo a Mersenne prime.
+_MOD = (1 << 61) - 1
+_BASE = 1_000_003
+
+# (sequence index, start position) of one occurrence of a run of steps.
+Occurrence = Tuple[int, int]
+
+
+@dataclass
+class Keyword:
+    """A user keyword made from a repeated run of steps."""
+
+    name: str
+    steps: List[str]
+    occurrences: int
+
+
+class KeywordExtractor:
+    """Find runs of steps repeated across test cases and factor them into keywords.
+
+    Every window of ``min_length`` steps is indexed by a rolling hash, so indexing is
+    linear in the total number of steps. Windows that occur at least
+    ``min_occurrences`` times (without overlapping) are extended for as long as all
+    occurrences continue with the same step. Only left-maximal windows are extended:
+    when every occurrence is preceded by the same step, the window lies inside a run
+    that starts one step earlier, so a long repeated run is extended once instead of
+    once per window. The candidates that save the most steps are then chosen
+    greedily, skipping occurrences that overlap an already chosen run, and every
+    remaining occurrence is replaced by a call of the new keyword.
+    """
+
+    def __init__(
+        self,
+        min_length: int = 3,
+        min_occurrences: int = 2,
+        name_prefix: str = "Recorded Steps",
+    ):
+        """Initialize the extractor.
+
+        Args:
+            min_length: Minimum number of steps of an extracted keyword
+            min_occurrences: Minimum number of calls of an extracted keyword
+            name_prefix: Keywords are named ``<name_prefix> 1``, ``<name_prefix> 2``, ...
+
+        Raises:
+            ValueError: If ``min_length`` or ``min_occurrences`` is below 2
+        """
+        if min_length < 2 or min_occurrences < 2:
+            raise ValueError("min_length and min_occurrences must be at least 2")
+        self.min_length = min_length
+        self.min_occurrences = min_occurrences
+        self.name_prefix = name_prefix
+
+    def extract(
+        self, sequences: Sequence[Sequence[str]], indent: str = "    "
+    ) -> Tuple[List[Keyword], List[List[str]]]:
+        """Extract keywords from step sequences.
+
+        Args:
+            sequences: Steps of every test case, as indented Robot Framework lines
+            indent: Indentation of the keyword calls that replace extracted runs
+
+        Returns:
+            The extracted keywords and the rewritten sequences
+        """
+        ids: Dict[str, int] = {}
+        encoded = [[ids.setdefault(step, len(ids)) for step in steps] for steps in sequences]
+
+        candidates = self._candidates(encoded)
+        chosen = self._choose(encoded, candidates)
+
+        # Number keywords in the order they are first called.
+        chosen.sort(key=lambda item: item[1][0])
+        keywords = []
+        starts: Dict[Occurrence, Tuple[int, int]] = {}
+        for number, (run, occurrences) in enumerate(chosen, 1):
+            first_sequence, first_start = occurrences[0]
+            first_end = first_start + len(run)
+            steps = list(sequences[first_sequence][first_start:first_end])
+            keywords.append(Keyword(f"{self.name_prefix} {number}", steps, len(occurrences)))
+            for occurrence in occurrences:
+                starts[occurrence] = (number - 1, len(run))
+
+        rewritten = []
+        for index, steps in enumerate(sequences):
+            lines = []
+            position = 0
+            while position < len(steps):
+                match = starts.get((index, position))
+                if match is None:
+                    lines.append(steps[position])
+                    position += 1
+                else:
+                    keyword, length = match
+                    lines.append(f"{indent}{keywords[keyword].name}")
+                    position += length
+            rewritten.append(lines)
+        return keywords, rewritten
+
+    def _candidates(self, encoded: List[List[int]]) -> Dict[Tuple[int, ...], List[Occurrence]]:
+        """Return maximal repeated runs of at least ``min_length`` steps."""
+        size = self.min_length
+        power = pow(_BASE, size - 1, _MOD)
+        buckets: Dict[int, List[Occurrence]] = defaultdict(list)
+        for index, steps in enumerate(encoded):
+            if len(steps) < size:
+                continue
+            value = 0
+            for step in steps[:size]:
+                value = (value * _BASE + step + 1) % _MOD
+            buckets[value].append((index, 0))
+            for end in range(size, len(steps)):
+                value = ((value - (steps[end - size] + 1) * power) * _BASE + steps[end] + 1) % _MOD
+                buckets[value].append((index, end - size + 1))
+
+        candidates: Dict[Tuple[int, ...], List[Occurrence]] = {}
+        for positions in buckets.values():
+            if len(positions) < self.min_occurrences:
+                continue
+            # Group by content, which also separates hash collisions.
+            windows: Dict[Tuple[int, ...], List[Occurrence]] = defaultdict(list)
+            for index, start in positions:
+                end = start + size
+                windows[tuple(encoded[index][start:end])].append((index, start))
+            for occurrences in windows.values():
+                occurrences = _non_overlapping(occurrences, size)
+                if len(occurrences) < self.min_occurrences:
+                    continue
+                if not _left_maximal(encoded, occurrences):
+                    continue
+                length = self._extend(encoded, occurrences, size)
+                if _saving(length, len(occurrences)) <= 0:
+                    continue
+                index, start = occurrences[0]
+                end = start + length
+                run = tuple(encoded[index][start:end])
+                if run not in candidates:
+                    candidates[run] = occurrences
+        return candidates
+
+    @staticmethod
+    def _extend(encoded: List[List[int]], occurrences: List[Occurrence], length: int) -> int:
+        """Return how far all occurrences can be extended while they stay identical."""
+        while True:
+            following = set()
+            for index, start in occurrences:
+                end = start + length
+                if end >= len(encoded[index]):
+                    return length
+                following.add(encoded[index][end])
+                if len(following) > 1:
+                    return length
+            if len(_non_overlapping(occurrences, length + 1)) < len(occurrences):
+                return length
+            length += 1
+
+    def _choose(
+        self,
+        encoded: List[List[int]],
+        candidates: Dict[Tuple[int, ...], List[Occurrence]],
+    ) -> List[Tuple[Tuple[int, ...], List[Occurrence]]]:
+        """Pick the candidates saving the most steps, without overlapping occurrences."""
+        ranked = sorted(
+            candidates.items(),
+            key=lambda item: _saving(len(item[0]), len(item[1])),
+            reverse=True,
+        )
+        covered = [bytearray(len(steps)) for steps in encoded]
+        chosen = []
+        for run, occurrences in ranked:
+            length = len(run)
+            free = [
+                (index, start)
+                for index, start in occurrences
+                if covered[index].find(1, start, start + length) == -1
+            ]
+            if len(free) < self.min_occurrences:
+                continue
+            for index, start in free:
+                end = start + length
+                covered[index][start:end] = b"\x01" * length
+            chosen.append((run, free))
+        return chosen
+
+
+def _non_overlapping(occurrences: List[Occurrence], length: int) -> List[Occurrence]:
+    """Drop occurrences that overlap an earlier one in the same sequence."""
+    result = []
+    last_end: Dict[int, int] = {}
+    for index, start in sorted(occurrences):
+        if start >= last_end.get(index, 0):
+            result.append((index, start))
+            last_end[index] = start + length
+    return result
+
+
+def _left_maximal(encoded: List[List[int]], occurrences: List[Occurrence]) -> bool:
+    """Return whether the occurrences do not all follow the same step."""
+    previous = set()
+    for index, start in occurrences:
+        if start == 0:
+            return True
+        previous.add(encoded[index][start - 1])
+        if len(previous) > 1:
+            return True
+    return False
+
+
+def _saving(length: int, occurrences: int) -> int:
+    """Steps saved by replacing ``occurrences`` runs of ``length`` steps with a keyword.
+
+    Each call still takes one line, and the definition repeats the steps once.
+    """
+    return occurrences * (length - 1) - length
@@ -0,0 +1,183 @@
+"""Incremental conversion of a codegen script that is still being recorded."""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    LINE_PARSERS,
+    PlaywrightToRobotConverter,
+)
+
+
+class LiveConverter:
+    """Keep a Robot Framework test file in sync with a growing Playwright script.
+
+    Every call to :meth:`update` compares the new script with the previous one line by
+    line, reparses only the statements after the longest unchanged prefix and rewrites
+    only the corresponding tail of the output file. The resulting file is always
+    identical to what :meth:`PlaywrightToRobotConverter.convert` would produce.
+
+    Optimizer rules may merge steps across lines and the AST backend parses whole
+    modules, so with an optimizer or ``parser="ast"`` the whole script is converted
+    again with the configured backend and the file rewritten on every change, like
+    :meth:`PlaywrightToRobotConverter.convert_incremental` does.
+
+    ``action_count`` is the number of steps in the file, ``parsed_count`` the number of
+    actions parsed from the script.
+    """
+
+    def __init__(
+        self,
+        output_file: str,
+        converter: Optional[PlaywrightToRobotConverter] = None,
+        test_name: str = "Recorded Test",
+        suite_name: str = "Recorded Test Suite",
+        browser: str = "chromium",
+        headless: bool = False,
+    ):
+        """Initialize the live converter.
+
+        Args:
+            output_file: Path of the Robot Framework test file to keep up to date
+            converter: Converter used for parsing and generation
+            test_name: Name for the test case
+            suite_name: Name for the test suite
+            browser: Browser type (chromium, firefox, webkit)
+            headless: Whether to run in headless mode
+        """
+        self.output_file = output_file
+        self.converter = converter or PlaywrightToRobotConverter()
+        self.test_name = test_name
+        self.suite_name = suite_name
+        self.browser = browser
+        self.headless = headless
+        self.action_count = 0
+        self.parsed_count = 0
+        self._source_lines: List[str] = []
+        # Per source line: its Robot line (or None), the output byte offset it starts at
+        # and the number of actions parsed from it.
+        self._emitted: List[Tuple[Optional[str], int, int]] = []
+        self._header_size = 0
+
+    def _write_header(self) -> None:
+        """Create the output file containing only the settings and browser setup."""
+        header = self.converter._generate_header(
+            self.test_name, self.suite_name, self.browser, self.headless
+        )
+        data = "".join(f"{line}\n" for line in header).encode("utf-8")
+        output_path = Path(self.output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(data)
+        self._header_size = len(data)
+
+    def update(self, playwright_code: str) -> int:
+        """Bring the output file up to date with ``playwright_code``.
+
+        Args:
+            playwright_code: Full current contents of the codegen script
+
+        Returns:
+            Number of source lines that were reparsed
+        """
+        new_lines = playwright_code.split("\n")
+        if self.converter.optimizer is not None or self.converter.parser not in LINE_PARSERS:
+            return self._rewrite(playwright_code, new_lines)
+        if not self._emitted and not self._source_lines:
+            self._write_header()
+
+        old_lines = self._source_lines
+        limit = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+
+        if prefix == len(old_lines) == len(new_lines):
+            return 0
+
+        offset = self._emitted[prefix][1] if prefix < len(self._emitted) else self._end_offset()
+        for robot_line, _, parsed in self._emitted[prefix:]:
+            if robot_line is not None:
+                self.action_count -= 1
+            self.parsed_count -= parsed
+        del self._emitted[prefix:]
+
+        chunks = []
+        position = offset
+        for line in new_lines[prefix:]:
+            robot_line = None
+            actions = self.converter._parse_playwright_code(line)
+            for action in actions:
+                robot_line = self.converter._convert_action(action)
+            self._emitted.append((robot_line, position, len(actions)))
+            self.parsed_count += len(actions)
+            if robot_line is not None:
+                self.action_count += 1
+                data = f"{self.converter.indent}{robot_line}\n".encode("utf-8")
+                chunks.append(data)
+                position += len(data)
+
+        with open(self.output_file, "r+b") as f:
+            f.seek(offset)
+            f.write(b"".join(chunks))
+            f.truncate()
+
+        self._source_lines = new_lines
+        return len(new_lines) - prefix
+
+    def _rewrite(self, playwright_code: str, new_lines: List[str]) -> int:
+        """Convert the whole script again and replace the output file with the result.
+
+        Returns:
+            Number of source lines that were reparsed
+        """
+        if new_lines == self._source_lines:
+            return 0
+        converter = self.converter
+        if converter.optimizer is not None:
+            # The report describes the latest conversion, not the sum of all updates.
+            converter.optimizer.reset()
+        parsed = converter._parse(playwright_code)
+        actions = converter._optimize(parsed)
+        header = converter._generate_header(
+            self.test_name, self.suite_name, self.browser, self.headless
+        )
+        body = list(converter._iter_test_body(actions))
+        data = "".join(f"{line}\n" for line in header + body).encode("utf-8")
+        output_path = Path(self.output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            f.write(data)
+        self.action_count = len(body)
+        self.parsed_count = len(parsed)
+        self._source_lines = new_lines
+        return len(new_lines)
+
+    def _end_offset(self) -> int:
+        """Byte offset just after the last emitted line."""
+        if not self._emitted:
+            return self._header_size
+        robot_line, position, _ = self._emitted[-1]
+        if robot_line is None:
+            return position
+        return position + len(f"{self.converter.indent}{robot_line}\n".encode("utf-8"))
+
+
+def read_if_changed(
+    path: str, last_stat: Optional[Tuple[int, int]]
+) -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+    """Read ``path`` if its size or modification time differs from ``last_stat``.
+
+    Returns:
+        The file contents (or None if unchanged or missing) and the new stat key
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None, last_stat
+    key = (stat.st_mtime_ns, stat.st_size)
+    if key == last_stat:
+        return None, last_stat
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read(), key
@@ -0,0 +1,189 @@
+"""Structured metrics of recording sessions, exported as JSON lines."""
+
+import itertools
+import json
+import os
+import re
+import threading
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple, Union
+
+from robotframework_browser_recorder.cache import package_version
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.converter.playwright_to_robot import PlaywrightToRobotConverter
+
+# Receives one metrics record per recording session.
+MetricsSink = Callable[[Dict], None]
+
+# Source lines that are recorded steps rather than codegen scaffolding: Python
+# statements, or actions of the JSON lines target (which has a header line without name).
+_STATEMENT_RE = re.compile(r'^(?:(?:await\s+)?(?:page\d*\.|expect\()|\{.*"name"\s*:)')
+
+
+def is_statement(line: str) -> bool:
+    """Return whether a source line is a recorded step (``page.*``, ``expect(...)``, JSON)."""
+    return _STATEMENT_RE.match(line.strip()) is not None
+
+
+@dataclass
+class SessionMetrics:
+    """Metrics of one recording session.
+
+    Durations are in seconds and measured from the start of :meth:`BrowserRecorder.record`
+    unless noted otherwise; values that could not be observed are None.
+    """
+
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    version: str = field(default_factory=package_version)
+    browser: str = "chromium"
+    parser: str = "regex"
+    live: bool = False
+    url: Optional[str] = None
+    output_file: Optional[str] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    codegen_start_seconds: Optional[float] = None
+    first_statement_seconds: Optional[float] = None
+    session_seconds: Optional[float] = None
+    conversion_seconds: float = 0.0
+    total_seconds: Optional[float] = None
+    statements: int = 0
+    actions: int = 0
+    robot_steps: int = 0
+    unconverted_lines: int = 0
+    output_bytes: Optional[int] = None
+
+    def convert(
+        self,
+        converter: PlaywrightToRobotConverter,
+        src: Iterable[str],
+        dst: TextIO,
+        test_name: str = "Recorded Test",
+    ) -> int:
+        """Convert a recording like :meth:`PlaywrightToRobotConverter.convert_stream`.
+
+        Statements, actions and steps are counted while the conversion reads, parses
+        and generates them, so nothing is parsed twice.
+
+        Args:
+            converter: Converter of the session
+            src: Lines of the recording
+            dst: Writable text file object for the Robot Framework test
+            test_name: Name for the test case
+
+        Returns:
+            Number of lines written
+        """
+        statements = 0
+
+        def read(lines: Iterable[str]) -> Iterator[str]:
+            nonlocal statements
+            for line in lines:
+                if is_statement(line):
+                    statements += 1
+                yield line
+
+        counts = self._write(converter, converter._read_actions(read(src)), dst, test_name)
+        self.set_counts(statements, *counts[:3])
+        return counts[3]
+
+    def convert_actions(
+        self,
+        converter: PlaywrightToRobotConverter,
+        actions: Iterable[Action],
+        dst: TextIO,
+        test_name: str = "Recorded Test",
+    ) -> int:
+        """Convert recorded actions like :meth:`PlaywrightToRobotConverter.convert_actions`.
+
+        Every action is one recorded statement.
+
+        Returns:
+            Number of lines written
+        """
+        counts = self._write(converter, actions, dst, test_name)
+        self.set_counts(counts[0], *counts[:3])
+        return counts[3]
+
+    @staticmethod
+    def _write(
+        converter: PlaywrightToRobotConverter,
+        actions: Iterable[Action],
+        dst: TextIO,
+        test_name: str,
+    ) -> Tuple[int, int, int, int]:
+        """Optimize, generate and write ``actions``, counting them on the way.
+
+        Returns:
+            Numbers of actions, optimized actions, steps and lines written
+        """
+        counts = [0, 0, 0]
+
+        def counting(items: Iterable, index: int) -> Iterator:
+            for item in items:
+                counts[index] += 1
+                yield item
+
+        optimized = converter._optimize(counting(actions, 0))
+        body = converter._iter_test_body(counting(optimized, 1))
+        header = converter._generate_header(test_name, "Recorded Test Suite", "chromium", False)
+        written = converter._write_lines(itertools.chain(header, counting(body, 2)), dst)
+        return counts[0], counts[1], counts[2], written
+
+    def set_counts(self, statements: int, actions: int, optimized: int, robot_steps: int) -> None:
+        """Fill in the statement, action, step and unconverted-line counts of a recording.
+
+        A statement is unconverted when no action is parsed from it or its action has no
+        Robot Framework equivalent; steps removed by the optimizer are not unconverted.
+
+        Args:
+            statements: Recorded statements in the source
+            actions: Actions parsed from them
+            optimized: Actions left after optimization
+            robot_steps: Robot Framework steps generated from those
+        """
+        self.statements = statements
+        self.actions = actions
+        self.robot_steps = robot_steps
+        self.unconverted_lines = statements - actions + optimized - robot_steps
+
+    def to_dict(self) -> Dict:
+        """Return the metrics as a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+class JsonLinesSink:
+    """Append metrics records to a file, one JSON document per line.
+
+    The file is opened for every record, so several recorders (and processes) can
+    share it and it can be rotated between sessions.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]):
+        """Initialize the sink.
+
+        Args:
+            path: File to append to; its directory is created on first write
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, record: Dict) -> None:
+        """Append ``record`` to the file."""
+        line = json.dumps(record, sort_keys=True) + "\n"
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def make_sink(target: Union[str, "os.PathLike[str]", MetricsSink]) -> MetricsSink:
+    """Return a sink for ``target``, a file path or a callable taking a record."""
+    if callable(target):
+        return target
+    return JsonLinesSink(target)
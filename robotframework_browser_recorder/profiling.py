@@ -0,0 +1,120 @@
+"""Per-stage timing of recording sessions and conversions."""
+
+import functools
+import json
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# Called with (stage, detail, seconds) whenever a profiled stage finishes.
+ProfileHook = Callable[[str, Optional[str], float], None]
+
+# Stages reported by the recorder and the converter.
+STAGES = (
+    "codegen_start",
+    "session",
+    "convert",
+    "parse",
+    "extract",
+    "simplify",
+    "generate",
+    "write",
+)
+
+
+class StageStats:
+    """Call count and accumulated wall time of one stage."""
+
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.seconds = 0.0
+
+    def to_dict(self) -> Dict:
+        """Return the statistics as a dictionary."""
+        return {"calls": self.calls, "seconds": self.seconds}
+
+
+class Profiler:
+    """Collect wall time and call counts per stage and per action type.
+
+    Stages are identified by a name from :data:`STAGES` and an optional detail, which
+    is the action type for the ``extract`` and ``generate`` stages. Times are inclusive:
+    ``extract`` contains the ``simplify`` calls it makes, ``convert`` contains parsing,
+    generation and writing. Callbacks registered with :meth:`add_hook` are called for
+    every finished stage, so library users can forward the events elsewhere.
+    """
+
+    def __init__(self, hooks: Optional[List[ProfileHook]] = None):
+        """Initialize the profiler.
+
+        Args:
+            hooks: Callbacks called with ``(stage, detail, seconds)`` per finished stage
+        """
+        self.stats: Dict[Tuple[str, Optional[str]], StageStats] = {}
+        self.hooks: List[ProfileHook] = list(hooks or [])
+
+    def add_hook(self, hook: ProfileHook) -> None:
+        """Register a callback for finished stages."""
+        self.hooks.append(hook)
+
+    def record(self, stage: str, seconds: float, detail: Optional[str] = None) -> None:
+        """Account ``seconds`` of wall time to a stage and notify the hooks."""
+        key = (stage, detail)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        for hook in self.hooks:
+            hook(stage, detail, seconds)
+
+    @contextmanager
+    def stage(self, stage: str, detail: Optional[str] = None) -> Iterator[None]:
+        """Time the body of a ``with`` block as one call of ``stage``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start, detail)
+
+    def wrap(self, func: Callable, stage: str, detail: Optional[str] = None) -> Callable:
+        """Return ``func`` wrapped so that each call is timed as one call of ``stage``."""
+        record = self.record
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def profiled(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(stage, perf_counter() - start, detail)
+
+        return profiled
+
+    def breakdown(self) -> List[Dict]:
+        """Return one record per stage and detail, the most expensive first."""
+        rows = [
+            {"stage": stage, "detail": detail, **stats.to_dict()}
+            for (stage, detail), stats in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows
+
+    def to_json(self) -> str:
+        """Return the breakdown as a JSON document."""
+        return json.dumps({"stages": self.breakdown()}, indent=2)
+
+    def format(self) -> str:
+        """Return the breakdown as a human-readable table."""
+        lines = [f"{'stage':<16} {'detail':<20} {'calls':>9} {'total ms':>11} {'per call us':>12}"]
+        for row in self.breakdown():
+            per_call = row["seconds"] / row["calls"] * 1e6 if row["calls"] else 0.0
+            lines.append(
+                f"{row['stage']:<16} {row['detail'] or '':<20} {row['calls']:>9} "
+                f"{row['seconds'] * 1000:>11.2f} {per_call:>12.1f}"
+            )
+        return "\n".join(lines)
@@ -1,11 +1,75 @@
 """Browser interaction recorder using Playwright codegen."""
 
+import contextlib
 import subprocess
-import tempfile
-import os
+import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Union
+
+from robotframework_browser_recorder.capture import CAPTURE_MODES, CodegenOutput
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
 from robotframework_browser_recorder.converter.playwright_to_robot import PlaywrightToRobotConverter
+from robotframework_browser_recorder.inprocess import InProcessRecorder
+from robotframework_browser_recorder.live import LiveConverter, read_if_changed
+from robotframework_browser_recorder.metrics import SessionMetrics, is_statement, make_sink
+from robotframework_browser_recorder.profiling import Profiler
+
+ENGINES = ("codegen", "inprocess")
+
+
+def codegen_command(
+    browser: str, output_path: str, url: Optional[str] = None, target: str = "python"
+) -> List[str]:
+    """Return the ``playwright codegen`` command line recording to ``output_path``."""
+    cmd = [
+        "playwright",
+        "codegen",
+        "--target",
+        target,
+        "-b",
+        browser,
+        "-o",
+        output_path,
+    ]
+
+    if url:
+        cmd.append(url)
+    return cmd
+
+
+def codegen_target(parser: str) -> str:
+    """Return the codegen ``--target`` whose output the parser backend reads."""
+    return "jsonl" if parser == "jsonl" else "python"
+
+
+def convert_recording(
+    converter: PlaywrightToRobotConverter,
+    source_path: str,
+    output_path: Path,
+    test_name: str,
+    metrics: Optional[SessionMetrics] = None,
+) -> None:
+    """Convert the script written by codegen to a Robot Framework test file.
+
+    With ``metrics``, the statements, actions and steps of the conversion are counted
+    into it.
+
+    Raises:
+        ValueError: If nothing was recorded
+    """
+    with open(source_path, "r") as src:
+        if not any(line.strip() for line in src):
+            raise ValueError("No code was recorded. Please perform some interactions.")
+        src.seek(0)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(output_path, "w") as dst:
+            if metrics is not None:
+                metrics.convert(converter, src, dst, test_name=test_name)
+            else:
+                converter.convert_stream(src, dst, test_name=test_name)
 
 
 class BrowserRecorder:
@@ -17,6 +81,14 @@ class BrowserRecorder:
         output_file: Optional[str] = None,
         test_name: Optional[str] = None,
         url: Optional[str] = None,
+        live: bool = False,
+        poll_interval: float = 0.5,
+        parser: str = "regex",
+        profiler: Optional[Profiler] = None,
+        metrics_sink: Optional[Union[str, Callable[[Dict], None]]] = None,
+        engine: str = "codegen",
+        optimizer: Optional[ActionOptimizer] = None,
+        capture: str = "file",
     ):
         """Initialize the browser recorder.
 
@@ -25,64 +97,286 @@ class BrowserRecorder:
             output_file: Path to save the Robot Framework test file
             test_name: Name of the test case
             url: Initial URL to navigate to
+            live: Keep the output file up to date while recording
+            poll_interval: Seconds between checks of the codegen output in live mode
+            parser: Parser backend of the converter (regex or ast); ``"jsonl"`` records
+                codegen's structured JSON lines target instead of a Python script
+            profiler: Profiler that times the session and conversion stages
+            metrics_sink: JSON lines file or callable that receives a metrics record
+                for every recording session
+            engine: ``"codegen"`` to run the ``playwright codegen`` CLI, or ``"inprocess"``
+                to drive the browser from this process and record structured events
+            optimizer: Optimizer that removes redundant steps from the recording
+            capture: Where codegen writes the recording, one of ``CAPTURE_MODES``:
+                ``"file"`` for a temporary file, ``"memory"`` for an in-memory file that
+                never touches the disk (Linux only, a temporary file elsewhere)
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of: {', '.join(ENGINES)}")
+        if live and engine != "codegen":
+            raise ValueError("Live mode is only supported with the codegen engine")
+        if capture not in CAPTURE_MODES:
+            raise ValueError(
+                f"Unknown capture mode {capture!r}, expected one of: {', '.join(CAPTURE_MODES)}"
+            )
         self.browser = browser
         self.output_file = output_file or "recorded_test.robot"
         self.test_name = test_name or "Recorded Test"
         self.url = url
-        self.converter = PlaywrightToRobotConverter()
+        self.live = live
+        self.engine = engine
+        self.capture = capture
+        self.poll_interval = poll_interval
+        self.profiler = profiler
+        self.metrics_sink = make_sink(metrics_sink) if metrics_sink is not None else None
+        self._metrics: Optional[SessionMetrics] = None
+        self._started = 0.0
+        self.converter = PlaywrightToRobotConverter(
+            parser=parser, profiler=profiler, optimizer=optimizer
+        )
 
     def record(self) -> str:
         """Start recording browser interactions.
 
+        When a metrics sink is configured, one :class:`SessionMetrics` record is emitted
+        per call, also when the session fails.
+
         Returns:
             Path to the generated Robot Framework test file
         """
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".py", delete=False) as tmp_file:
-            tmp_path = tmp_file.name
+        self._started = time.perf_counter()
+        self._metrics = None
+        if self.metrics_sink is not None:
+            self._metrics = SessionMetrics(
+                browser=self.browser,
+                parser=self.converter.parser,
+                live=self.live,
+                url=self.url,
+                output_file=self.output_file,
+            )
+
+        if self.engine == "inprocess":
+            return self._record_in_process()
+
+        target = codegen_target(self.converter.parser)
+        suffix = ".jsonl" if target == "jsonl" else ".py"
+        output = CodegenOutput(suffix, self.capture)
+        tmp_path = output.path
 
         try:
-            cmd = [
-                "playwright",
-                "codegen",
-                "--target",
-                "python",
-                "-b",
-                self.browser,
-                "-o",
-                tmp_path,
-            ]
-
-            if self.url:
-                cmd.append(self.url)
+            cmd = codegen_command(self.browser, tmp_path, self.url, target)
 
             print(f"Starting Playwright codegen with command: {' '.join(cmd)}")
-            print(f"Recording to temporary file: {tmp_path}")
+            print(f"Recording to {output.describe()}")
             print("\nPerform your browser interactions in the opened browser window.")
             print("Close the browser window when you're done recording.\n")
 
-            subprocess.run(cmd, check=True)
+            if self.live:
+                return self._record_live(cmd, output)
 
-            with open(tmp_path, "r") as f:
-                playwright_code = f.read()
+            process = self._start_codegen(cmd)
+            session_start = time.perf_counter()
+            try:
+                with self._stage("session"):
+                    self._wait(process, tmp_path)
+            except BaseException:
+                process.terminate()
+                process.wait()
+                raise
+            if self._metrics is not None:
+                self._metrics.session_seconds = time.perf_counter() - session_start
+            if process.returncode:
+                raise subprocess.CalledProcessError(process.returncode, cmd)
 
-            if not playwright_code.strip():
-                raise ValueError("No code was recorded. Please perform some interactions.")
+            output_path = Path(self.output_file)
 
-            robot_test = self.converter.convert(
-                playwright_code=playwright_code,
-                test_name=self.test_name,
-            )
+            conversion_start = time.perf_counter()
+            with self._stage("convert"):
+                convert_recording(
+                    self.converter, tmp_path, output_path, self.test_name, self._metrics
+                )
 
-            output_path = Path(self.output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._metrics is not None:
+                self._metrics.conversion_seconds = time.perf_counter() - conversion_start
+                self._metrics.output_bytes = output_path.stat().st_size
+
+            print(f"\nRecording complete! Robot Framework test saved to: {output_path}")
+            return str(output_path)
+
+        except BaseException as e:
+            self._fail_metrics(e)
+            raise
+
+        finally:
+            output.close()
+            if self._metrics is not None:
+                self._emit_metrics()
+
+    def _record_in_process(self) -> str:
+        """Record with :class:`InProcessRecorder` and convert its actions directly.
+
+        Returns:
+            Path to the generated Robot Framework test file
+        """
+        output_path = Path(self.output_file)
+        recorder = InProcessRecorder(browser=self.browser, url=self.url)
+        print(f"Starting {self.browser} with the in-process recorder.")
+        print("\nPerform your browser interactions in the opened browser window.")
+        print("Close the browser window when you're done recording.\n")
+
+        try:
+            session_start = time.perf_counter()
+            with self._stage("session"):
+                actions = recorder.record()
+            if self._metrics is not None:
+                self._metrics.session_seconds = time.perf_counter() - session_start
+
+            if not actions:
+                raise ValueError("No code was recorded. Please perform some interactions.")
+
+            conversion_start = time.perf_counter()
+            with self._stage("convert"):
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(output_path, "w") as dst:
+                    if self._metrics is not None:
+                        self._metrics.convert_actions(
+                            self.converter, actions, dst, test_name=self.test_name
+                        )
+                    else:
+                        dst.write(self.converter.convert_actions(actions, test_name=self.test_name))
 
-            with open(output_path, "w") as f:
-                f.write(robot_test)
+            if self._metrics is not None:
+                self._metrics.conversion_seconds = time.perf_counter() - conversion_start
+                self._metrics.output_bytes = output_path.stat().st_size
 
             print(f"\nRecording complete! Robot Framework test saved to: {output_path}")
             return str(output_path)
 
+        except BaseException as e:
+            self._fail_metrics(e)
+            raise
+
         finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            if self._metrics is not None:
+                self._emit_metrics()
+
+    def _record_live(self, cmd: List[str], output: CodegenOutput) -> str:
+        """Run codegen and convert its output incrementally while the session runs.
+
+        Args:
+            cmd: Codegen command line
+            output: File that codegen writes the recorded script to
+
+        Returns:
+            Path to the generated Robot Framework test file
+        """
+        output_path = Path(self.output_file)
+        live = LiveConverter(
+            output_file=str(output_path),
+            converter=self.converter,
+            test_name=self.test_name,
+        )
+        print(f"Live mode: {output_path} is updated while you record.")
+
+        process = self._start_codegen(cmd)
+        session_start = time.perf_counter()
+        last_stat = None
+        recorded = ""
+        try:
+            while True:
+                finished = process.poll() is not None
+                playwright_code, last_stat = read_if_changed(output.path, last_stat)
+                if playwright_code is not None:
+                    recorded = playwright_code
+                    self._check_first_statement(playwright_code)
+                    conversion_start = time.perf_counter()
+                    with self._stage("convert"):
+                        live.update(playwright_code)
+                    if self._metrics is not None:
+                        self._metrics.conversion_seconds += time.perf_counter() - conversion_start
+                if finished:
+                    break
+                time.sleep(self.poll_interval)
+        except BaseException:
+            process.terminate()
+            process.wait()
+            raise
+
+        session_seconds = time.perf_counter() - session_start
+        if self.profiler is not None:
+            self.profiler.record("session", session_seconds)
+        if self._metrics is not None:
+            self._metrics.session_seconds = session_seconds
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+
+        if not recorded.strip():
+            raise ValueError("No code was recorded. Please perform some interactions.")
+
+        if self._metrics is not None:
+            optimized = live.parsed_count
+            if self.converter.optimizer is not None:
+                optimized -= self.converter.optimizer.removed
+            statements = sum(1 for line in recorded.split("\n") if is_statement(line))
+            self._metrics.set_counts(statements, live.parsed_count, optimized, live.action_count)
+            self._metrics.output_bytes = output_path.stat().st_size
+
+        print(f"\nRecording complete! Robot Framework test saved to: {output_path}")
+        return str(output_path)
+
+    def _start_codegen(self, cmd: List[str]) -> subprocess.Popen:
+        """Start the codegen process, timing its startup as the ``codegen_start`` stage."""
+        with self._stage("codegen_start"):
+            process = subprocess.Popen(cmd)
+        if self._metrics is not None:
+            self._metrics.codegen_start_seconds = time.perf_counter() - self._started
+        return process
+
+    def _wait(self, process: subprocess.Popen, tmp_path: str) -> None:
+        """Wait for codegen to exit, watching for the first statement when collecting metrics."""
+        if self._metrics is None:
+            process.wait()
+            return
+
+        last_stat = None
+        while True:
+            try:
+                process.wait(timeout=self.poll_interval)
+                return
+            except subprocess.TimeoutExpired:
+                pass
+            if self._metrics.first_statement_seconds is None:
+                playwright_code, last_stat = read_if_changed(tmp_path, last_stat)
+                if playwright_code is not None:
+                    self._check_first_statement(playwright_code)
+
+    def _check_first_statement(self, playwright_code: str) -> None:
+        """Record when the first recorded statement appears in the codegen output."""
+        metrics = self._metrics
+        if metrics is None or metrics.first_statement_seconds is not None:
+            return
+        if any(is_statement(line) for line in playwright_code.split("\n")):
+            metrics.first_statement_seconds = time.perf_counter() - self._started
+
+    def _fail_metrics(self, error: BaseException) -> None:
+        """Mark the metrics of the current session as failed or cancelled."""
+        if self._metrics is not None:
+            cancelled = isinstance(error, KeyboardInterrupt)
+            self._metrics.status = "cancelled" if cancelled else "failed"
+            self._metrics.error = str(error) or type(error).__name__
+
+    def _emit_metrics(self) -> None:
+        """Pass the metrics of the finished session to the sink."""
+        metrics, sink = self._metrics, self.metrics_sink
+        assert metrics is not None and sink is not None
+        metrics.total_seconds = time.perf_counter() - self._started
+        try:
+            sink(metrics.to_dict())
+        except Exception as e:
+            print(f"Warning: could not export session metrics: {e}", file=sys.stderr)
+
+    def _stage(self, stage: str):
+        """Return a context manager that times ``stage`` when profiling is enabled."""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        return self.profiler.stage(stage)
@@ -0,0 +1,427 @@
+"""Local HTTP server that converts Playwright code with a pool of warm worker processes."""
+
+import collections
+import json
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from robotframework_browser_recorder.batch import init_worker, worker_converter
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import PARSERS
+
+# The server only listens on the loopback interface; it is meant for tools on the same
+# machine and has no authentication.
+HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+BROWSERS = ("chromium", "firefox", "webkit")
+
+# Latencies kept for the percentiles, and the window of the current throughput.
+LATENCY_SAMPLES = 10000
+THROUGHPUT_WINDOW = 60.0
+
+PERCENTILES = (50, 90, 95, 99)
+
+# Seconds the worker processes may take to start before the server gives up.
+WARM_UP_TIMEOUT = 120.0
+
+# A conversion job: code, test name, suite name, browser, headless, parser, optimize.
+Job = Tuple[str, str, str, str, bool, str, Optional[Tuple[str, ...]]]
+
+
+def _convert_job(job: Job) -> str:
+    """Convert the code of ``job`` with this worker's converter for its options."""
+    code, test_name, suite_name, browser, headless, parser, optimize = job
+    converter = worker_converter(parser, optimize)
+    return converter.convert(
+        playwright_code=code,
+        test_name=test_name,
+        suite_name=suite_name,
+        browser=browser,
+        headless=headless,
+    )
+
+
+def _warm_up(barrier: Any) -> int:
+    """Wait until every worker of the pool runs a warm-up job; return this worker's PID.
+
+    A worker blocked here cannot take another warm-up job, so the pool has to start one
+    process per job.
+    """
+    barrier.wait(WARM_UP_TIMEOUT)
+    return os.getpid()
+
+
+def parse_job(request: Any) -> Job:
+    """Validate the JSON body of a ``/convert`` request and turn it into a job.
+
+    The body is an object with the Playwright ``code`` and the optional ``test_name``,
+    ``suite_name``, ``browser``, ``headless``, ``parser`` and ``optimize`` (a list of
+    optimizer rules, or true for all of them).
+
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    if not isinstance(request, dict):
+        raise ValueError("The request body must be a JSON object")
+    code = request.get("code")
+    if not isinstance(code, str):
+        raise ValueError("'code' must be a string with the Playwright code")
+
+    def string(name: str, default: str, choices: Tuple[str, ...] = ()) -> str:
+        value = request.get(name, default)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"{name!r} must be a non-empty string")
+        if choices and value not in choices:
+            raise ValueError(f"{name!r} must be one of: {', '.join(choices)}")
+        return value
+
+    headless = request.get("headless", False)
+    if not isinstance(headless, bool):
+        raise ValueError("'headless' must be true or false")
+
+    optimize = request.get("optimize")
+    if optimize is True:
+        optimize = tuple(ActionOptimizer().rules)
+    elif optimize is False:
+        optimize = None
+    elif optimize is not None:
+        if not isinstance(optimize, list) or not all(isinstance(r, str) for r in optimize):
+            raise ValueError("'optimize' must be true, false or a list of rule names")
+        optimize = tuple(ActionOptimizer(optimize).rules)
+
+    return (
+        code,
+        string("test_name", "Recorded Test"),
+        string("suite_name", "Recorded Test Suite"),
+        string("browser", "chromium", BROWSERS),
+        headless,
+        string("parser", "regex", PARSERS),
+        optimize,
+    )
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Return the nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * percent / 100))
+    return sorted_values[rank - 1]
+
+
+class ServerMetrics:
+    """Request counts, latency percentiles and throughput of a conversion server.
+
+    Thread-safe; request handlers record into it concurrently.
+    """
+
+    def __init__(self, samples: int = LATENCY_SAMPLES, window: float = THROUGHPUT_WINDOW):
+        """Initialize the metrics.
+
+        Args:
+            samples: Number of most recent latencies the percentiles are computed from
+            window: Seconds over which the current throughput is measured
+        """
+        self.window = window
+        self.started = time.monotonic()
+        self.statuses: Dict[int, int] = collections.Counter()
+        self.rejected = 0
+        self._latencies: Deque[float] = collections.deque(maxlen=samples)
+        self._finished: Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+
+    def record(self, status: int, seconds: float) -> None:
+        """Record a finished ``/convert`` request."""
+        now = time.monotonic()
+        with self._lock:
+            self.statuses[status] += 1
+            if status == HTTPStatus.SERVICE_UNAVAILABLE:
+                self.rejected += 1
+                return
+            self._latencies.append(seconds)
+            self._finished.append(now)
+            self._expire(now)
+
+    def snapshot(self, **extra: Any) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serializable dictionary.
+
+        Args:
+            extra: Additional fields, such as the current queue length
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            latencies = sorted(self._latencies)
+            recent = len(self._finished)
+            statuses = dict(self.statuses)
+            rejected = self.rejected
+        uptime = now - self.started
+        requests = sum(statuses.values())
+        span = min(uptime, self.window)
+        throughput = recent / span if span > 0 else 0.0
+        latency_ms = {f"p{p}": round(percentile(latencies, p) * 1000, 3) for p in PERCENTILES}
+        latency_ms["max"] = round(latencies[-1] * 1000, 3) if latencies else 0.0
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "requests": requests,
+            "converted": statuses.get(HTTPStatus.OK, 0),
+            "rejected": rejected,
+            "errors": requests - statuses.get(HTTPStatus.OK, 0) - rejected,
+            "statuses": {str(status): count for status, count in sorted(statuses.items())},
+            "throughput_per_second": round(throughput, 3),
+            "latency_ms": latency_ms,
+            "latency_samples": len(latencies),
+            **extra,
+        }
+
+    def _expire(self, now: float) -> None:
+        """Drop finish times that fell out of the throughput window."""
+        cutoff = now - self.window
+        finished = self._finished
+        while finished and finished[0] < cutoff:
+            finished.popleft()
+
+
+class ConversionServer:
+    """HTTP server converting Playwright code with a pool of warm worker processes.
+
+    Each worker process creates its converters once, in the pool's initializer before
+    it takes its first job, so a request costs one conversion rather than an
+    interpreter start and imports.
+    Endpoints:
+
+    * ``POST /convert``: JSON body as described in :func:`parse_job`; responds with
+      ``{"robot": ...}``
+    * ``GET /metrics``: request counts, latency percentiles and throughput
+    * ``GET /health``: ``{"status": "ok"}``
+
+    At most ``workers`` requests are converted at a time and ``max_queue`` more wait for
+    a worker; further requests are rejected with 503 right away instead of piling up.
+    """
+
+    def __init__(
+        self,
+        port: int = DEFAULT_PORT,
+        workers: Optional[int] = None,
+        max_queue: int = 64,
+        max_body_bytes: int = 10 * 1024 * 1024,
+        verbose: bool = False,
+    ):
+        """Initialize the server.
+
+        Args:
+            port: Port on the loopback interface; 0 picks a free one
+            workers: Number of worker processes (default: CPU count)
+            max_queue: Number of requests that may wait for a busy worker
+            max_body_bytes: Largest accepted request body
+            verbose: Log every request to stderr
+
+        Raises:
+            ValueError: If ``workers`` or ``max_queue`` is out of range
+        """
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("The queue limit must not be negative")
+        self.port = port
+        self.max_queue = max_queue
+        self.max_body_bytes = max_body_bytes
+        self.verbose = verbose
+        self.metrics = ServerMetrics()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.worker_pids: List[int] = []
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._httpd: Optional[_HTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://{HOST}:{self.port}"
+
+    def start(self) -> None:
+        """Start and warm up the workers and bind the socket; see :meth:`serve_forever`."""
+        self._executor = self._start_pool()
+        self._httpd = _HTTPServer(self)
+        self.port = self._httpd.server_address[1]
+
+    def serve_forever(self) -> None:
+        """Handle requests until :meth:`shutdown` is called."""
+        assert self._httpd is not None, "start() must be called first"
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop :meth:`serve_forever`; call from another thread."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+
+    def close(self) -> None:
+        """Close the socket and stop the workers."""
+        if self._httpd is not None:
+            self._httpd.server_close()
+            self._httpd = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "ConversionServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def convert(self, job: Job) -> str:
+        """Convert ``job`` in a worker process, restarting the pool if a worker died.
+
+        Raises:
+            BrokenProcessPool: If the conversion killed its worker
+        """
+        executor = self._executor
+        assert executor is not None, "start() must be called first"
+        try:
+            return executor.submit(_convert_job, job).result()
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._start_pool()
+                    executor.shutdown(wait=False)
+            raise
+
+    def admit(self) -> bool:
+        """Reserve a place for a request; False if the workers and the queue are full."""
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                return False
+            self._pending += 1
+            return True
+
+    def release(self) -> None:
+        """Give back the place of a finished request."""
+        with self._lock:
+            self._pending -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the metrics together with the current load."""
+        with self._lock:
+            pending = self._pending
+        return self.metrics.snapshot(
+            workers=self.workers,
+            max_queue=self.max_queue,
+            in_flight=min(pending, self.workers),
+            queued=max(0, pending - self.workers),
+        )
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        """Start all worker processes; each creates its converters as it starts.
+
+        With the spawn and forkserver start methods, the pool only starts a process when
+        a job finds no idle worker. One warm-up job per worker, held back by a shared
+        barrier until all of them run, makes it start every process before serving.
+        """
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        try:
+            with multiprocessing.Manager() as manager:
+                barrier = manager.Barrier(self.workers)
+                futures = [executor.submit(_warm_up, barrier) for _ in range(self.workers)]
+                self.worker_pids = [future.result() for future in futures]
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        return executor
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """HTTP server that hands its requests to a :class:`ConversionServer`."""
+
+    daemon_threads = True
+
+    def __init__(self, app: ConversionServer):
+        super().__init__((HOST, app.port), _Handler)
+        self.app = app
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of :class:`ConversionServer`."""
+
+    server: _HTTPServer
+    server_version = "rfbrowser-record"
+
+    def do_GET(self) -> None:
+        app = self.server.app
+        if self.path == "/metrics":
+            self._send(HTTPStatus.OK, app.snapshot())
+        elif self.path == "/health":
+            self._send(HTTPStatus.OK, {"status": "ok", "workers": app.workers})
+        elif self.path == "/convert":
+            self._send(HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Use POST"})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"No such endpoint: {self.path}"})
+
+    def do_POST(self) -> None:
+        if self.path != "/convert":
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"No such endpoint: {self.path}"})
+            return
+        app = self.server.app
+        start = time.perf_counter()
+        status, body = self._convert(app)
+        app.metrics.record(status, time.perf_counter() - start)
+        self._send(status, body)
+
+    def _convert(self, app: ConversionServer) -> Tuple[int, Dict[str, Any]]:
+        """Read, validate and convert a request; return the status and response body."""
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self.close_connection = True
+            return HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length is required"}
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        # Checked before reading: rfile.read() waits for the connection to close on a
+        # negative length.
+        if length < 0:
+            self.close_connection = True
+            return HTTPStatus.BAD_REQUEST, {"error": "Content-Length must be a number of bytes"}
+        if length > app.max_body_bytes:
+            self.close_connection = True
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {
+                "error": f"The request body exceeds {app.max_body_bytes} bytes"
+            }
+        try:
+            job = parse_job(json.loads(self.rfile.read(length)))
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+
+        if not app.admit():
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Too many queued requests"}
+        try:
+            return HTTPStatus.OK, {"robot": app.convert(job)}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Conversion failed: {e}"}
+        finally:
+            app.release()
+
+    def _send(self, status: int, body: Dict[str, Any]) -> None:
+        """Send ``body`` as a JSON response."""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.app.verbose:
+            super().log_message(format, *args)
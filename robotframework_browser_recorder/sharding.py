@@ -0,0 +1,236 @@
+"""Runtime-balanced sharding of recorded tests for parallel runs with pabot."""
+
+import heapq
+import re
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from robotframework_browser_recorder.converter.actions import Action, ActionType
+from robotframework_browser_recorder.suite import SuiteBuilder, SuiteTest
+
+# Browser keywords counted as navigation and waits when learning from output.xml;
+# every other Browser keyword counts as an interaction.
+GOTO_KEYWORDS = frozenset({"New Page", "Go To"})
+WAIT_PREFIX = "Wait "
+
+ORDERING_FILE = "pabot_order.txt"
+
+
+@dataclass
+class RuntimeWeights:
+    """Estimated seconds per test and per kind of step.
+
+    ``test`` covers the per-test overhead, such as creating and closing the browser
+    context; ``goto``, ``wait`` and ``interaction`` are added for every navigation,
+    explicit wait and other step of the test.
+    """
+
+    test: float = 1.0
+    goto: float = 1.5
+    wait: float = 1.0
+    interaction: float = 0.25
+
+    def estimate(self, actions: Iterable[Action]) -> float:
+        """Return the estimated runtime in seconds of a test with ``actions``."""
+        runtime = self.test
+        for action in actions:
+            if action.type == ActionType.GOTO:
+                runtime += self.goto
+            elif action.type == ActionType.WAIT_FOR_LOAD_STATE:
+                runtime += self.wait
+            else:
+                runtime += self.interaction
+        return runtime
+
+    @classmethod
+    def parse(cls, spec: str) -> "RuntimeWeights":
+        """Create weights from ``name=seconds`` pairs, e.g. ``goto=2.5,wait=1``.
+
+        Raises:
+            ValueError: If a name is unknown or a value is not a non-negative number
+        """
+        names = [field.name for field in fields(cls)]
+        values: Dict[str, float] = {}
+        for item in filter(None, (part.strip() for part in spec.split(","))):
+            name, _, value = item.partition("=")
+            name = name.strip()
+            if name not in names:
+                raise ValueError(f"Unknown weight '{name}', expected any of: {', '.join(names)}")
+            try:
+                values[name] = float(value)
+            except ValueError:
+                raise ValueError(f"Weight '{name}' must be a number, got '{value}'") from None
+            if values[name] < 0:
+                raise ValueError(f"Weight '{name}' must not be negative")
+        return cls(**values)
+
+    @classmethod
+    def from_output_xml(
+        cls, paths: Iterable[str], defaults: Optional["RuntimeWeights"] = None
+    ) -> "RuntimeWeights":
+        """Learn weights from the timings of earlier runs.
+
+        The average elapsed time of Browser keywords gives ``goto`` (``New Page``,
+        ``Go To``), ``wait`` (``Wait ...`` keywords) and ``interaction`` (all others).
+        ``test`` is the average time a test spends outside of its Browser keywords,
+        mostly in its setup and teardown. Weights without any timings keep the value
+        from ``defaults``.
+
+        Args:
+            paths: ``output.xml`` files written by Robot Framework
+            defaults: Fallback weights; the class defaults if None
+
+        Returns:
+            The learned weights
+        """
+        from robot.api import ExecutionResult
+
+        totals = {field.name: 0.0 for field in fields(cls)}
+        counts = {field.name: 0 for field in fields(cls)}
+
+        def visit(body) -> float:
+            spent = 0.0
+            for item in body:
+                library = getattr(item, "libname", None)
+                if library == "Browser":
+                    name = item.kwname
+                    if name in GOTO_KEYWORDS:
+                        kind = "goto"
+                    elif name.startswith(WAIT_PREFIX):
+                        kind = "wait"
+                    else:
+                        kind = "interaction"
+                    elapsed = _elapsed(item)
+                    totals[kind] += elapsed
+                    counts[kind] += 1
+                    spent += elapsed
+                else:
+                    spent += visit(getattr(item, "body", ()))
+            return spent
+
+        for path in paths:
+            for test in ExecutionResult(path).suite.all_tests:
+                elapsed = _elapsed(test)
+                totals["test"] += max(0.0, elapsed - visit(test.body))
+                counts["test"] += 1
+
+        weights = defaults or cls()
+        learned = {
+            name: totals[name] / counts[name] if counts[name] else getattr(weights, name)
+            for name in totals
+        }
+        return cls(**learned)
+
+
+def _elapsed(item) -> float:
+    """Return the elapsed seconds of a result object of any Robot Framework version."""
+    elapsed = getattr(item, "elapsed_time", None)
+    if elapsed is not None:
+        return elapsed.total_seconds()
+    return item.elapsedtime / 1000
+
+
+@dataclass
+class Shard:
+    """Tests assigned to one shard and their estimated total runtime."""
+
+    tests: List[SuiteTest]
+    runtime: float = 0.0
+
+
+def plan_shards(
+    tests: List[SuiteTest], count: int, weights: Optional[RuntimeWeights] = None
+) -> List[Shard]:
+    """Spread tests over ``count`` shards with roughly equal estimated runtimes.
+
+    Tests are assigned longest first, each to the shard with the lowest runtime so far,
+    which keeps the longest shard within 4/3 of the optimum. Within a shard, tests keep
+    their original order. Empty shards are dropped when there are fewer tests than
+    shards.
+
+    Args:
+        tests: Tests to distribute
+        count: Number of shards
+        weights: Runtime estimation weights; the defaults if None
+
+    Returns:
+        The shards
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    weights = weights or RuntimeWeights()
+    estimates = [(weights.estimate(test.actions), index) for index, test in enumerate(tests)]
+    estimates.sort(key=lambda item: (-item[0], item[1]))
+
+    loads = [(0.0, number) for number in range(count)]
+    assigned: List[List[int]] = [[] for _ in range(count)]
+    runtimes = [0.0] * count
+    for runtime, index in estimates:
+        load, number = heapq.heappop(loads)
+        assigned[number].append(index)
+        runtimes[number] = load + runtime
+        heapq.heappush(loads, (load + runtime, number))
+
+    return [
+        Shard(tests=[tests[index] for index in sorted(indexes)], runtime=runtime)
+        for indexes, runtime in zip(assigned, runtimes)
+        if indexes
+    ]
+
+
+def suite_name(path: str) -> str:
+    """Return the suite name Robot Framework derives from a file or directory name.
+
+    Only the extension of ``.robot`` files is dropped; directory names are used whole,
+    dots included.
+    """
+    source = Path(path)
+    base = source.stem if source.suffix == ".robot" and not source.is_dir() else source.name
+    name = re.sub(r"^\d+__", "", base).replace("_", " ").strip()
+    return name.title() if name.islower() else name
+
+
+def write_shards(
+    builder: SuiteBuilder,
+    output_dir: str,
+    count: int,
+    weights: Optional[RuntimeWeights] = None,
+) -> Tuple[List[Tuple[str, Shard]], str]:
+    """Write the tests of ``builder`` as shard suites plus a pabot ordering file.
+
+    Every shard is a suite like :meth:`SuiteBuilder.build` writes it, named
+    ``shard_01.robot``, ``shard_02.robot``, ... The ordering file lists the shards
+    longest first, so pabot starts the slowest ones early:
+    ``pabot --ordering <output_dir>/pabot_order.txt <output_dir>``.
+
+    Args:
+        builder: Suite holding the tests and the generation settings
+        output_dir: Directory for the shard files and the ordering file
+        count: Number of shards
+        weights: Runtime estimation weights; the defaults if None
+
+    Returns:
+        The written shard files with their shards, and the path of the ordering file
+    """
+    shards = plan_shards(builder.tests, count, weights)
+    directory = Path(output_dir)
+    width = max(2, len(str(len(shards))))
+    written = []
+    for number, shard in enumerate(shards, 1):
+        part = SuiteBuilder(
+            converter=builder.converter,
+            browser=builder.browser,
+            headless=builder.headless,
+            keyword_extractor=builder.keyword_extractor,
+        )
+        part.tests = list(shard.tests)
+        written.append((part.write(str(directory / f"shard_{number:0{width}d}.robot")), shard))
+
+    top = suite_name(str(directory.resolve()))
+    ranked = sorted(written, key=lambda item: item[1].runtime, reverse=True)
+    ordering = directory / ORDERING_FILE
+    ordering.write_text(
+        "".join(f"--suite {top}.{suite_name(path)}\n" for path, _ in ranked), encoding="utf-8"
+    )
+    return written, str(ordering)
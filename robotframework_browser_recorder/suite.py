@@ -0,0 +1,139 @@
+"""Assembly of several recordings into one Robot Framework suite."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from robotframework_browser_recorder.batch import collect_sources, name_from_path
+from robotframework_browser_recorder.converter.actions import Action, ActionType
+from robotframework_browser_recorder.converter.playwright_to_robot import PlaywrightToRobotConverter
+from robotframework_browser_recorder.keywords import Keyword, KeywordExtractor
+
+
+@dataclass
+class SuiteTest:
+    """One test case of a suite: its name and recorded actions."""
+
+    name: str
+    actions: List[Action]
+
+
+class SuiteBuilder:
+    """Combine recordings into a single suite that launches the browser only once.
+
+    The browser is started in ``Suite Setup`` and closed in ``Suite Teardown``. Every
+    test gets its own browser context in ``Test Setup``, which is closed again in
+    ``Test Teardown``, so tests stay isolated without paying for a browser launch each.
+    With a ``keyword_extractor``, step runs repeated across tests are moved to
+    ``*** Keywords ***`` and called from the tests.
+    """
+
+    def __init__(
+        self,
+        converter: Optional[PlaywrightToRobotConverter] = None,
+        browser: str = "chromium",
+        headless: bool = False,
+        keyword_extractor: Optional[KeywordExtractor] = None,
+    ):
+        """Initialize an empty suite.
+
+        Args:
+            converter: Converter used for parsing and generation
+            browser: Browser type (chromium, firefox, webkit)
+            headless: Whether to run in headless mode
+            keyword_extractor: Extractor for repeated steps; no extraction if None
+        """
+        self.converter = converter or PlaywrightToRobotConverter()
+        self.browser = browser
+        self.headless = headless
+        self.keyword_extractor = keyword_extractor
+        self.tests: List[SuiteTest] = []
+        # Keywords extracted by the last build.
+        self.keywords: List[Keyword] = []
+
+    def add(self, playwright_code: str, test_name: str) -> SuiteTest:
+        """Add a recording as a test case.
+
+        Test names are made unique by appending a number to repeated names.
+
+        Args:
+            playwright_code: Python code generated by Playwright codegen
+            test_name: Name for the test case
+
+        Returns:
+            The added test
+        """
+        actions = list(self.converter._optimize(self.converter._parse(playwright_code)))
+        return self.add_actions(actions, test_name)
+
+    def add_actions(self, actions: Iterable[Action], test_name: str) -> SuiteTest:
+        """Add already recorded actions as a test case, see :meth:`add`."""
+        names = {test.name for test in self.tests}
+        name = test_name
+        number = 2
+        while name in names:
+            name = f"{test_name} {number}"
+            number += 1
+        test = SuiteTest(name=name, actions=list(actions))
+        self.tests.append(test)
+        return test
+
+    def add_file(self, path: str, test_name: Optional[str] = None) -> SuiteTest:
+        """Add a codegen script, named after its file unless ``test_name`` is given."""
+        with open(path, "r", encoding="utf-8") as f:
+            return self.add(f.read(), test_name or name_from_path(path))
+
+    def add_files(self, inputs: Iterable[str], pattern: str = "*.py") -> List[SuiteTest]:
+        """Add every script matched by files, directories or glob patterns in ``inputs``."""
+        return [self.add_file(source) for source, _ in collect_sources(inputs, pattern)]
+
+    def build(self) -> str:
+        """Return the suite as Robot Framework source."""
+        indent = self.converter.indent
+        lines = [
+            "*** Settings ***",
+            "Library    Browser",
+            f"Suite Setup{indent}New Browser{indent}{self.browser}{indent}headless={self.headless}",
+            f"Suite Teardown{indent}Close Browser{indent}ALL",
+            f"Test Setup{indent}New Context{indent}viewport={{'width': 1920, 'height': 1080}}",
+            f"Test Teardown{indent}Close Context",
+            "",
+            "",
+            "*** Test Cases ***",
+        ]
+        bodies = []
+        for test in self.tests:
+            body = []
+            # A fresh context has no page; recordings normally open one with goto.
+            if not test.actions or test.actions[0].type != ActionType.GOTO:
+                body.append(f"{indent}New Page")
+            body.extend(self.converter._iter_test_body(test.actions))
+            bodies.append(body)
+
+        keywords: List[Keyword] = []
+        if self.keyword_extractor is not None:
+            keywords, bodies = self.keyword_extractor.extract(bodies, indent)
+        self.keywords = keywords
+
+        for number, (test, body) in enumerate(zip(self.tests, bodies)):
+            if number:
+                lines.append("")
+            lines.append(test.name)
+            lines.extend(body)
+
+        if keywords:
+            lines.extend(["", "", "*** Keywords ***"])
+            for number, keyword in enumerate(keywords):
+                if number:
+                    lines.append("")
+                lines.append(keyword.name)
+                lines.extend(keyword.steps)
+        lines.append("")
+        return "\n".join(lines)
+
+    def write(self, output_file: str) -> str:
+        """Write the suite to ``output_file`` and return its path."""
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(self.build(), encoding="utf-8")
+        return str(output_path)
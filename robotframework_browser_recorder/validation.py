@@ -0,0 +1,168 @@
+"""Syntax validation of generated tests with Robot Framework's own parser."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import PlaywrightToRobotConverter
+
+# Number of arguments (minimum, maximum) of every keyword the converter emits. A
+# different count means that a value was split into extra cells by an unescaped
+# separator, or that a cell was swallowed, e.g. by a ``#`` that starts a comment.
+KEYWORD_ARGUMENTS: Dict[str, Tuple[int, int]] = {
+    "New Browser": (2, 2),
+    "New Context": (1, 1),
+    "New Page": (0, 1),
+    "Click": (1, 2),
+    "Fill Text": (2, 2),
+    "Type Text": (3, 3),
+    "Keyboard Key": (2, 2),
+    "Select Options By": (3, 3),
+    "Check Checkbox": (1, 1),
+    "Uncheck Checkbox": (1, 1),
+    "Hover": (1, 1),
+    "Upload File By Selector": (2, 2),
+    "Wait For Load State": (1, 1),
+    "Take Screenshot": (1, 1),
+    "Get Element States": (3, 3),
+    "Get Text": (3, 3),
+    "Get Property": (4, 4),
+    "Get Checkbox State": (3, 3),
+    "Get Url": (2, 2),
+    "Get Title": (2, 2),
+}
+
+
+@dataclass
+class ValidationIssue:
+    """A problem found in a generated test.
+
+    ``line`` is the 1-based line in the Robot Framework file; ``source_line`` and
+    ``statement`` identify the Playwright statement that produced it, when known.
+    """
+
+    line: int
+    message: str
+    source_line: Optional[int] = None
+    statement: Optional[str] = None
+
+    def format(self, robot_file: str = "", source_file: str = "") -> str:
+        """Return the issue as ``file:line: message``, followed by its source statement."""
+        text = f"{robot_file}:{self.line}: {self.message}"
+        if self.source_line is not None:
+            text += f"\n    from {source_file}:{self.source_line}: {self.statement}"
+        return text
+
+
+def validate_robot(source: Union[str, Path]) -> List[ValidationIssue]:
+    """Parse a Robot Framework file with ``robot.api.get_model`` and report problems.
+
+    Besides the parser's own errors this reports malformed variables (``${`` that is
+    never closed) and calls of the Browser keywords emitted by the converter with a
+    wrong number of arguments.
+
+    Args:
+        source: Path of the file, or its content (like ``get_model`` accepts)
+
+    Returns:
+        Issues in line order
+    """
+    from robot.api import get_model
+    from robot.api.parsing import KeywordCall, ModelVisitor
+    from robot.errors import VariableError
+    from robot.variables import search_variable
+
+    issues: List[ValidationIssue] = []
+
+    def check_variables(lineno: int, value: str) -> None:
+        while True:
+            try:
+                match = search_variable(value, ignore_errors=False)
+            except VariableError as e:
+                issues.append(ValidationIssue(lineno, f"{e} Escape '$' as '\\$' in values."))
+                return
+            if not match:
+                return
+            value = match.after
+
+    class Visitor(ModelVisitor):
+        def generic_visit(self, node):
+            for error in getattr(node, "errors", ()) or ():
+                issues.append(ValidationIssue(node.lineno, error))
+            super().generic_visit(node)
+
+        def visit_KeywordCall(self, node: KeywordCall):
+            for error in node.errors:
+                issues.append(ValidationIssue(node.lineno, error))
+            for value in (node.keyword or "",) + node.args:
+                check_variables(node.lineno, value)
+
+            expected = KEYWORD_ARGUMENTS.get(node.keyword)
+            if expected is not None and not expected[0] <= len(node.args) <= expected[1]:
+                count = f"{expected[0]}" if expected[0] == expected[1] else "%d-%d" % expected
+                message = f"'{node.keyword}' expects {count} arguments, got {len(node.args)}."
+                if node.get_token("COMMENT") is not None:
+                    message += (
+                        " A value starting with '#' is read as a comment; escape it as '\\#'."
+                    )
+                elif len(node.args) > expected[1]:
+                    message += " A value contains an unescaped separator (two or more spaces)."
+                issues.append(ValidationIssue(node.lineno, message))
+
+    Visitor().visit(get_model(source))
+    issues.sort(key=lambda issue: issue.line)
+    return issues
+
+
+def source_line_map(
+    converter: PlaywrightToRobotConverter, playwright_code: str
+) -> Dict[int, Tuple[int, str]]:
+    """Map Robot Framework line numbers to the Playwright statements that produced them.
+
+    The code is parsed with the converter's backend and optimized with its rules, and
+    every emitted step is mapped to the source line its action was parsed from. A step
+    merged by the optimizer is attributed to the first statement of the merge; a
+    statement spanning several lines to its first line.
+
+    Returns:
+        Robot line number -> (source line number, stripped statement)
+    """
+    actions = converter._parse(playwright_code)
+    if converter.optimizer is not None:
+        # A fresh optimizer with the same rules, so the converter's report is left alone.
+        actions = ActionOptimizer(converter.optimizer.rules).optimize(actions)
+    source_lines = playwright_code.split("\n")
+    header = converter._generate_header("", "", "", False)
+    robot_line = len(header)
+    mapping = {}
+    for action in actions:
+        if converter._convert_action(action):
+            robot_line += 1
+            if action.line is not None:
+                mapping[robot_line] = (action.line, source_lines[action.line - 1].strip())
+    return mapping
+
+
+def validate_file(
+    robot_path: str,
+    source_path: Optional[str] = None,
+    converter: Optional[PlaywrightToRobotConverter] = None,
+) -> List[ValidationIssue]:
+    """Validate a generated test, mapping issues back to the source when it is given.
+
+    Args:
+        robot_path: Generated Robot Framework file
+        source_path: Playwright script the file was generated from
+        converter: Converter that generated the file
+
+    Returns:
+        Issues in line order
+    """
+    issues = validate_robot(Path(robot_path))
+    if issues and source_path is not None:
+        with open(source_path, "r", encoding="utf-8") as f:
+            mapping = source_line_map(converter or PlaywrightToRobotConverter(), f.read())
+        for issue in issues:
+            issue.source_line, issue.statement = mapping.get(issue.line, (None, None))
+    return issues
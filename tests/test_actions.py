@@ -0,0 +1,64 @@
+"""Tests for the typed action records."""
+
+import pickle
+
+import pytest
+
+from robotframework_browser_recorder.converter.actions import Action, ActionType
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+
+class TestAction:
+    """Test cases for Action."""
+
+    def test_type_is_interned_enum(self):
+        """Test that plain type names map to the shared enum member."""
+        action = Action("click", "#submit")
+        assert action.type is ActionType.CLICK
+        assert action.type == "click"
+        assert str(action.type) == "click"
+
+    def test_dictionary_view(self):
+        """Test that actions can be read like the original dictionaries."""
+        action = Action("press", "#search", "Enter")
+        assert action["type"] == "press"
+        assert action["key"] == "Enter"
+        assert action.get("value") is None
+        assert dict(action) == {"type": "press", "selector": "#search", "key": "Enter"}
+        assert action == {"type": "press", "selector": "#search", "key": "Enter"}
+        with pytest.raises(KeyError):
+            action["url"]
+
+    def test_from_dict_round_trip(self):
+        """Test converting between the dictionary format and actions."""
+        data = {"type": "set_input_files", "selector": "#upload", "file_path": "a.pdf"}
+        action = Action.from_dict(data)
+        assert action.value == "a.pdf"
+        assert action.to_dict() == data
+
+    def test_pickle(self):
+        """Test that actions survive pickling for worker processes."""
+        action = Action("goto", value="https://example.com")
+        assert pickle.loads(pickle.dumps(action)) == action
+
+    def test_source_line(self):
+        """Test that the source line is recorded by parsers but not compared."""
+        converter = PlaywrightToRobotConverter()
+        actions = converter._parse('# login\npage.goto("https://example.com")\npage.click("#a")')
+        assert [action.line for action in actions] == [2, 3]
+        assert actions[1] == Action("click", "#a")
+        assert "line" not in actions[1]
+        assert pickle.loads(pickle.dumps(actions[1])).line == 3
+
+    def test_custom_type(self):
+        """Test that types outside the enum are kept as interned strings."""
+        action = Action("drag_to", "#a", "#b")
+        assert action.type == "drag_to"
+        assert action["value"] == "#b"
+
+    def test_generator_accepts_dictionaries(self):
+        """Test that dictionary actions can still be passed to the generator."""
+        converter = PlaywrightToRobotConverter()
+        assert converter._convert_action({"type": "click", "selector": "#a"}) == "Click    #a"
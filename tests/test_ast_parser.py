@@ -0,0 +1,117 @@
+"""Tests for the AST parser backend."""
+
+import gc
+
+import pytest
+
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+CODEGEN_SCRIPT = """import re
+from playwright.sync_api import Playwright, sync_playwright, expect
+
+
+def run(playwright: Playwright) -> None:
+    browser = playwright.chromium.launch(headless=False)
+    context = browser.new_context()
+    page = context.new_page()
+    page.goto("https://example.com/login")
+    page.fill("#username", "user1")
+    page.locator("#password").fill("pass123")
+    page.get_by_role("row", name="Test").get_by_role("link").click()
+    page.get_by_text("Login").click()
+    page.locator("#country").select_option("USA")
+    page.locator("#upload").set_input_files("document.pdf")
+    page.press("#search", "Enter")
+    page.wait_for_load_state()
+    page.screenshot(path="shot.png")
+    expect(page).to_have_url("https://example.com/dashboard")
+    expect(page.locator("#welcome-message")).to_have_text("Welcome, user1!")
+    expect(page.locator("#agree")).to_be_checked()
+
+    context.close()
+    browser.close()
+
+
+with sync_playwright() as playwright:
+    run(playwright)
+"""
+
+
+class TestAstParser:
+    """Test cases for the AST parser backend."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = PlaywrightToRobotConverter(parser="ast")
+
+    def test_matches_regex_parser_on_codegen_script(self):
+        """Test that both backends produce the same actions for a typical recording."""
+        regex_converter = PlaywrightToRobotConverter()
+        expected = regex_converter._parse_playwright_code(CODEGEN_SCRIPT)
+        assert self.converter._parse(CODEGEN_SCRIPT) == expected
+        assert self.converter.convert(CODEGEN_SCRIPT) == regex_converter.convert(CODEGEN_SCRIPT)
+
+    def test_statement_split_over_lines(self):
+        """Test a statement that spans several lines."""
+        playwright_code = """page.get_by_role(
+    "button",
+    name="Sign in",
+).click()
+"""
+        actions = self.converter._parse(playwright_code)
+        assert actions == [{"type": "click", "selector": "role=button[name='Sign in']"}]
+
+    def test_nested_quotes_and_f_strings(self):
+        """Test string literals with nested quotes and f-string placeholders."""
+        playwright_code = """page.get_by_label("Name").fill('He said "hi"')
+page.goto(f"{base_url}/login")
+"""
+        actions = self.converter._parse(playwright_code)
+        assert actions == [
+            {"type": "fill", "selector": "Name", "value": 'He said "hi"'},
+            {"type": "goto", "url": "${base_url}/login"},
+        ]
+
+    def test_locator_keyword_arguments(self):
+        """Test exact= and has_text= keyword arguments and chained first/nth."""
+        playwright_code = """page.get_by_text("Save", exact=True).click()
+page.get_by_role("button", name="Go", exact=True).click()
+page.locator("li", has_text="Apples").first.click()
+page.get_by_role("row").nth(2).check()
+"""
+        selectors = [action["selector"] for action in self.converter._parse(playwright_code)]
+        assert selectors == [
+            'text="Save"',
+            "role=button[name='Go' s]",
+            'li:has-text("Apples") >> nth=0',
+            "role=row >> nth=2",
+        ]
+
+    def test_expect_selector_uses_locator_format(self):
+        """Test that locators inside expect() are formatted like action locators."""
+        playwright_code = 'expect(page.get_by_test_id("title")).to_be_visible()'
+        actions = self.converter._parse(playwright_code)
+        assert actions == [{"type": "expect_visible", "selector": "data-testid=title"}]
+
+    def test_invalid_python_falls_back_to_regex_parser(self):
+        """Test that code which does not compile is parsed line by line."""
+        playwright_code = 'page.goto("https://example.com")\npage.click("#submit"'
+        actions = self.converter._parse(playwright_code)
+        assert actions == [{"type": "goto", "url": "https://example.com"}]
+
+    def test_leaves_garbage_collection_alone(self, monkeypatch):
+        """Test that parsing does not switch the process-wide garbage collector."""
+
+        def fail():
+            raise AssertionError("gc.disable() was called")
+
+        monkeypatch.setattr(gc, "disable", fail)
+        assert self.converter._parse(CODEGEN_SCRIPT)
+        assert gc.isenabled()
+
+    def test_unknown_parser(self):
+        """Test that an unknown parser backend is rejected."""
+        with pytest.raises(ValueError):
+            PlaywrightToRobotConverter(parser="tokens")
@@ -0,0 +1,283 @@
+"""Tests for concurrent recording with asyncio."""
+
+import argparse
+import asyncio
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robotframework_browser_recorder.async_recorder import (
+    AsyncBrowserRecorder,
+    record_concurrently,
+)
+from robotframework_browser_recorder.cli.main import main, parse_session
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+CODE = 'page.goto("https://example.com")\npage.click("#go")\n'
+
+# Stand-in for the playwright CLI. The URL argument selects its behaviour:
+# "sleep:<seconds>", "fail", "ignore-term" to ignore SIGTERM and hang, "spawn" to start
+# a long-running child like the browser, or anything else to exit at once. PIDs are
+# written to the directory in $FAKE_PLAYWRIGHT_PIDS.
+FAKE_PLAYWRIGHT = f"""#!{sys.executable}
+import os, signal, subprocess, sys, time
+args = sys.argv[1:]
+output = args[args.index("-o") + 1]
+url = args[-1]
+if url == "ignore-term":
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+pid_dir = os.environ["FAKE_PLAYWRIGHT_PIDS"]
+with open(os.path.join(pid_dir, f"{{os.getpid()}}.pid"), "w") as f:
+    f.write(str(os.getpid()))
+if url == "fail":
+    sys.exit(1)
+if url == "ignore-term":
+    time.sleep(30)
+if url == "spawn":
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    with open(os.path.join(pid_dir, "child.pid"), "w") as f:
+        f.write(str(child.pid))
+    child.wait()
+if url.startswith("sleep:"):
+    time.sleep(float(url[6:]))
+with open(output, "w") as f:
+    f.write({CODE!r})
+"""
+
+
+@pytest.fixture
+def fake_playwright(tmp_path, monkeypatch):
+    """Put a fake ``playwright`` executable first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "playwright"
+    script.write_text(FAKE_PLAYWRIGHT)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_PLAYWRIGHT_PIDS", str(tmp_path))
+    return bin_dir
+
+
+def recorder(tmp_path, name, url, **kwargs):
+    """Return a recorder writing ``<name>.robot`` below ``tmp_path``."""
+    return AsyncBrowserRecorder(
+        output_file=str(tmp_path / f"{name}.robot"), test_name=name, url=url, **kwargs
+    )
+
+
+def wait_for_file(path, timeout=5.0):
+    """Wait until ``path`` exists and has content, and return the content."""
+    deadline = time.perf_counter() + timeout
+    while not (path.exists() and path.read_text()):
+        assert time.perf_counter() < deadline, f"{path} was not written"
+        time.sleep(0.01)
+    return path.read_text()
+
+
+def assert_not_running(pid):
+    """Assert that no process with ``pid`` exists any more."""
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def assert_group_stopped(pgid, timeout=5.0):
+    """Assert that the process group ``pgid`` is empty within ``timeout`` seconds.
+
+    Members that are not our children are reaped by init, shortly after they are killed.
+    """
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            os.killpg(pgid, 0)
+        except ProcessLookupError:
+            return
+        assert time.perf_counter() < deadline, f"process group {pgid} is still running"
+        time.sleep(0.01)
+
+
+def codegen_pids(tmp_path):
+    """Return the PIDs the fake codegen processes wrote below ``tmp_path``."""
+    return [int(path.stem) for path in tmp_path.glob("*.pid") if path.stem.isdigit()]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX script as fake CLI")
+class TestAsyncBrowserRecorder:
+    """Test cases for AsyncBrowserRecorder and record_concurrently."""
+
+    def test_record(self, tmp_path, fake_playwright):
+        """Test that a session is recorded and converted."""
+        output_file = asyncio.run(recorder(tmp_path, "Single", "now").record())
+        with open(output_file) as f:
+            expected = PlaywrightToRobotConverter().convert(CODE, test_name="Single")
+            assert f.read() == expected
+
+    def test_sessions_run_concurrently(self, tmp_path, fake_playwright):
+        """Test that sessions overlap and each is converted when it finishes."""
+        recorders = [
+            recorder(tmp_path, "Slow", "sleep:0.6"),
+            recorder(tmp_path, "Fast", "sleep:0.1"),
+            recorder(tmp_path, "Medium", "sleep:0.3"),
+        ]
+        finished = []
+        start = time.perf_counter()
+        results = asyncio.run(
+            record_concurrently(recorders, on_done=lambda r: finished.append(r.recorder.test_name))
+        )
+
+        assert time.perf_counter() - start < 1.0
+        assert finished == ["Fast", "Medium", "Slow"]
+        assert [result.recorder.test_name for result in results] == ["Slow", "Fast", "Medium"]
+        assert all(result.ok for result in results)
+        assert all(os.path.exists(result.output_file) for result in results)
+
+    def test_failed_session_does_not_affect_others(self, tmp_path, fake_playwright):
+        """Test that a failing codegen run is reported per session."""
+        results = asyncio.run(
+            record_concurrently(
+                [recorder(tmp_path, "Broken", "fail"), recorder(tmp_path, "Fine", "now")]
+            )
+        )
+        assert not results[0].ok
+        assert "exit status 1" in str(results[0].error)
+        assert results[1].ok
+
+    def test_cancellation_terminates_all_children(self, tmp_path, fake_playwright):
+        """Test that cancelling the sessions kills every codegen process."""
+        recorders = [recorder(tmp_path, f"Long{i}", "sleep:30") for i in range(2)]
+
+        async def run():
+            await asyncio.wait_for(record_concurrently(recorders), timeout=0.5)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+        pids = codegen_pids(tmp_path)
+        assert len(pids) == 2
+        for pid in pids:
+            assert_not_running(pid)
+            # Each codegen process leads its own session, so its PID is the group ID.
+            assert_group_stopped(pid)
+        assert not list(tmp_path.glob("*.robot"))
+
+    def test_timeout(self, tmp_path, fake_playwright):
+        """Test that a session running longer than its timeout is stopped."""
+        start = time.perf_counter()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(recorder(tmp_path, "Long", "sleep:30", timeout=0.3).record())
+
+        assert time.perf_counter() - start < 5
+        for pid_file in tmp_path.glob("*.pid"):
+            assert_not_running(int(pid_file.read_text()))
+
+    def test_timeout_is_reported_per_session(self, tmp_path, fake_playwright):
+        """Test that a timed out session does not affect the others."""
+        results = asyncio.run(
+            record_concurrently(
+                [
+                    recorder(tmp_path, "Long", "sleep:30", timeout=0.3),
+                    recorder(tmp_path, "Fine", "now", timeout=5),
+                ]
+            )
+        )
+        assert isinstance(results[0].error, subprocess.TimeoutExpired)
+        assert results[1].ok
+
+    def test_cli_timeout(self, tmp_path, fake_playwright, capsys):
+        """Test that ``sessions --timeout`` reports sessions that ran too long."""
+        output = tmp_path / "long.robot"
+        with pytest.raises(SystemExit) as exc_info:
+            main(["sessions", "-s", f"url=sleep:30,name=Long,output={output}", "--timeout", "0.3"])
+
+        assert exc_info.value.code == 1
+        assert "Long (chromium): failed: Command" in capsys.readouterr().err
+        assert not output.exists()
+
+    def test_kill_after_ignored_terminate(self, tmp_path, fake_playwright):
+        """Test that codegen is killed when it ignores the request to terminate."""
+        session = recorder(tmp_path, "Stubborn", "ignore-term", timeout=0.5, kill_timeout=0.2)
+        start = time.perf_counter()
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(session.record())
+
+        assert time.perf_counter() - start < 5
+        (pid_file,) = tmp_path.glob("*.pid")
+        assert_not_running(int(pid_file.read_text()))
+
+    def test_cancellation_stops_the_process_group(self, tmp_path, fake_playwright):
+        """Test that children of codegen, such as the browser, are stopped as well."""
+
+        async def run():
+            task = asyncio.ensure_future(recorder(tmp_path, "Browser", "spawn").record())
+            child_pid = await asyncio.get_running_loop().run_in_executor(
+                None, wait_for_file, tmp_path / "child.pid"
+            )
+            (codegen_pid,) = codegen_pids(tmp_path)
+            assert os.getpgid(codegen_pid) == codegen_pid
+            assert os.getpgid(int(child_pid)) == codegen_pid
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return codegen_pid, int(child_pid)
+
+        codegen_pid, child_pid = asyncio.run(run())
+        assert_not_running(codegen_pid)
+        assert_group_stopped(codegen_pid)
+        assert_not_running(child_pid)
+
+    def test_convert_runs_in_executor(self):
+        """Test that convert does not run the converter on the event loop thread."""
+        threads = []
+        session = AsyncBrowserRecorder(
+            test_name="Async", executor=ThreadPoolExecutor(max_workers=1)
+        )
+        convert = session.converter.convert
+
+        def record_thread(**kwargs):
+            threads.append(threading.current_thread())
+            return convert(**kwargs)
+
+        session.converter.convert = record_thread
+        output = asyncio.run(session.convert(CODE))
+
+        assert output == PlaywrightToRobotConverter().convert(CODE, test_name="Async")
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_convert_shares_the_loop(self):
+        """Test that many conversions can be awaited concurrently on one loop."""
+        session = AsyncBrowserRecorder()
+
+        async def run():
+            return await asyncio.gather(
+                *(session.convert(CODE, test_name=f"Test {i}") for i in range(20))
+            )
+
+        outputs = asyncio.run(run())
+        assert [output.split("\n")[5] for output in outputs] == [f"Test {i}" for i in range(20)]
+
+
+class TestParseSession:
+    """Test cases for the --session option parser."""
+
+    def test_fields(self):
+        """Test that all fields are parsed and URLs may contain commas."""
+        assert parse_session("browser=firefox,url=https://x.test/?a=1,2,name=A,output=a.robot") == {
+            "browser": "firefox",
+            "url": "https://x.test/?a=1,2",
+            "name": "A",
+            "output": "a.robot",
+        }
+
+    def test_invalid(self):
+        """Test that malformed sessions are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_session("firefox")
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_session("browser=edge")
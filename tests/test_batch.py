@@ -0,0 +1,153 @@
+"""Tests for batch conversion of codegen scripts."""
+
+import pytest
+
+from robotframework_browser_recorder import batch as batch_module
+from robotframework_browser_recorder.batch import (
+    BatchConverter,
+    collect_sources,
+    init_worker,
+    name_from_path,
+    output_path_for,
+    worker_converter,
+)
+from robotframework_browser_recorder.cli.main import main
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+SCRIPT = 'page.goto("https://example.com")\npage.click("#submit")\n'
+
+
+class TestBatchConverter:
+    """Test cases for BatchConverter."""
+
+    def test_name_from_path(self):
+        """Test deriving a test name from a file name."""
+        assert name_from_path("recordings/login_flow.py") == "Login Flow"
+        assert name_from_path("check-out.py") == "Check Out"
+
+    def test_collect_sources_from_directory_and_glob(self, tmp_path):
+        """Test resolving directories and globs to sources and their roots."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.py").write_text(SCRIPT)
+        (tmp_path / "sub" / "b.py").write_text(SCRIPT)
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        sources = collect_sources([str(tmp_path), str(tmp_path / "*.py")])
+        assert sources == [
+            (str(tmp_path / "a.py"), str(tmp_path)),
+            (str(tmp_path / "sub" / "b.py"), str(tmp_path)),
+        ]
+
+    def test_output_path_mirrors_tree(self, tmp_path):
+        """Test that outputs mirror the input tree below the output directory."""
+        source = str(tmp_path / "in" / "sub" / "b.py")
+        output = output_path_for(source, str(tmp_path / "in"), str(tmp_path / "out"))
+        assert output == str(tmp_path / "out" / "sub" / "b.robot")
+
+    def test_convert_directory(self, tmp_path):
+        """Test converting a directory with converted, skipped and failed files."""
+        source_dir = tmp_path / "in"
+        (source_dir / "sub").mkdir(parents=True)
+        (source_dir / "login_flow.py").write_text(SCRIPT)
+        (source_dir / "sub" / "search.py").write_text(SCRIPT)
+        (source_dir / "empty.py").write_text("")
+
+        summary = BatchConverter(output_dir=str(tmp_path / "out"), jobs=1).convert(
+            [str(source_dir), str(tmp_path / "missing.py")]
+        )
+
+        assert summary.converted == 2
+        assert summary.skipped == 1
+        assert summary.failed == 1
+        robot_test = (tmp_path / "out" / "sub" / "search.robot").read_text()
+        assert "Search\n" in robot_test
+        assert "Click    #submit" in robot_test
+
+    def test_convert_with_process_pool(self, tmp_path):
+        """Test that worker processes produce the same files as in-process conversion."""
+        for index in range(4):
+            (tmp_path / f"script_{index}.py").write_text(SCRIPT)
+
+        summary = BatchConverter(jobs=2).convert([str(tmp_path)])
+
+        assert summary.converted == 4
+        assert (tmp_path / "script_3.robot").exists()
+
+    def test_worker_converters(self, monkeypatch):
+        """Test that init_worker creates the converters that worker_converter reuses."""
+        monkeypatch.setattr(batch_module, "_worker_converters", {})
+        init_worker(("regex", "ast"))
+        converter = worker_converter("ast")
+        assert set(batch_module._worker_converters) == {("regex", None), ("ast", None)}
+        assert converter.parser == "ast"
+        assert worker_converter("ast") is converter
+        assert worker_converter("ast", ("repeated_fill",)) is not converter
+
+    def test_failed_conversion_keeps_output(self, tmp_path, monkeypatch):
+        """Test that a conversion failing partway leaves the previous output untouched."""
+        (tmp_path / "a.py").write_text(SCRIPT)
+        (tmp_path / "a.robot").write_text("previous\n")
+
+        def broken(self, lines, dst):
+            dst.write("partial\n")
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(PlaywrightToRobotConverter, "_write_lines", broken)
+        summary = BatchConverter(jobs=1).convert([str(tmp_path / "a.py")])
+
+        assert summary.results[0].error == "disk full"
+        assert (tmp_path / "a.robot").read_text() == "previous\n"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["a.py", "a.robot"]
+
+    def test_invalid_jobs(self):
+        """Test that a negative number of jobs is rejected."""
+        with pytest.raises(ValueError, match="at least 1"):
+            BatchConverter(jobs=-1)
+
+    def test_summary_lists_files(self, tmp_path):
+        """Test that the summary names the files that succeeded and those that failed."""
+        (tmp_path / "a.py").write_text(SCRIPT)
+        (tmp_path / "empty.py").write_text("")
+        missing = str(tmp_path / "missing.py")
+
+        summary = BatchConverter(jobs=1).convert([str(tmp_path), missing])
+
+        assert [result.source for result in summary.succeeded] == [
+            str(tmp_path / "a.py"),
+            str(tmp_path / "empty.py"),
+        ]
+        assert [result.source for result in summary.unsuccessful] == [missing]
+        assert summary.format_files().split("\n")[:4] == [
+            "Succeeded (2):",
+            f"  {tmp_path / 'a.py'} -> {tmp_path / 'a.robot'}",
+            f"  {tmp_path / 'empty.py'} (skipped)",
+            "Failed (1):",
+        ]
+        assert summary.format_files().split("\n")[4].startswith(f"  {missing}: ")
+
+
+class TestConvertCommand:
+    """Test cases for ``rfbrowser-record convert``."""
+
+    @pytest.mark.parametrize("jobs", ["0", "-2", "many"])
+    def test_invalid_jobs(self, jobs, capsys):
+        """Test that --jobs must be a positive integer."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["convert", "recordings", "--jobs", jobs])
+        assert exc_info.value.code == 2
+        assert "expected a positive integer" in capsys.readouterr().err
+
+    def test_failures_are_summarized(self, tmp_path, capsys):
+        """Test that a failing run lists the succeeded and the failed files."""
+        (tmp_path / "a.py").write_text(SCRIPT)
+        missing = str(tmp_path / "missing.py")
+        with pytest.raises(SystemExit) as exc_info:
+            main(["convert", str(tmp_path), missing, "--jobs", "1"])
+
+        assert exc_info.value.code == 1
+        captured = capsys.readouterr()
+        assert "1 converted" in captured.out
+        assert f"Succeeded (1):\n  {tmp_path / 'a.py'} -> {tmp_path / 'a.robot'}" in captured.err
+        assert f"Failed (1):\n  {missing}: " in captured.err
@@ -0,0 +1,42 @@
+"""Smoke tests for the benchmark corpus generator and suite."""
+
+from benchmarks.bench_converter import compare, measure
+from benchmarks.corpus import generate_codegen_script
+
+
+class TestBenchmarks:
+    """Test cases for the benchmark helpers."""
+
+    def test_corpus_size_and_determinism(self):
+        """Test that the generator honours the requested size and seed."""
+        code = generate_codegen_script(500, seed=3)
+        assert len(code.splitlines()) == 500
+        assert code == generate_codegen_script(500, seed=3)
+        assert code != generate_codegen_script(500, seed=4)
+
+    def test_corpus_is_valid_python(self):
+        """Test that generated scripts compile, escaped quotes included."""
+        compile(generate_codegen_script(300), "<corpus>", "exec")
+
+    def test_measure_record(self):
+        """Test that a measurement contains all stage timings and memory."""
+        record = measure(200, repeat=1)
+        assert record["lines"] == 200
+        assert record["actions"] > 100
+        for key in ("parse_seconds", "generate_seconds", "convert_seconds"):
+            assert record[key] > 0
+        assert record["peak_memory_bytes"] > 0
+
+    def test_compare_reports_regressions(self):
+        """Test that slower timings beyond the threshold are reported."""
+        baseline = {"results": [{"lines": 100, "parse_seconds": 1.0, "convert_seconds": 1.0}]}
+        record = {
+            "lines": 100,
+            "parse_seconds": 1.1,
+            "generate_seconds": 1.0,
+            "convert_seconds": 2.0,
+            "peak_memory_bytes": 1,
+        }
+        regressions = compare([record], baseline, max_regression=0.25)
+        assert len(regressions) == 1
+        assert "convert_seconds" in regressions[0]
@@ -0,0 +1,111 @@
+"""Tests for the on-disk conversion cache."""
+
+import os
+import time
+
+from robotframework_browser_recorder import cache as cache_module
+from robotframework_browser_recorder.batch import BatchConverter
+from robotframework_browser_recorder.cache import ConversionCache
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+SCRIPT = 'page.goto("https://example.com")\npage.click("#submit")\n'
+
+
+class TestConversionCache:
+    """Test cases for ConversionCache."""
+
+    def test_key_depends_on_content_options_and_converter(self, tmp_path):
+        """Test that every input of a conversion is part of the key."""
+        cache = ConversionCache(str(tmp_path))
+        converter = PlaywrightToRobotConverter()
+        options = {"test_name": "A", "browser": "chromium"}
+        key = cache.key("digest", options, converter)
+
+        assert key == cache.key("digest", dict(options), PlaywrightToRobotConverter())
+        assert key != cache.key("other", options, converter)
+        assert key != cache.key("digest", {**options, "browser": "firefox"}, converter)
+        assert key != cache.key("digest", options, PlaywrightToRobotConverter(parser="ast"))
+
+    def test_key_depends_on_handler_code(self, tmp_path):
+        """Test that changing the code of a handler invalidates the key."""
+        cache = ConversionCache(str(tmp_path))
+        converter = PlaywrightToRobotConverter()
+
+        def convert_click(action):
+            return f"Click    {action.selector}"
+
+        converter.action_mappings["click"] = convert_click
+        key = cache.key("digest", {}, converter)
+        assert key == cache.key("digest", {}, converter)
+
+        convert_click.__code__ = (lambda action: f"Click    {action.selector}    left").__code__
+        assert key != cache.key("digest", {}, converter)
+
+    def test_key_depends_on_package_version_and_sources(self, tmp_path, monkeypatch):
+        """Test that the installed version and the converter sources are part of the key."""
+        cache = ConversionCache(str(tmp_path))
+        converter = PlaywrightToRobotConverter()
+        key = cache.key("digest", {}, converter)
+
+        monkeypatch.setattr(cache_module, "package_version", lambda: "99.0")
+        assert key != cache.key("digest", {}, converter)
+        monkeypatch.undo()
+        monkeypatch.setattr(cache_module, "converter_source_digest", lambda: "0" * 64)
+        assert key != cache.key("digest", {}, converter)
+
+    def test_package_version(self, monkeypatch):
+        """Test that the version comes from the installed distribution metadata."""
+        cache_module.package_version.cache_clear()
+        monkeypatch.setattr(cache_module.metadata, "version", lambda name: f"{name} 1.2.3")
+        try:
+            assert cache_module.package_version() == "robotframework-browser-recorder 1.2.3"
+        finally:
+            cache_module.package_version.cache_clear()
+
+    def test_put_and_get(self, tmp_path):
+        """Test storing and reading an entry."""
+        cache = ConversionCache(str(tmp_path))
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, b"*** Test Cases ***\n")
+        assert cache.get("ab" * 32) == b"*** Test Cases ***\n"
+
+    def test_evict_by_age_and_size(self, tmp_path):
+        """Test that old entries and the oldest entries beyond the size limit go first."""
+        cache = ConversionCache(str(tmp_path), max_bytes=20, max_age=3600)
+        now = time.time()
+        for index, age in enumerate((7200, 30, 20, 10)):
+            key = f"{index:02d}" * 32
+            cache.put(key, b"x" * 10)
+            os.utime(cache.path(key), (now - age, now - age))
+
+        assert cache.evict() == 2
+        assert cache.get("00" * 32) is None
+        assert cache.get("01" * 32) is None
+        assert cache.get("03" * 32) == b"x" * 10
+
+    def test_batch_skips_unchanged_files(self, tmp_path):
+        """Test that cached results are reused without rewriting unchanged outputs."""
+        source_dir = tmp_path / "in"
+        source_dir.mkdir()
+        (source_dir / "login.py").write_text(SCRIPT)
+        batch = BatchConverter(
+            output_dir=str(tmp_path / "out"), jobs=1, cache_dir=str(tmp_path / "cache")
+        )
+
+        assert batch.convert([str(source_dir)]).converted == 1
+        output = tmp_path / "out" / "login.robot"
+        os.utime(output, (0, 0))
+
+        summary = batch.convert([str(source_dir)])
+        assert summary.cached == 1
+        assert output.stat().st_mtime == 0
+
+        output.unlink()
+        assert batch.convert([str(source_dir)]).cached == 1
+        assert "Click    #submit" in output.read_text()
+
+        (source_dir / "login.py").write_text(SCRIPT + 'page.click("#logout")\n')
+        assert batch.convert([str(source_dir)]).converted == 1
+        assert "Click    #logout" in output.read_text()
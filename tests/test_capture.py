@@ -0,0 +1,156 @@
+"""Tests for capturing codegen output in memory."""
+
+import asyncio
+import os
+import stat
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from robotframework_browser_recorder import capture as capture_module
+from robotframework_browser_recorder.async_recorder import AsyncBrowserRecorder
+from robotframework_browser_recorder.capture import CodegenOutput, memory_capture_supported
+from robotframework_browser_recorder.recorder import BrowserRecorder
+
+CODE = 'page.goto("https://example.com")\npage.click("#go")\n'
+
+# Stand-in for the playwright CLI. Like the pip package's CLI, it is a wrapper that
+# starts the process writing the output with ``subprocess.run``, which closes inherited
+# descriptors. The writer rewrites its output like codegen does: a longer first
+# snapshot, then the final, shorter recording.
+WRITER = f"""
+import sys
+output = sys.argv[1]
+with open(output, "w") as f:
+    f.write({CODE!r} * 3)
+with open(output, "w") as f:
+    f.write({CODE!r})
+"""
+
+FAKE_PLAYWRIGHT = f"""#!{sys.executable}
+import subprocess, sys
+args = sys.argv[1:]
+output = args[args.index("-o") + 1]
+subprocess.run([sys.executable, "-c", {WRITER!r}, output], check=True)
+"""
+
+requires_memory = pytest.mark.skipif(
+    not memory_capture_supported(), reason="in-memory files are not supported"
+)
+
+
+@pytest.fixture
+def fake_playwright(tmp_path, monkeypatch):
+    """Put a fake ``playwright`` executable first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "playwright"
+    script.write_text(FAKE_PLAYWRIGHT)
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return bin_dir
+
+
+@pytest.fixture
+def no_temporary_files(monkeypatch):
+    """Fail if a temporary file is created for the recording."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a temporary file was created")
+
+    monkeypatch.setattr(capture_module.tempfile, "NamedTemporaryFile", fail)
+
+
+class TestCodegenOutput:
+    """Test cases for CodegenOutput."""
+
+    def test_file_mode(self):
+        """Test that file mode uses a temporary file that is deleted on close."""
+        with CodegenOutput(".jsonl") as output:
+            assert not output.in_memory
+            assert output.path.endswith(".jsonl")
+            assert os.path.dirname(output.path) == tempfile.gettempdir()
+            assert output.describe() == f"temporary file: {output.path}"
+            assert os.path.exists(output.path)
+        assert not os.path.exists(output.path)
+
+    @requires_memory
+    def test_memory_mode(self, no_temporary_files):
+        """Test that memory mode is readable, rewritable and passed to subprocesses."""
+        output = CodegenOutput(mode="memory")
+        assert output.in_memory
+        assert output.describe() == "memory"
+        fd = output._fd
+        assert output.path == f"/proc/{os.getpid()}/fd/{fd}"
+
+        with open(output.path, "w") as f:
+            f.write("a longer first snapshot")
+        with open(output.path, "w") as f:
+            f.write("final")
+        with open(output.path) as f:
+            assert f.read() == "final"
+
+        output.close()
+        output.close()
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+    def test_memory_mode_falls_back_to_a_file(self, monkeypatch):
+        """Test that memory mode uses a temporary file where it is not supported."""
+        monkeypatch.setattr(capture_module, "memory_capture_supported", lambda: False)
+        with CodegenOutput(mode="memory") as output:
+            assert not output.in_memory
+            assert os.path.exists(output.path)
+
+    @requires_memory
+    def test_memory_mode_is_reachable_from_descendants(self, no_temporary_files):
+        """Test that processes started by a subprocess, with descriptors closed, can write."""
+        with CodegenOutput(mode="memory") as output:
+            wrapper = "import subprocess, sys; subprocess.run(sys.argv[1:], check=True)"
+            subprocess.run(
+                [sys.executable, "-c", wrapper, sys.executable, "-c", WRITER, output.path],
+                check=True,
+            )
+            with open(output.path) as f:
+                assert f.read() == CODE
+
+    @requires_memory
+    def test_unusable_memory_file_falls_back_to_a_file(self, monkeypatch):
+        """Test that a temporary file is used if the in-memory file cannot be opened."""
+        monkeypatch.setattr(capture_module, "_fd_path", lambda fd: "/proc/0/fd/missing")
+        with CodegenOutput(mode="memory") as output:
+            assert not output.in_memory
+            assert os.path.exists(output.path)
+
+    def test_unknown_mode(self):
+        """Test that unknown modes are rejected."""
+        with pytest.raises(ValueError, match="Unknown capture mode 'pipe'"):
+            CodegenOutput(mode="pipe")
+        with pytest.raises(ValueError, match="Unknown capture mode 'pipe'"):
+            BrowserRecorder(capture="pipe")
+
+
+@requires_memory
+class TestMemoryRecording:
+    """Test cases for recording sessions captured in memory."""
+
+    @pytest.mark.parametrize("live", [False, True])
+    def test_record(self, tmp_path, fake_playwright, no_temporary_files, live):
+        """Test that a session recorded in memory is converted like one on disk."""
+        output_file = tmp_path / "test.robot"
+        recorder = BrowserRecorder(
+            output_file=str(output_file), capture="memory", live=live, poll_interval=0.01
+        )
+        recorder.record()
+        content = output_file.read_text()
+        assert "New Page    https://example.com" in content
+        assert content.count("Click    #go") == 1
+
+    def test_async_record(self, tmp_path, fake_playwright, no_temporary_files):
+        """Test that the asyncio recorder passes the in-memory file to codegen."""
+        output_file = tmp_path / "test.robot"
+        recorder = AsyncBrowserRecorder(output_file=str(output_file), capture="memory")
+        asyncio.run(recorder.record())
+        assert output_file.read_text().count("Click    #go") == 1
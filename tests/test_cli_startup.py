@@ -0,0 +1,75 @@
+"""Start-up imports of the command-line interface."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only subcommands need; finding any of them loaded after importing the
+# CLI or printing its help means a module-level import crept back into the CLI.
+HEAVY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "http.server",
+    "subprocess",
+    "tempfile",
+    "robot",
+    "robotframework_browser_recorder.batch",
+    "robotframework_browser_recorder.converter.ast_parser",
+    "robotframework_browser_recorder.converter.jsonl",
+    "robotframework_browser_recorder.converter.playwright_to_robot",
+    "robotframework_browser_recorder.recorder",
+    "robotframework_browser_recorder.server",
+)
+
+RUN_CLI = """
+from robotframework_browser_recorder.cli.main import main
+try:
+    main({argv!r})
+except SystemExit:
+    pass
+"""
+
+PRINT_MODULES = """
+import json, sys
+print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def loaded_modules(code):
+    """Run ``code`` in a fresh interpreter and return the modules loaded afterwards."""
+    process = subprocess.run(
+        [sys.executable, "-c", code + PRINT_MODULES],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(process.stderr.splitlines()[-1]))
+
+
+class TestCliStartup:
+    """Test cases for the start-up cost of rfbrowser-record."""
+
+    def test_import_loads_no_heavy_modules(self):
+        """Test that importing the CLI loads no subcommand dependencies."""
+        loaded = loaded_modules("import robotframework_browser_recorder.cli.main")
+        assert [module for module in HEAVY_MODULES if module in loaded] == []
+
+    @pytest.mark.parametrize("argv", [["--version"], ["--help"], ["convert", "--help"]])
+    def test_no_heavy_imports(self, argv):
+        """Test that help and version output load no subcommand dependencies."""
+        loaded = loaded_modules(RUN_CLI.format(argv=argv))
+        assert [module for module in HEAVY_MODULES if module in loaded] == []
+
+
+class TestLazyExports:
+    """Test cases for the lazily resolved exports of the converter package."""
+
+    def test_all_matches_exports(self):
+        """Test that ``__all__`` lists exactly the lazily resolved names."""
+        from robotframework_browser_recorder import converter
+
+        assert sorted(converter.__all__) == sorted(converter._EXPORTS)
+        for name in converter.__all__:
+            assert getattr(converter, name) is not None
@@ -1,5 +1,7 @@
 """Tests for the Playwright to Robot Framework converter."""
 
+import io
+
 from robotframework_browser_recorder.converter.playwright_to_robot import (
     PlaywrightToRobotConverter,
 )
@@ -230,3 +232,109 @@ expect(page.locator("#welcome-message")).to_have_text("Welcome, user1!")
         assert actions[4]["type"] == "expect_url"
         assert actions[5]["type"] == "expect_visible"
         assert actions[6]["type"] == "expect_text"
+
+    def test_action_precedence_with_multiple_methods(self):
+        """Test that the earliest action in precedence order wins when several match."""
+        playwright_code = 'expect(page.get_by_text("Go")).to_contain_text("link.click(now)")'
+        actions = self.converter._parse_playwright_code(playwright_code)
+        assert len(actions) == 1
+        assert actions[0]["type"] == "click"
+
+    def test_convert_wait_for_load_state_default(self):
+        """Test that wait_for_load_state without arguments defaults to networkidle."""
+        playwright_code = "page.wait_for_load_state()"
+        actions = self.converter._parse_playwright_code(playwright_code)
+        assert actions == [{"type": "wait_for_load_state", "state": "networkidle"}]
+
+    def test_unknown_statements_are_skipped(self):
+        """Test that statements without a supported action produce no actions."""
+        playwright_code = """
+context = browser.new_context()
+page = context.new_page()
+context.close()
+"""
+        assert self.converter._parse_playwright_code(playwright_code) == []
+
+    def test_convert_stream_matches_convert(self):
+        """Test that streaming conversion writes the same test as convert()."""
+        playwright_code = """import re
+page.goto("https://example.com/login")
+page.get_by_role("textbox", name="Email").fill("user@example.com")
+page.get_by_role("button", name="Log in").click()
+expect(page).to_have_url("https://example.com/dashboard")
+"""
+        dst = io.StringIO()
+        written = self.converter.convert_stream(
+            io.StringIO(playwright_code), dst, test_name="Stream Test"
+        )
+        expected = self.converter.convert(playwright_code, test_name="Stream Test")
+        assert dst.getvalue() == expected
+        assert written == len(expected.splitlines())
+
+    def test_convert_actions_matches_convert(self):
+        """Test that structured actions convert like the equivalent source."""
+        playwright_code = """page.goto("https://example.com")
+page.fill("#q", "robot")
+page.press("#q", "Enter")
+"""
+        actions = [
+            {"type": "goto", "url": "https://example.com"},
+            {"type": "fill", "selector": "#q", "value": "robot"},
+            {"type": "press", "selector": "#q", "key": "Enter"},
+        ]
+        assert self.converter.convert_actions(actions, browser="firefox") == (
+            self.converter.convert(playwright_code, browser="firefox")
+        )
+
+    def test_iter_robot_lines_from_generator(self):
+        """Test that Robot lines are produced lazily from any line iterator."""
+        source = (f'page.click("#item-{index}")' for index in range(3))
+        lines = self.converter.iter_robot_lines(source, test_name="Lazy")
+        assert next(lines) == "*** Settings ***"
+        assert list(lines)[-3:] == [
+            "    Click    #item-0",
+            "    Click    #item-1",
+            "    Click    #item-2",
+        ]
+
+    def test_selector_cache_is_shared_across_conversions(self):
+        """Test that repeated locators are served from the selector caches."""
+        playwright_code = 'page.get_by_role("button", name="Next").click()\n' * 5
+        self.converter.convert(playwright_code)
+        self.converter.convert(playwright_code)
+
+        info = self.converter.cache_info()
+        assert info["_extract_selector"].misses == 1
+        assert info["_extract_selector"].hits == 9
+        assert info["_simplify_selector"].misses == 1
+        assert info["_simplify_selector"].hits == 9
+
+        self.converter.cache_clear()
+        assert self.converter.cache_info()["_extract_selector"].currsize == 0
+
+    def test_selector_cache_ignores_values(self):
+        """Test that statements only differing in their value share a cache entry."""
+        playwright_code = "".join(
+            f'page.locator("#user").fill("user-{index}")\n'
+            f'expect(page.locator("#user")).to_have_value("user-{index}")\n'
+            for index in range(5)
+        )
+        robot_code = self.converter.convert(playwright_code)
+        assert "    Fill Text    #user    user-4" in robot_code
+        assert "    Get Property    #user    value    ==    user-4" in robot_code
+
+        info = self.converter.cache_info()
+        assert info["_extract_selector"].misses == 1
+        assert info["_extract_selector"].hits == 4
+        assert info["_extract_expect_selector"].misses == 1
+        assert info["_extract_expect_selector"].hits == 4
+
+    def test_selector_cache_size(self):
+        """Test that the cache is bounded and can be disabled."""
+        converter = PlaywrightToRobotConverter(selector_cache_size=2)
+        converter.convert("".join(f'page.click("#item-{index}")\n' for index in range(5)))
+        assert converter.cache_info()["_extract_selector"].currsize == 2
+
+        uncached = PlaywrightToRobotConverter(selector_cache_size=0)
+        assert uncached.cache_info() == {}
+        assert uncached.convert('page.click("#a")') == converter.convert('page.click("#a")')
@@ -0,0 +1,111 @@
+"""Tests for incremental re-conversion."""
+
+import json
+
+from robotframework_browser_recorder.converter import ConversionState
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from benchmarks.corpus import FOOTER, HEADER, generate_codegen_script
+
+STEPS = [
+    '    page.goto("https://example.com")',
+    '    page.get_by_role("button", name="Sign in").click()',
+    '    page.get_by_label("Email").fill("user@example.com")',
+    "    page.close()",
+    '    expect(page.locator("#welcome")).to_be_visible()',
+]
+
+
+def script(steps):
+    """Return a codegen script with ``steps`` as its body."""
+    return "\n".join(HEADER + steps + FOOTER) + "\n"
+
+
+class TestConvertIncremental:
+    """Test cases for PlaywrightToRobotConverter.convert_incremental."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = PlaywrightToRobotConverter()
+
+    def test_without_previous_state_matches_convert(self):
+        """Test that a first conversion equals a full conversion."""
+        code = generate_codegen_script(300, seed=3)
+        output, state = self.converter.convert_incremental(code, test_name="Flow")
+        assert output == self.converter.convert(code, test_name="Flow")
+        assert state.reparsed_lines == len(code.split("\n"))
+        assert state.actions == self.converter._parse(code)
+
+    def test_appended_steps_reparse_only_the_suffix(self):
+        """Test that appending steps reuses the unchanged prefix."""
+        code = script(STEPS[:2])
+        _, state = self.converter.convert_incremental(code)
+
+        extended = script(STEPS)
+        output, new_state = self.converter.convert_incremental(extended, previous=state)
+        assert output == self.converter.convert(extended)
+        assert new_state.reparsed_lines == len(FOOTER) + 3 + 1
+
+    def test_unchanged_source_reparses_nothing(self):
+        """Test that converting the same source again reuses everything."""
+        code = script(STEPS)
+        first, state = self.converter.convert_incremental(code)
+        second, new_state = self.converter.convert_incremental(code, previous=state)
+        assert second == first
+        assert new_state.reparsed_lines == 0
+
+    def test_rewritten_history_falls_back_correctly(self):
+        """Test that changing an early step still produces the full conversion."""
+        _, state = self.converter.convert_incremental(script(STEPS))
+
+        rewritten = script(['    page.goto("https://other.example.com")'] + STEPS[2:])
+        output, new_state = self.converter.convert_incremental(rewritten, previous=state)
+        assert output == self.converter.convert(rewritten)
+        assert "https://example.com" not in output
+        assert new_state.reparsed_lines == len(rewritten.split("\n")) - len(HEADER)
+
+    def test_truncated_source(self):
+        """Test that removing trailing steps drops their output."""
+        _, state = self.converter.convert_incremental(script(STEPS))
+        shorter = script(STEPS[:1])
+        output, _ = self.converter.convert_incremental(shorter, previous=state)
+        assert output == self.converter.convert(shorter)
+
+    def test_changed_options_force_a_full_conversion(self):
+        """Test that a state made with other options is not reused."""
+        code = script(STEPS)
+        _, state = self.converter.convert_incremental(code, browser="firefox")
+        output, new_state = self.converter.convert_incremental(code, previous=state)
+        assert output == self.converter.convert(code)
+        assert new_state.reparsed_lines == len(code.split("\n"))
+
+    def test_state_round_trips_through_json(self):
+        """Test that a persisted state can be resumed from."""
+        code = script(STEPS[:3])
+        _, state = self.converter.convert_incremental(code)
+        restored = ConversionState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+        extended = script(STEPS)
+        output, new_state = self.converter.convert_incremental(extended, previous=restored)
+        assert output == self.converter.convert(extended)
+        assert new_state.reparsed_lines < len(extended.split("\n")) - len(HEADER)
+
+    def test_randomly_extended_recordings(self):
+        """Test repeated appends against full conversions on generated scripts."""
+        lines = generate_codegen_script(400, seed=5).split("\n")
+        start, stop = len(HEADER), -len(FOOTER) - 1
+        body = lines[start:stop]
+        state = None
+        for end in range(0, len(body) + 1, 37):
+            code = script(body[:end])
+            output, state = self.converter.convert_incremental(code, previous=state)
+            assert output == self.converter.convert(code)
+
+    def test_ast_parser(self):
+        """Test that the AST backend gives the same output as convert."""
+        converter = PlaywrightToRobotConverter(parser="ast")
+        _, state = converter.convert_incremental(script(STEPS[:2]))
+        extended = script(STEPS)
+        output, _ = converter.convert_incremental(extended, previous=state)
+        assert output == converter.convert(extended)
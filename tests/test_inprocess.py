@@ -0,0 +1,117 @@
+"""Tests for the in-process recording engine."""
+
+import pytest
+
+from robotframework_browser_recorder import recorder as recorder_module
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.inprocess import (
+    BINDING_NAME,
+    RECORDER_SCRIPT,
+    ActionCollector,
+)
+from robotframework_browser_recorder.recorder import BrowserRecorder
+
+EVENTS = [
+    {"type": "click", "selector": "role=textbox[name='Email']"},
+    {"type": "fill", "selector": "role=textbox[name='Email']", "value": "u"},
+    {"type": "fill", "selector": "role=textbox[name='Email']", "value": "user@example.com"},
+    {"type": "press", "selector": "role=textbox[name='Email']", "value": "Enter"},
+    {"type": "check", "selector": "#terms"},
+    {"type": "select_option", "selector": '[name="country"]', "value": "NL"},
+]
+
+
+class TestActionCollector:
+    """Test cases for ActionCollector."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.collector = ActionCollector()
+
+    def test_events_become_actions(self):
+        """Test that page events are turned into actions with merged fills."""
+        for event in EVENTS:
+            self.collector.add_event(event)
+
+        assert self.collector.actions == [
+            Action("click", "role=textbox[name='Email']"),
+            Action("fill", "role=textbox[name='Email']", "user@example.com"),
+            Action("press", "role=textbox[name='Email']", "Enter"),
+            Action("check", "#terms"),
+            Action("select_option", '[name="country"]', "NL"),
+        ]
+
+    def test_fills_of_different_fields_are_kept(self):
+        """Test that only consecutive fills of the same field are merged."""
+        self.collector.add_event({"type": "fill", "selector": "#a", "value": "1"})
+        self.collector.add_event({"type": "fill", "selector": "#b", "value": "2"})
+        self.collector.add_event({"type": "fill", "selector": "#a", "value": "3"})
+        assert [action.value for action in self.collector.actions] == ["1", "2", "3"]
+
+    def test_unknown_events_are_ignored(self):
+        """Test that malformed events do not produce actions."""
+        assert self.collector.add_event({"type": "scroll", "selector": "#a"}) is None
+        assert self.collector.add_event({"type": "click"}) is None
+        assert self.collector.actions == []
+
+    def test_navigations(self):
+        """Test which main frame navigations become goto actions."""
+        assert self.collector.add_navigation("about:blank") is None
+        assert self.collector.add_navigation("https://example.com/") is not None
+        assert self.collector.add_navigation("https://example.com/") is None
+
+        self.collector.add_event({"type": "click", "selector": "role=link[name='Next']"})
+        assert self.collector.add_navigation("https://example.com/next") is None
+
+        self.collector.add_event({"type": "fill", "selector": "#q", "value": "x"})
+        assert self.collector.add_navigation("https://example.com/typed") is not None
+
+    def test_script_reports_through_the_binding(self):
+        """Test that the page script is filled in with the binding name."""
+        assert f"window.{BINDING_NAME}" in RECORDER_SCRIPT
+        assert '["Enter", "Tab", "Escape"]' in RECORDER_SCRIPT
+
+
+class TestInProcessEngine:
+    """Test cases for BrowserRecorder with the in-process engine."""
+
+    def test_record_converts_structured_actions(self, tmp_path, monkeypatch):
+        """Test that recorded actions are converted without any source code."""
+        actions = [Action("goto", value="https://example.com"), Action("click", "#go")]
+        monkeypatch.setattr(recorder_module.InProcessRecorder, "record", lambda self: actions)
+        monkeypatch.setattr(
+            recorder_module.subprocess,
+            "Popen",
+            lambda cmd: pytest.fail("codegen must not be started"),
+        )
+        records = []
+        output_file = tmp_path / "test.robot"
+        recorder = BrowserRecorder(
+            output_file=str(output_file),
+            test_name="In Process",
+            engine="inprocess",
+            metrics_sink=records.append,
+        )
+
+        assert recorder.record() == str(output_file)
+        converter = PlaywrightToRobotConverter()
+        assert output_file.read_text() == converter.convert_actions(actions, test_name="In Process")
+        assert records[0]["actions"] == 2
+        assert records[0]["output_bytes"] == output_file.stat().st_size
+
+    def test_empty_recording(self, tmp_path, monkeypatch):
+        """Test that a session without actions is reported as an error."""
+        monkeypatch.setattr(recorder_module.InProcessRecorder, "record", lambda self: [])
+        recorder = BrowserRecorder(output_file=str(tmp_path / "t.robot"), engine="inprocess")
+        with pytest.raises(ValueError, match="No code was recorded"):
+            recorder.record()
+
+    def test_invalid_engine_options(self):
+        """Test that unknown engines and live in-process recording are rejected."""
+        with pytest.raises(ValueError, match="Unknown engine"):
+            BrowserRecorder(engine="selenium")
+        with pytest.raises(ValueError, match="Live mode"):
+            BrowserRecorder(engine="inprocess", live=True)
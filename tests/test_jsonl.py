@@ -0,0 +1,256 @@
+"""Tests for the JSON lines codegen target."""
+
+import io
+import json
+
+import pytest
+
+from robotframework_browser_recorder import recorder as recorder_module
+from robotframework_browser_recorder.batch import BatchConverter
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.converter.jsonl import JsonlActionParser, format_locator
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.metrics import is_statement
+from robotframework_browser_recorder.recorder import BrowserRecorder, codegen_command
+
+
+def role(name, role_name="button"):
+    """Return the locator object of ``get_by_role(role_name, name=name)``."""
+    return {
+        "kind": "role",
+        "body": role_name,
+        "options": {"attrs": [], "exact": False, "name": name},
+    }
+
+
+ENTRIES = [
+    {"browserName": "chromium", "launchOptions": {"headless": False}, "contextOptions": {}},
+    {"name": "openPage", "url": "about:blank", "signals": [], "pageAlias": "page"},
+    {"name": "navigate", "url": "https://example.com/login", "signals": [], "pageAlias": "page"},
+    {
+        "name": "fill",
+        "selector": 'internal:label="Email"i',
+        "text": "user@example.com",
+        "locator": {"kind": "label", "body": "Email", "options": {"exact": False}},
+    },
+    {
+        "name": "press",
+        "selector": 'internal:label="Email"i',
+        "key": "a",
+        "modifiers": 2,
+        "locator": {"kind": "label", "body": "Email", "options": {"exact": False}},
+    },
+    {
+        "name": "click",
+        "selector": 'internal:role=button[name="Sign in"i]',
+        "button": "left",
+        "modifiers": 0,
+        "clickCount": 1,
+        "locator": role("Sign in"),
+    },
+    {
+        "name": "click",
+        "selector": "#row >> nth=1",
+        "clickCount": 2,
+        "locator": {"kind": "default", "body": "#row", "next": {"kind": "nth", "body": "1"}},
+    },
+    {
+        "name": "select",
+        "selector": "#country",
+        "options": ["nl"],
+        "locator": {"kind": "default", "body": "#country"},
+    },
+    {
+        "name": "check",
+        "selector": 'internal:testid=[data-testid="terms"s]',
+        "locator": {"kind": "test-id", "body": "terms"},
+    },
+    {
+        "name": "assertText",
+        "selector": "h1",
+        "text": "Welcome",
+        "substring": True,
+        "locator": {"kind": "default", "body": "h1"},
+    },
+    {
+        "name": "assertChecked",
+        "selector": "#terms",
+        "checked": False,
+        "locator": {"kind": "default", "body": "#terms"},
+    },
+    {"name": "closePage", "pageAlias": "page"},
+]
+
+JSONL = "\n".join(json.dumps(entry) for entry in ENTRIES) + "\n"
+
+EXPECTED_ACTIONS = [
+    Action("goto", value="https://example.com/login"),
+    Action("fill", "Email", "user@example.com"),
+    Action("press", "Email", "Control+a"),
+    Action("click", "role=button[name='Sign in']"),
+    Action("dblclick", "#row >> nth=1"),
+    Action("select_option", "#country", "nl"),
+    Action("check", "data-testid=terms"),
+    Action("expect_text", "h1", "Welcome"),
+]
+
+
+class TestJsonlActionParser:
+    """Test cases for JsonlActionParser."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.parser = JsonlActionParser()
+
+    def test_parse(self):
+        """Test that every action is mapped and the rest is skipped."""
+        assert self.parser.parse(JSONL) == EXPECTED_ACTIONS
+
+    def test_invalid_lines_are_skipped(self):
+        """Test that partial and non-action lines are ignored."""
+        assert self.parser.parse_line('{"name": "click", "selec') is None
+        assert self.parser.parse_line("[1, 2]") is None
+        assert self.parser.parse_line("") is None
+
+    def test_modifiers_are_coerced(self):
+        """Test that numeric modifiers are accepted and others skip only their line."""
+        press = {"name": "press", "selector": "#q", "key": "a"}
+        lines = [
+            json.dumps({**press, "modifiers": "2"}),
+            json.dumps({**press, "modifiers": 2.0}),
+            json.dumps({**press, "modifiers": "ctrl"}),
+            json.dumps({**press, "modifiers": [2]}),
+            json.dumps({"name": "click", "selector": "#go"}),
+        ]
+        assert list(self.parser.iter_actions(lines)) == [
+            Action("press", "#q", "Control+a"),
+            Action("press", "#q", "Control+a"),
+            Action("click", "#go"),
+        ]
+
+    def test_raw_selector_fallback(self):
+        """Test that the raw selector is used for locators without an equivalent."""
+        entry = {
+            "name": "click",
+            "selector": "internal:control=enter-frame >> #go",
+            "locator": {"kind": "frame-locator", "body": "#frame", "next": {"kind": "default"}},
+        }
+        action = self.parser.parse_line(json.dumps(entry))
+        assert action == Action("click", "internal:control=enter-frame >> #go")
+
+    @pytest.mark.parametrize(
+        "locator, selector",
+        [
+            (role("Go"), "role=button[name='Go']"),
+            ({"kind": "role", "body": "link", "options": {"attrs": []}}, "role=link"),
+            (
+                {"kind": "role", "body": "tab", "options": {"name": "A", "exact": True}},
+                "role=tab[name='A' s]",
+            ),
+            ({"kind": "text", "body": "Hi", "options": {"exact": True}}, 'text="Hi"'),
+            ({"kind": "placeholder", "body": "Search"}, "placeholder=Search"),
+            (
+                {"kind": "default", "body": "li", "next": {"kind": "has-text", "body": "Milk"}},
+                'li:has-text("Milk")',
+            ),
+            ({"kind": "default", "body": "li", "next": {"kind": "last"}}, "li >> nth=-1"),
+            ({"kind": "text", "body": {}}, None),
+        ],
+    )
+    def test_format_locator(self, locator, selector):
+        """Test that locator objects are formatted like the Python locators."""
+        assert format_locator(locator) == selector
+
+
+class TestJsonlConversion:
+    """Test cases for converting JSONL recordings."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = PlaywrightToRobotConverter(parser="jsonl")
+
+    def test_convert(self):
+        """Test that JSONL converts like the equivalent actions."""
+        expected = PlaywrightToRobotConverter().convert_actions(EXPECTED_ACTIONS)
+        assert self.converter.convert(JSONL) == expected
+
+    def test_convert_stream(self):
+        """Test that JSONL is converted as a stream."""
+        dst = io.StringIO()
+        self.converter.convert_stream(io.StringIO(JSONL), dst)
+        assert dst.getvalue() == self.converter.convert(JSONL)
+
+    def test_empty_fill(self):
+        """Test that clearing a field fills in ${EMPTY} instead of a trailing empty cell."""
+        line = json.dumps({"name": "fill", "selector": "#search", "text": ""})
+        robot = self.converter.convert(line)
+        assert robot.endswith("    Fill Text    #search    ${EMPTY}\n")
+        assert not any(row.endswith("    ") for row in robot.split("\n"))
+
+    def test_empty_expected_text(self):
+        """Test that asserting empty text or value expects ${EMPTY}."""
+        lines = [
+            json.dumps({"name": "assertText", "selector": "#msg", "text": ""}),
+            json.dumps({"name": "assertValue", "selector": "#q", "value": ""}),
+        ]
+        robot = self.converter.convert("\n".join(lines))
+        assert "    Get Text    #msg    ==    ${EMPTY}\n" in robot
+        assert "    Get Property    #q    value    ==    ${EMPTY}\n" in robot
+        assert not any(row.endswith("    ") for row in robot.split("\n"))
+
+    def test_convert_incremental(self):
+        """Test that appended actions are converted incrementally."""
+        lines = JSONL.split("\n")
+        _, state = self.converter.convert_incremental("\n".join(lines[:5]))
+        robot, state = self.converter.convert_incremental(JSONL, state)
+        assert robot == self.converter.convert(JSONL)
+        assert state.reparsed_lines < len(lines)
+
+    def test_batch(self, tmp_path):
+        """Test that batch conversion picks up .jsonl files."""
+        (tmp_path / "login.jsonl").write_text(JSONL)
+        summary = BatchConverter(jobs=1, parser="jsonl", pattern="*.jsonl").convert([str(tmp_path)])
+        assert summary.converted == 1
+        assert "Fill Text    Email    user@example.com" in (tmp_path / "login.robot").read_text()
+
+    def test_is_statement(self):
+        """Test that JSONL actions count as statements and the header does not."""
+        lines = JSONL.splitlines()
+        assert not is_statement(lines[0])
+        assert all(is_statement(line) for line in lines[1:])
+
+
+class TestJsonlRecording:
+    """Test cases for recording with the JSONL target."""
+
+    def test_codegen_command(self):
+        """Test that the target is passed to codegen."""
+        cmd = codegen_command("firefox", "out.jsonl", target="jsonl")
+        assert cmd[cmd.index("--target") + 1] == "jsonl"
+
+    def test_record(self, tmp_path, monkeypatch):
+        """Test that the recorder asks codegen for JSONL and converts it."""
+        commands = []
+
+        class FakeProcess:
+            """Stand-in for codegen that writes ``JSONL`` to its output file."""
+
+            def __init__(self, cmd):
+                commands.append(cmd)
+                with open(cmd[cmd.index("-o") + 1], "w") as f:
+                    f.write(JSONL)
+                self.returncode = 0
+
+            def wait(self, timeout=None):
+                return 0
+
+        monkeypatch.setattr(recorder_module.subprocess, "Popen", FakeProcess)
+        output = tmp_path / "test.robot"
+        BrowserRecorder(output_file=str(output), parser="jsonl").record()
+
+        cmd = commands[0]
+        assert cmd[cmd.index("--target") + 1] == "jsonl"
+        assert cmd[cmd.index("-o") + 1].endswith(".jsonl")
+        assert "Click    role=button[name='Sign in']" in output.read_text()
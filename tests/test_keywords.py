@@ -0,0 +1,110 @@
+"""Tests for extracting repeated steps into keywords."""
+
+import pytest
+
+from robotframework_browser_recorder.keywords import KeywordExtractor
+
+
+def steps(*names):
+    """Return indented step lines for single-letter step names."""
+    return [f"    Step {name}" for name in names]
+
+
+class TestKeywordExtractor:
+    """Test cases for KeywordExtractor."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.extractor = KeywordExtractor(min_length=3)
+
+    def test_repeated_run_is_extracted(self):
+        """Test that a run shared by several tests becomes one keyword."""
+        keywords, rewritten = self.extractor.extract(
+            [steps("a", "b", "c", "d", "x"), steps("y", "a", "b", "c", "d"), steps("a", "b")]
+        )
+
+        assert len(keywords) == 1
+        assert keywords[0].name == "Recorded Steps 1"
+        assert keywords[0].steps == steps("a", "b", "c", "d")
+        assert keywords[0].occurrences == 2
+        assert rewritten == [
+            ["    Recorded Steps 1", "    Step x"],
+            ["    Step y", "    Recorded Steps 1"],
+            steps("a", "b"),
+        ]
+
+    def test_short_runs_are_kept(self):
+        """Test that runs below the length threshold are left alone."""
+        sequences = [steps("a", "b", "x"), steps("a", "b", "y")]
+        keywords, rewritten = self.extractor.extract(sequences)
+        assert keywords == []
+        assert rewritten == sequences
+
+    def test_repeats_within_one_test(self):
+        """Test that non-overlapping repeats inside a single test are extracted."""
+        keywords, rewritten = self.extractor.extract([steps("a", "b", "c", "a", "b", "c", "a")])
+        assert keywords[0].steps == steps("a", "b", "c")
+        assert rewritten == [["    Recorded Steps 1", "    Recorded Steps 1", "    Step a"]]
+
+    def test_overlapping_runs(self):
+        """Test that an overlapping occurrence is not counted twice."""
+        keywords, rewritten = self.extractor.extract([steps("a", "a", "a", "a")])
+        assert keywords == []
+        assert rewritten == [steps("a", "a", "a", "a")]
+
+    def test_several_keywords(self):
+        """Test that different runs get their own numbered keywords."""
+        keywords, rewritten = self.extractor.extract(
+            [
+                steps("a", "b", "c", "x", "d", "e", "f"),
+                steps("d", "e", "f", "y", "a", "b", "c"),
+            ]
+        )
+        assert [keyword.steps for keyword in keywords] == [
+            steps("a", "b", "c"),
+            steps("d", "e", "f"),
+        ]
+        assert rewritten[1] == ["    Recorded Steps 2", "    Step y", "    Recorded Steps 1"]
+
+    def test_large_corpus(self):
+        """Test that a corpus of thousands of tests is handled."""
+        login = steps("open", "user", "password", "submit")
+        sequences = [login + steps(f"{index}a", f"{index}b") for index in range(5000)]
+        keywords, rewritten = self.extractor.extract(sequences)
+        assert [keyword.steps for keyword in keywords] == [login]
+        assert keywords[0].occurrences == 5000
+        assert all(len(lines) == 3 for lines in rewritten)
+
+    def test_long_shared_run_is_extended_once(self, monkeypatch):
+        """Test that only the left-maximal window of a long repeated run is extended."""
+        extended = []
+        extend = KeywordExtractor._extend
+
+        def counting_extend(encoded, occurrences, length):
+            extended.append(occurrences)
+            return extend(encoded, occurrences, length)
+
+        monkeypatch.setattr(KeywordExtractor, "_extend", staticmethod(counting_extend))
+        run = steps(*(str(index) for index in range(2000)))
+        keywords, rewritten = self.extractor.extract([run + steps("x"), steps("y") + run])
+
+        assert len(extended) == 1
+        assert [keyword.steps for keyword in keywords] == [run]
+        assert rewritten == [
+            ["    Recorded Steps 1", "    Step x"],
+            ["    Step y", "    Recorded Steps 1"],
+        ]
+
+    def test_runs_without_saving_are_dropped(self):
+        """Test that runs whose keyword would not shorten the tests are not candidates."""
+        extractor = KeywordExtractor(min_length=2)
+        sequences = [steps("a", "b", "x"), steps("a", "b", "y")]
+        assert extractor._candidates([[0, 1, 2], [0, 1, 3]]) == {}
+        assert extractor.extract(sequences) == ([], sequences)
+
+    def test_thresholds_are_validated(self):
+        """Test that thresholds below two are rejected."""
+        with pytest.raises(ValueError):
+            KeywordExtractor(min_length=1)
+        with pytest.raises(ValueError):
+            KeywordExtractor(min_occurrences=1)
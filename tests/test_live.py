@@ -0,0 +1,107 @@
+"""Tests for live incremental conversion."""
+
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.live import LiveConverter, read_if_changed
+
+HEADER = """from playwright.sync_api import Playwright, sync_playwright, expect
+
+
+def run(playwright: Playwright) -> None:
+    page = context.new_page()
+"""
+
+
+class TestLiveConverter:
+    """Test cases for LiveConverter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = PlaywrightToRobotConverter()
+
+    def assert_in_sync(self, output_file, code):
+        """Assert that the live output equals a full conversion of ``code``."""
+        with open(output_file, encoding="utf-8") as f:
+            assert f.read() == self.converter.convert(code, test_name="Live Test")
+
+    def test_appended_statements_only_reparse_the_tail(self, tmp_path):
+        """Test that appending statements reparses only the new lines."""
+        output_file = str(tmp_path / "live.robot")
+        live = LiveConverter(output_file, converter=self.converter, test_name="Live Test")
+
+        code = HEADER + '    page.goto("https://example.com")\n'
+        live.update(code)
+        self.assert_in_sync(output_file, code)
+
+        code += '    page.get_by_role("button", name="Sign in").click()\n'
+        assert live.update(code) == 2
+        self.assert_in_sync(output_file, code)
+        assert live.action_count == 2
+
+        assert live.update(code) == 0
+
+    def test_rewritten_statements(self, tmp_path):
+        """Test that edits in the middle of the script and removals stay in sync."""
+        output_file = str(tmp_path / "live.robot")
+        live = LiveConverter(output_file, converter=self.converter, test_name="Live Test")
+
+        code = HEADER + '    page.fill("#user", "ann")\n    page.click("#next")\n'
+        live.update(code)
+        code = HEADER + '    page.fill("#user", "anneke")\n    page.click("#next")\n'
+        live.update(code)
+        self.assert_in_sync(output_file, code)
+
+        code = HEADER
+        live.update(code)
+        self.assert_in_sync(output_file, code)
+        assert live.action_count == 0
+
+    def test_optimizer(self, tmp_path):
+        """Test that live output with an optimizer equals convert() and its report."""
+        self.converter = PlaywrightToRobotConverter(optimizer=ActionOptimizer())
+        output_file = str(tmp_path / "live.robot")
+        live = LiveConverter(output_file, converter=self.converter, test_name="Live Test")
+
+        code = HEADER + '    page.click("#user")\n    page.fill("#user", "ann")\n'
+        live.update(code)
+        code += '    page.fill("#user", "anneke")\n    page.click("#next")\n'
+        live.update(code)
+        live_report = dict(self.converter.optimizer.report)
+        with open(output_file, encoding="utf-8") as f:
+            output = f.read()
+
+        self.converter.optimizer.reset()
+        assert output == self.converter.convert(code, test_name="Live Test")
+        assert live_report == self.converter.optimizer.report
+        assert output.count("Fill Text") == 1
+        assert live.action_count == 2
+
+    def test_read_if_changed(self, tmp_path):
+        """Test that unchanged files are not read again."""
+        source = tmp_path / "script.py"
+        assert read_if_changed(str(source), None) == (None, None)
+
+        source.write_text("page.click('#a')\n")
+        content, stat = read_if_changed(str(source), None)
+        assert content == "page.click('#a')\n"
+        assert read_if_changed(str(source), stat) == (None, stat)
+
+    def test_ast_parser(self, tmp_path):
+        """Test that the AST backend is used for statements split over several lines."""
+        self.converter = PlaywrightToRobotConverter(parser="ast")
+        output_file = str(tmp_path / "live.robot")
+        live = LiveConverter(output_file, converter=self.converter, test_name="Live Test")
+
+        code = HEADER + '    page.get_by_role(\n        "button", name="Sign in"\n    ).click()\n'
+        live.update(code)
+        code += '    page.fill(\n        "#user",\n        "ann",\n    )\n'
+        live.update(code)
+
+        self.assert_in_sync(output_file, code)
+        with open(output_file, encoding="utf-8") as f:
+            output = f.read()
+        assert "Click    role=button[name='Sign in']" in output
+        assert "Fill Text    #user    ann" in output
+        assert live.action_count == 2
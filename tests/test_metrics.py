@@ -0,0 +1,218 @@
+"""Tests for session metrics export."""
+
+import io
+import json
+import subprocess
+
+import pytest
+
+from robotframework_browser_recorder import recorder as recorder_module
+from robotframework_browser_recorder.cache import package_version
+from robotframework_browser_recorder.cli.main import main
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.metrics import (
+    JsonLinesSink,
+    SessionMetrics,
+    is_statement,
+    make_sink,
+)
+from robotframework_browser_recorder.profiling import Profiler
+from robotframework_browser_recorder.recorder import BrowserRecorder
+
+CODE = """from playwright.sync_api import Playwright, sync_playwright, expect
+
+
+def run(playwright: Playwright) -> None:
+    page = context.new_page()
+    page.goto("https://example.com")
+    page.get_by_role("button", name="Sign in").click()
+    page.mouse.wheel(0, 100)
+    page.close()
+"""
+
+
+class FakeProcess:
+    """Stand-in for codegen that writes ``CODE`` and exits after one poll interval."""
+
+    returncode_on_exit = 0
+
+    def __init__(self, cmd, **kwargs):
+        """Write the recording to the output file passed with ``-o``."""
+        with open(cmd[cmd.index("-o") + 1], "w") as f:
+            f.write(CODE)
+        self.cmd = cmd
+        self.returncode = None
+        self.waited = False
+
+    def poll(self):
+        """Report the process as finished."""
+        self.returncode = self.returncode_on_exit
+        return self.returncode
+
+    def wait(self, timeout=None):
+        """Time out once, then exit."""
+        if timeout is not None and not self.waited:
+            self.waited = True
+            raise subprocess.TimeoutExpired(self.cmd, timeout)
+        return self.poll()
+
+    def terminate(self):
+        """Do nothing; the process is never running."""
+
+
+class FailingProcess(FakeProcess):
+    """Stand-in for codegen that exits with an error."""
+
+    returncode_on_exit = 1
+
+
+class TestSessionMetrics:
+    """Test cases for SessionMetrics and the sinks."""
+
+    def test_is_statement(self):
+        """Test which source lines count as recorded statements."""
+        assert is_statement('    page.goto("https://example.com")')
+        assert is_statement("    page1.close()")
+        assert is_statement('    expect(page).to_have_title("Shop")')
+        assert is_statement('    await page.click("#a")')
+        assert not is_statement("    page = context.new_page()")
+        assert not is_statement("    context.close()")
+
+    def test_version(self):
+        """Test that metrics report the same version as the conversion cache keys."""
+        assert SessionMetrics().version == package_version()
+
+    def test_convert(self):
+        """Test that the conversion is written and its statements and actions counted."""
+        converter = PlaywrightToRobotConverter()
+        metrics = SessionMetrics()
+        dst = io.StringIO()
+        written = metrics.convert(converter, io.StringIO(CODE), dst)
+        assert dst.getvalue() == converter.convert(CODE)
+        assert written == dst.getvalue().count("\n")
+        assert metrics.statements == 4
+        assert metrics.actions == 2
+        assert metrics.robot_steps == 2
+        assert metrics.unconverted_lines == 2
+
+    def test_convert_parses_once(self):
+        """Test that counting adds no parse, generate or cache lookups to the conversion."""
+        profiler = Profiler()
+        converter = PlaywrightToRobotConverter(profiler=profiler)
+        SessionMetrics().convert(converter, io.StringIO(CODE), io.StringIO())
+        calls = {(row["stage"], row["detail"]): row["calls"] for row in profiler.breakdown()}
+        assert calls[("parse", None)] == 1
+        assert calls[("extract", "click")] == 1
+        assert calls[("generate", "click")] == 1
+        info = converter.cache_info()["_extract_selector"]
+        assert (info.hits, info.misses) == (0, 1)
+
+    def test_convert_with_ast_parser_and_optimizer(self):
+        """Test counts with the AST backend and steps removed by the optimizer."""
+        code = CODE + '    page.click(\n        "#user"\n    )\n    page.fill("#user", "ann")\n'
+        converter = PlaywrightToRobotConverter(parser="ast", optimizer=ActionOptimizer())
+        metrics = SessionMetrics()
+        dst = io.StringIO()
+        metrics.convert(converter, io.StringIO(code), dst)
+        converter.optimizer.reset()
+        assert dst.getvalue() == converter.convert(code)
+        assert metrics.statements == 6
+        assert metrics.actions == 4
+        assert metrics.robot_steps == 3
+        assert metrics.unconverted_lines == 2
+
+    def test_convert_actions(self):
+        """Test counting already recorded actions."""
+        metrics = SessionMetrics()
+        actions = [Action("goto", value="https://example.com"), Action("drag_to", "#a", "#b")]
+        metrics.convert_actions(PlaywrightToRobotConverter(), actions, io.StringIO())
+        assert (metrics.statements, metrics.actions, metrics.robot_steps) == (2, 2, 1)
+        assert metrics.unconverted_lines == 1
+
+    def test_json_lines_sink_appends(self, tmp_path):
+        """Test that every record becomes one line of the file."""
+        path = tmp_path / "metrics" / "sessions.jsonl"
+        sink = JsonLinesSink(path)
+        sink({"session": 1})
+        sink({"session": 2})
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["session"] for line in lines] == [1, 2]
+
+    def test_make_sink(self, tmp_path):
+        """Test that callables are used as is and paths become file sinks."""
+        records = []
+        assert make_sink(records.append) == records.append
+        assert isinstance(make_sink(str(tmp_path / "m.jsonl")), JsonLinesSink)
+
+
+class TestRecorderMetrics:
+    """Test cases for metrics emitted by BrowserRecorder."""
+
+    def record(self, tmp_path, monkeypatch, process=FakeProcess, **kwargs):
+        """Run a fake recording session and return the emitted record."""
+        monkeypatch.setattr(recorder_module.subprocess, "Popen", process)
+        records = []
+        recorder = BrowserRecorder(
+            output_file=str(tmp_path / "test.robot"),
+            metrics_sink=records.append,
+            poll_interval=0.01,
+            **kwargs,
+        )
+        recorder.record()
+        assert len(records) == 1
+        return records[0]
+
+    def test_successful_session(self, tmp_path, monkeypatch):
+        """Test the record of a completed session."""
+        record = self.record(tmp_path, monkeypatch)
+
+        assert record["status"] == "ok"
+        assert record["error"] is None
+        assert record["statements"] == 4
+        assert record["actions"] == 2
+        assert record["unconverted_lines"] == 2
+        assert record["output_bytes"] == (tmp_path / "test.robot").stat().st_size
+        for key in ("codegen_start_seconds", "first_statement_seconds", "session_seconds"):
+            assert record[key] is not None
+        assert record["codegen_start_seconds"] <= record["first_statement_seconds"]
+        assert record["first_statement_seconds"] <= record["total_seconds"]
+
+    def test_live_session(self, tmp_path, monkeypatch):
+        """Test the record of a live session."""
+        record = self.record(tmp_path, monkeypatch, live=True)
+        assert record["live"] is True
+        assert record["statements"] == 4
+        assert record["actions"] == 2
+        assert record["unconverted_lines"] == 2
+        assert record["first_statement_seconds"] is not None
+        assert record["conversion_seconds"] > 0
+
+    def test_failed_session_is_reported(self, tmp_path, monkeypatch):
+        """Test that a failing codegen run still emits a record."""
+        monkeypatch.setattr(recorder_module.subprocess, "Popen", FailingProcess)
+        records = []
+        recorder = BrowserRecorder(
+            output_file=str(tmp_path / "test.robot"), metrics_sink=records.append
+        )
+        with pytest.raises(subprocess.CalledProcessError):
+            recorder.record()
+
+        assert len(records) == 1
+        assert records[0]["status"] == "failed"
+        assert "returned non-zero exit status 1" in records[0]["error"]
+        assert records[0]["session_seconds"] is not None
+        assert records[0]["output_bytes"] is None
+
+    def test_cli_metrics_file(self, tmp_path, monkeypatch):
+        """Test that --metrics appends a JSON line to the file."""
+        monkeypatch.setattr(recorder_module.subprocess, "Popen", FakeProcess)
+        metrics_file = tmp_path / "sessions.jsonl"
+        main(["--output", str(tmp_path / "test.robot"), "--metrics", str(metrics_file)])
+
+        record = json.loads(metrics_file.read_text())
+        assert record["status"] == "ok"
+        assert record["output_file"] == str(tmp_path / "test.robot")
@@ -0,0 +1,142 @@
+"""Tests for the action-stream optimizer."""
+
+import io
+
+import pytest
+
+from robotframework_browser_recorder.batch import BatchConverter
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.converter.optimizer import RULES, ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+
+NOISY = """page.goto("https://example.com")
+page.goto("https://example.com")
+page.click("#email")
+page.fill("#email", "u")
+page.fill("#email", "user@example.com")
+page.press("#search", "r")
+page.press("#search", "o")
+page.press("#search", "b")
+page.press("#search", "Enter")
+page.click("#submit")
+"""
+
+
+class TestActionOptimizer:
+    """Test cases for ActionOptimizer."""
+
+    def test_all_rules(self):
+        """Test that every rule removes its redundant steps and reports them."""
+        converter = PlaywrightToRobotConverter()
+        optimizer = ActionOptimizer()
+        actions = optimizer.optimize(converter._parse(NOISY))
+
+        assert actions == [
+            Action("goto", value="https://example.com"),
+            Action("fill", "#email", "user@example.com"),
+            Action("type", "#search", "rob"),
+            Action("press", "#search", "Enter"),
+            Action("click", "#submit"),
+        ]
+        assert optimizer.report == {
+            "click_before_fill": 1,
+            "repeated_fill": 1,
+            "duplicate_goto": 1,
+            "merge_presses": 2,
+        }
+        assert optimizer.removed == 5
+
+    def test_rules_can_be_switched_individually(self):
+        """Test that only enabled rules are applied."""
+        converter = PlaywrightToRobotConverter()
+        optimizer = ActionOptimizer(["duplicate_goto"])
+        actions = optimizer.optimize(converter._parse(NOISY))
+
+        assert len(actions) == 9
+        assert optimizer.report == {"duplicate_goto": 1}
+
+    def test_characters_are_appended_to_a_fill(self):
+        """Test that character presses after a fill extend the filled value."""
+        actions = [
+            Action("fill", "#q", "rob"),
+            Action("press", "#q", "o"),
+            Action("press", "#q", "t"),
+        ]
+        assert ActionOptimizer().optimize(actions) == [Action("fill", "#q", "robot")]
+
+    def test_spaces_are_not_merged(self):
+        """Test that space presses are kept, so values never end with a space."""
+        actions = [
+            Action("press", "#q", "h"),
+            Action("press", "#q", "i"),
+            Action("press", "#q", " "),
+            Action("fill", "#n", " "),
+            Action("press", "#n", " "),
+        ]
+        optimized = ActionOptimizer().optimize(actions)
+        assert optimized == [Action("type", "#q", "hi")] + actions[2:]
+
+        robot_code = PlaywrightToRobotConverter().convert(
+            'page.press("#q", "h")\npage.press("#q", "i")\npage.press("#q", " ")\n'
+        )
+        assert "    Keyboard Key    press    ${SPACE}\n" in robot_code
+
+    def test_different_selectors_are_kept(self):
+        """Test that steps on different fields are not merged."""
+        actions = [
+            Action("click", "#a"),
+            Action("fill", "#b", "x"),
+            Action("fill", "#a", "y"),
+            Action("press", "#b", "z"),
+        ]
+        optimizer = ActionOptimizer()
+        assert optimizer.optimize(actions) == actions
+        assert optimizer.removed == 0
+
+    def test_unknown_rule(self):
+        """Test that unknown rule names are rejected."""
+        with pytest.raises(ValueError, match="Unknown optimizer rule"):
+            ActionOptimizer(["no_such_rule"])
+
+    def test_rules_keep_registry_order(self):
+        """Test that rules run in registry order whatever order they are given in."""
+        assert ActionOptimizer(list(reversed(RULES))).rules == list(RULES)
+
+
+class TestConverterOptimization:
+    """Test cases for optimization inside the converter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = PlaywrightToRobotConverter(optimizer=ActionOptimizer())
+
+    def test_convert(self):
+        """Test that the generated test contains the optimized steps."""
+        robot_test = self.converter.convert(NOISY)
+        assert robot_test.count("New Page") == 1
+        assert "Click    #email" not in robot_test
+        assert "Fill Text    #email    user@example.com" in robot_test
+        assert "Type Text    #search    rob    clear=False" in robot_test
+
+    def test_stream_and_incremental_match_convert(self):
+        """Test that streaming and incremental conversion optimize the same way."""
+        expected = self.converter.convert(NOISY)
+        dst = io.StringIO()
+        self.converter.convert_stream(io.StringIO(NOISY), dst)
+        assert dst.getvalue() == expected
+
+        _, state = self.converter.convert_incremental(NOISY[:60])
+        output, _ = self.converter.convert_incremental(NOISY, previous=state)
+        assert output == expected
+
+    def test_batch_reports_removed_steps(self, tmp_path):
+        """Test that batch conversion aggregates the removed steps per rule."""
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.py").write_text(NOISY)
+
+        summary = BatchConverter(jobs=1, optimize=["repeated_fill"]).convert([str(tmp_path)])
+
+        assert summary.optimizations == {"repeated_fill": 2}
+        assert "removed 2 steps (repeated_fill 2)" in summary.format()
@@ -0,0 +1,178 @@
+"""Tests for the action plugin registry."""
+
+import pytest
+
+from robotframework_browser_recorder.cache import converter_fingerprint
+from robotframework_browser_recorder.converter import (
+    Action,
+    ActionPlugin,
+    PlaywrightToRobotConverter,
+    PluginRegistry,
+)
+from robotframework_browser_recorder.profiling import Profiler
+
+
+class DragTo(ActionPlugin):
+    """Plugin for ``locator.drag_to(target)``."""
+
+    action_types = ("drag_to",)
+
+    def parse(self, converter, method, line):
+        source, target = line.split(f".{method}(")
+        return Action(
+            "drag_to",
+            converter._extract_selector(source + ")"),
+            converter._extract_selector(target),
+        )
+
+    def convert(self, converter, action):
+        return f"Drag And Drop    {action.selector}    {action.value}"
+
+
+class PressSequentially(ActionPlugin):
+    """Plugin that maps ``press_sequentially`` onto the built-in ``type`` action."""
+
+    def parse(self, converter, method, line):
+        selector, text = converter._extract_fill_args(line.replace(f".{method}(", ".fill("))
+        return Action("type", selector, text)
+
+
+class Declining(ActionPlugin):
+    """Plugin that leaves every statement to the built-in parser."""
+
+
+class FakeEntryPoint:
+    """Entry point stand-in that counts how often it is loaded."""
+
+    def __init__(self, name, plugin):
+        self.name = name
+        self.value = f"tests.plugins:{name}"
+        self.plugin = plugin
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        if isinstance(self.plugin, Exception):
+            raise self.plugin
+        return self.plugin
+
+
+class TestPluginRegistry:
+    """Test cases for plugins in the converter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.entry_points = {
+            "drag_to": FakeEntryPoint("drag_to", DragTo),
+            "press_sequentially": FakeEntryPoint("press_sequentially", PressSequentially()),
+            "click": FakeEntryPoint("click", Declining),
+            "broken": FakeEntryPoint("broken", ImportError("no module named broken")),
+        }
+        self.registry = PluginRegistry(self.entry_points.values())
+        self.converter = PlaywrightToRobotConverter(plugins=self.registry)
+
+    def loads(self):
+        """Return how often each entry point was loaded."""
+        return {name: entry_point.loads for name, entry_point in self.entry_points.items()}
+
+    def test_plugins_load_lazily(self):
+        """Test that a plugin is imported only once its method is used."""
+        self.converter.convert('page.goto("https://example.com")')
+        assert set(self.loads().values()) == {0}
+
+        code = (
+            'page.locator("#a").drag_to(page.locator("#b"))\n'
+            'page.locator("#c").drag_to(page.locator("#d"))'
+        )
+        robot = self.converter.convert(code)
+
+        assert "    Drag And Drop    #a    #b\n    Drag And Drop    #c    #d\n" in robot
+        assert self.loads() == {"drag_to": 1, "press_sequentially": 0, "click": 0, "broken": 0}
+
+    def test_plugin_returning_builtin_action(self):
+        """Test that a plugin can produce actions of built-in types."""
+        robot = self.converter.convert('page.locator("#q").press_sequentially("robot")')
+        assert "    Type Text    #q    robot    clear=False\n" in robot
+
+    def test_declining_plugin_falls_back(self):
+        """Test that statements a plugin declines are parsed by the built-in parser."""
+        robot = self.converter.convert('page.locator("#a").click()')
+        assert "    Click    #a\n" in robot
+        assert self.entry_points["click"].loads == 1
+
+    def test_ast_parser(self):
+        """Test that the AST backend hands multi-line statements to plugins."""
+        converter = PlaywrightToRobotConverter(parser="ast", plugins=self.registry)
+        code = 'page.locator("#a").drag_to(\n    page.locator("#b")\n)\npage.locator("#c").click()'
+        robot = converter.convert(code)
+        assert "    Drag And Drop    #a    #b\n    Click    #c\n" in robot
+
+    def test_convert_actions_loads_by_type(self):
+        """Test that converting a plugin action type loads its plugin."""
+        robot = self.converter.convert_actions([Action("drag_to", "#a", "#b")])
+        assert "    Drag And Drop    #a    #b\n" in robot
+        assert self.entry_points["drag_to"].loads == 1
+
+    def test_broken_plugin_warns(self):
+        """Test that a plugin failing to import is dropped with a warning."""
+        with pytest.warns(UserWarning, match="broken"):
+            assert self.registry.get("broken") is None
+        assert "broken" not in self.registry.names
+        assert self.converter._parse_line('page.locator("#a").broken()') is None
+
+    def test_register(self):
+        """Test that plugins can be registered without entry points."""
+        registry = PluginRegistry()
+        registry.register("drag_to", DragTo())
+        converter = PlaywrightToRobotConverter(plugins=registry)
+        robot = converter.convert('page.locator("#a").drag_to(page.locator("#b"))')
+        assert "Drag And Drop    #a    #b" in robot
+
+    def test_fingerprint_is_stable(self):
+        """Test that loading plugins does not change the cache fingerprint."""
+        before = converter_fingerprint(self.converter)
+        self.converter.convert('page.locator("#a").drag_to(page.locator("#b"))')
+        assert converter_fingerprint(self.converter) == before
+        assert before["plugins"]["drag_to"] == "tests.plugins:drag_to"
+
+    def test_fingerprint_depends_on_plugin_versions(self):
+        """Test that upgrading a plugin distribution changes the cache fingerprint."""
+
+        def fingerprint(version):
+            registry = PluginRegistry(self.entry_points.values(), {"drag_to": version})
+            return converter_fingerprint(PlaywrightToRobotConverter(plugins=registry))
+
+        assert fingerprint("1.0")["plugins"]["drag_to"] == "tests.plugins:drag_to==1.0"
+        assert fingerprint("1.0") != fingerprint("1.1")
+        assert set(self.loads().values()) == {0}
+
+    def test_fingerprint_depends_on_registered_plugin_code(self):
+        """Test that editing a registered plugin changes the cache fingerprint."""
+
+        class EditedDragTo(DragTo):
+            def convert(self, converter, action):
+                return f"Drag And Drop Relative To    {action.selector}    {action.value}"
+
+        def code_digest(plugin):
+            registry = PluginRegistry()
+            registry.register("drag_to", plugin)
+            fingerprint = converter_fingerprint(PlaywrightToRobotConverter(plugins=registry))
+            source, digest = fingerprint["plugins"]["drag_to"].rsplit(":", 1)
+            return digest
+
+        assert code_digest(DragTo()) == code_digest(DragTo())
+        assert code_digest(DragTo()) != code_digest(EditedDragTo())
+
+    def test_from_entry_points(self):
+        """Test that the installed entry points are read with their versions."""
+        assert PluginRegistry.from_entry_points("no_such_group").describe() == {}
+        registry = PluginRegistry.from_entry_points("console_scripts")
+        assert registry.describe()["pytest"].endswith(f"=={pytest.__version__}")
+
+    def test_profiled_plugins(self):
+        """Test that plugin handlers are timed like built-in ones."""
+        profiler = Profiler()
+        converter = PlaywrightToRobotConverter(profiler=profiler, plugins=self.registry)
+        converter.convert('page.locator("#a").drag_to(page.locator("#b"))')
+        assert ("extract", "drag_to") in profiler.stats
+        assert ("generate", "drag_to") in profiler.stats
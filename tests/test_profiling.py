@@ -0,0 +1,179 @@
+"""Tests for per-stage profiling."""
+
+import io
+import json
+import time
+
+from robotframework_browser_recorder import recorder as recorder_module
+from robotframework_browser_recorder.cli.main import main
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.profiling import Profiler
+from robotframework_browser_recorder.recorder import BrowserRecorder
+
+CODE = """from playwright.sync_api import Playwright, sync_playwright, expect
+
+
+def run(playwright: Playwright) -> None:
+    page.goto("https://example.com")
+    page.get_by_role("button", name="Sign in").click()
+    page.get_by_role("button", name="Sign in").click()
+    page.get_by_label("Email").fill("user@example.com")
+    expect(page.locator("#welcome")).to_be_visible()
+"""
+
+
+class FakeProcess:
+    """Stand-in for the codegen process that writes a recording and exits."""
+
+    def __init__(self, cmd):
+        """Write ``CODE`` to the output file passed with ``-o``."""
+        with open(cmd[cmd.index("-o") + 1], "w") as f:
+            f.write(CODE)
+        self.returncode = None
+
+    def poll(self):
+        """Report the process as finished."""
+        self.returncode = 0
+        return 0
+
+    def wait(self):
+        """Return immediately with a zero exit status."""
+        self.returncode = 0
+        return 0
+
+    def terminate(self):
+        """Do nothing; the process is never running."""
+
+
+class TestProfiler:
+    """Test cases for Profiler."""
+
+    def test_record_accumulates_per_stage_and_detail(self):
+        """Test that calls and time are summed per stage and detail."""
+        profiler = Profiler()
+        profiler.record("extract", 0.5, "click")
+        profiler.record("extract", 0.25, "click")
+        profiler.record("extract", 1.0, "fill")
+
+        rows = profiler.breakdown()
+        assert rows[0] == {"stage": "extract", "detail": "fill", "calls": 1, "seconds": 1.0}
+        assert rows[1] == {"stage": "extract", "detail": "click", "calls": 2, "seconds": 0.75}
+
+    def test_hooks_receive_events(self):
+        """Test that registered callbacks are called for every finished stage."""
+        events = []
+        profiler = Profiler()
+        profiler.add_hook(lambda stage, detail, seconds: events.append((stage, detail)))
+
+        with profiler.stage("parse"):
+            pass
+        profiler.wrap(len, "generate", "click")([1, 2])
+
+        assert events == [("parse", None), ("generate", "click")]
+
+    def test_format_and_json(self):
+        """Test the table and JSON renderings of the breakdown."""
+        profiler = Profiler()
+        profiler.record("parse", 0.002)
+        assert "parse" in profiler.format()
+        assert json.loads(profiler.to_json())["stages"][0]["calls"] == 1
+
+
+class TestConverterProfiling:
+    """Test cases for the converter's profiling hooks."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.profiler = Profiler()
+        self.converter = PlaywrightToRobotConverter(profiler=self.profiler)
+
+    def stats(self):
+        """Return the collected call counts keyed by (stage, detail)."""
+        return {(row["stage"], row["detail"]): row["calls"] for row in self.profiler.breakdown()}
+
+    def test_output_is_unchanged(self):
+        """Test that profiling does not change the generated test."""
+        assert self.converter.convert(CODE) == PlaywrightToRobotConverter().convert(CODE)
+
+    def test_convert_records_stages_per_action_type(self):
+        """Test that parse, extract, simplify and generate are recorded."""
+        self.converter.convert(CODE)
+        stats = self.stats()
+
+        assert stats[("parse", None)] == 1
+        assert stats[("extract", "goto")] == 1
+        assert stats[("extract", "click")] == 2
+        assert stats[("extract", "fill")] == 1
+        assert stats[("extract", "expect")] == 1
+        assert stats[("generate", "click")] == 2
+        assert stats[("generate", "expect_visible")] == 1
+        # The repeated click selector is served from the cache.
+        assert stats[("simplify", None)] == 3
+
+    def test_assertions_are_extracted_once(self):
+        """Test that extract time of assertions is counted once and stays within parse."""
+        code = 'expect(page.locator("#welcome")).to_have_text("Hello")\n' * 2000
+        start = time.perf_counter()
+        self.converter.convert(code)
+        total = time.perf_counter() - start
+
+        seconds = {
+            (row["stage"], row["detail"]): row["seconds"] for row in self.profiler.breakdown()
+        }
+        extract = [detail for stage, detail in seconds if stage == "extract"]
+        assert extract == ["expect"]
+        assert self.stats()[("extract", "expect")] == 2000
+        assert seconds[("extract", "expect")] <= seconds[("parse", None)] <= total
+
+    def test_convert_stream_records_parse_and_writes(self):
+        """Test that streaming conversion records one parse and one write per line."""
+        dst = io.StringIO()
+        written = self.converter.convert_stream(io.StringIO(CODE), dst)
+        stats = self.stats()
+        assert stats[("parse", None)] == 1
+        assert stats[("write", None)] == written == dst.getvalue().count("\n")
+        assert stats[("extract", "click")] == 2
+
+    def test_ast_parser_stages(self):
+        """Test that the AST backend records one parse and one write per line."""
+        self.converter = PlaywrightToRobotConverter(parser="ast", profiler=self.profiler)
+        dst = io.StringIO()
+        written = self.converter.convert_stream(io.StringIO(CODE), dst)
+        assert dst.getvalue() == PlaywrightToRobotConverter(parser="ast").convert(CODE)
+        assert self.stats()[("parse", None)] == 1
+        assert self.stats()[("write", None)] == written
+
+        self.converter.convert_stream(io.StringIO(CODE + "page.click("), io.StringIO())
+        assert self.stats()[("parse", None)] == 2
+
+
+class TestRecorderProfiling:
+    """Test cases for profiling a recording session."""
+
+    def test_session_stages(self, tmp_path, monkeypatch):
+        """Test that codegen start, session and conversion are recorded."""
+        monkeypatch.setattr(recorder_module.subprocess, "Popen", FakeProcess)
+        profiler = Profiler()
+        output_file = tmp_path / "test.robot"
+        recorder = BrowserRecorder(output_file=str(output_file), profiler=profiler)
+
+        recorder.record()
+
+        calls = {(row["stage"], row["detail"]): row["calls"] for row in profiler.breakdown()}
+        assert {"codegen_start", "session", "convert", "extract", "generate"} <= {
+            stage for stage, _ in calls
+        }
+        content = output_file.read_text()
+        assert content == PlaywrightToRobotConverter().convert(CODE)
+        assert calls[("parse", None)] == 1
+        assert calls[("write", None)] == content.count("\n")
+
+    def test_cli_profile_json(self, tmp_path, monkeypatch, capsys):
+        """Test that --profile json prints the breakdown as JSON."""
+        monkeypatch.setattr(recorder_module.subprocess, "Popen", FakeProcess)
+        main(["--output", str(tmp_path / "test.robot"), "--profile", "json"])
+
+        stages = json.loads(capsys.readouterr().err)["stages"]
+        assert {"codegen_start", "session", "convert"} <= {row["stage"] for row in stages}
@@ -0,0 +1,283 @@
+"""Tests for the local conversion server."""
+
+import http.client
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from robotframework_browser_recorder.cli.main import main
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.server import (
+    ConversionServer,
+    ServerMetrics,
+    parse_job,
+    percentile,
+)
+
+CODE = """page.goto("https://example.com")
+page.click("#login")
+page.click("#login")
+page.fill("#user", "alice")
+"""
+
+
+def request(server, path, body=None, data=None):
+    """Send a request to ``server``; return the status and the decoded JSON response."""
+    if body is not None:
+        data = json.dumps(body).encode("utf-8")
+    req = urllib.request.Request(server.url + path, data=data)
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a server with two workers for the tests of this module."""
+    with ConversionServer(port=0, workers=2, max_queue=2) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+class TestParseJob:
+    """Test cases for validating /convert requests."""
+
+    def test_defaults(self):
+        """Test that only the code is required."""
+        assert parse_job({"code": CODE}) == (
+            CODE,
+            "Recorded Test",
+            "Recorded Test Suite",
+            "chromium",
+            False,
+            "regex",
+            None,
+        )
+
+    def test_options(self):
+        """Test that options are read and optimizer rules normalized."""
+        job = parse_job(
+            {
+                "code": CODE,
+                "test_name": "Login",
+                "browser": "firefox",
+                "headless": True,
+                "parser": "ast",
+                "optimize": ["repeated_fill", "click_before_fill"],
+            }
+        )
+        assert job[1:6] == ("Login", "Recorded Test Suite", "firefox", True, "ast")
+        assert job[6] == ("click_before_fill", "repeated_fill")
+        assert parse_job({"code": CODE, "optimize": True})[6] == tuple(ActionOptimizer().rules)
+
+    @pytest.mark.parametrize(
+        "body, message",
+        [
+            ([], "JSON object"),
+            ({}, "'code'"),
+            ({"code": CODE, "parser": "lxml"}, "'parser' must be one of"),
+            ({"code": CODE, "browser": "edge"}, "'browser' must be one of"),
+            ({"code": CODE, "test_name": ""}, "'test_name'"),
+            ({"code": CODE, "headless": "yes"}, "'headless'"),
+            ({"code": CODE, "optimize": "all"}, "'optimize'"),
+            ({"code": CODE, "optimize": ["unknown"]}, "Unknown optimizer rule"),
+        ],
+    )
+    def test_invalid(self, body, message):
+        """Test that invalid requests are rejected with a message."""
+        with pytest.raises(ValueError, match=message):
+            parse_job(body)
+
+
+class TestServerMetrics:
+    """Test cases for ServerMetrics."""
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile(values, 100) == 100
+        assert percentile([7], 50) == 7
+        assert percentile([], 50) == 0.0
+
+    def test_snapshot(self):
+        """Test counts, latencies and that rejections are not timed."""
+        metrics = ServerMetrics()
+        for ms in range(1, 101):
+            metrics.record(200, ms / 1000)
+        metrics.record(400, 0.5)
+        metrics.record(503, 0.0)
+
+        snapshot = metrics.snapshot(workers=4)
+        assert snapshot["requests"] == 102
+        assert snapshot["converted"] == 100
+        assert snapshot["errors"] == 1
+        assert snapshot["rejected"] == 1
+        assert snapshot["statuses"] == {"200": 100, "400": 1, "503": 1}
+        assert snapshot["latency_ms"]["p50"] == 51.0
+        assert snapshot["latency_ms"]["max"] == 500.0
+        assert snapshot["latency_samples"] == 101
+        assert snapshot["throughput_per_second"] > 0
+        assert snapshot["workers"] == 4
+
+    def test_throughput_window(self):
+        """Test that requests older than the window do not count for the throughput."""
+        metrics = ServerMetrics(window=0.05)
+        metrics.record(200, 0.01)
+        time.sleep(0.1)
+        snapshot = metrics.snapshot()
+        assert snapshot["throughput_per_second"] == 0.0
+        assert snapshot["latency_samples"] == 1
+
+
+class TestConversionServer:
+    """Test cases for the HTTP endpoints of ConversionServer."""
+
+    def setup_method(self):
+        """Create a local converter to compare the server's output against."""
+        self.converter = PlaywrightToRobotConverter()
+
+    def test_convert(self, server):
+        """Test that the server converts like the library does."""
+        status, body = request(server, "/convert", {"code": CODE, "test_name": "Login"})
+        assert status == 200
+        assert body["robot"] == self.converter.convert(CODE, test_name="Login")
+
+    def test_convert_options(self, server):
+        """Test that parser, browser and optimizer options are applied."""
+        status, body = request(
+            server,
+            "/convert",
+            {"code": CODE, "parser": "ast", "browser": "webkit", "optimize": True},
+        )
+        assert status == 200
+        expected = PlaywrightToRobotConverter(parser="ast", optimizer=ActionOptimizer()).convert(
+            CODE, browser="webkit"
+        )
+        assert body["robot"] == expected
+
+    def test_concurrent_requests(self, server):
+        """Test that concurrent requests are all served."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda i: request(server, "/convert", {"code": CODE, "test_name": f"T{i}"}),
+                    range(4),
+                )
+            )
+        assert [status for status, _ in results] == [200] * 4
+        assert [body["robot"].split("\n")[5] for _, body in results] == ["T0", "T1", "T2", "T3"]
+
+    def test_bad_requests(self, server):
+        """Test that invalid bodies get 400 and unknown endpoints 404 or 405."""
+        status, body = request(server, "/convert", data=b"{not json")
+        assert status == 400
+        assert "error" in body
+        assert request(server, "/convert", {"code": CODE, "parser": "lxml"})[0] == 400
+        assert request(server, "/missing", {"code": CODE})[0] == 404
+        assert request(server, "/missing")[0] == 404
+        assert request(server, "/convert")[0] == 405
+
+    def test_body_limit(self, server, monkeypatch):
+        """Test that bodies beyond the limit are rejected with 413."""
+        monkeypatch.setattr(server, "max_body_bytes", 100)
+        status, body = request(server, "/convert", {"code": "x" * 200})
+        assert status == 413
+        assert "100 bytes" in body["error"]
+
+    @pytest.mark.parametrize(
+        "length, status",
+        [(None, 411), ("-1", 400), ("ten", 400), (str(100 * 1024 * 1024), 413)],
+    )
+    def test_invalid_content_length(self, server, length, status):
+        """Test that bad Content-Length headers are rejected without reading the body."""
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+        try:
+            connection.putrequest("POST", "/convert")
+            if length is not None:
+                connection.putheader("Content-Length", length)
+            connection.endheaders(b'{"code": ""}')
+            response = connection.getresponse()
+            assert response.status == status
+            assert "error" in json.load(response)
+        finally:
+            connection.close()
+
+    def test_queue_limit(self, server):
+        """Test that requests beyond the workers and the queue are rejected with 503."""
+        held = 0
+        try:
+            while server.admit():
+                held += 1
+            assert held == server.workers + server.max_queue
+            status, body = request(server, "/convert", {"code": CODE})
+        finally:
+            for _ in range(held):
+                server.release()
+        assert status == 503
+        assert body["error"] == "Too many queued requests"
+        assert request(server, "/convert", {"code": CODE})[0] == 200
+
+    def test_metrics(self, server):
+        """Test that the metrics endpoint reports requests, latency and load."""
+        request(server, "/convert", {"code": CODE})
+        status, metrics = request(server, "/metrics")
+
+        assert status == 200
+        assert metrics["converted"] >= 1
+        assert metrics["workers"] == 2
+        assert metrics["max_queue"] == 2
+        assert metrics["in_flight"] == 0
+        assert metrics["queued"] == 0
+        assert set(metrics["latency_ms"]) == {"p50", "p90", "p95", "p99", "max"}
+        assert 0 < metrics["latency_ms"]["p50"] <= metrics["latency_ms"]["max"]
+        assert metrics["throughput_per_second"] > 0
+
+    def test_workers_are_started(self, server):
+        """Test that every worker process is started before the server serves."""
+        assert len(set(server.worker_pids)) == server.workers
+        assert set(server.worker_pids) == set(server._executor._processes)
+
+    def test_health(self, server):
+        """Test the health endpoint."""
+        assert request(server, "/health") == (200, {"status": "ok", "workers": 2})
+
+    def test_listens_on_loopback_only(self, server):
+        """Test that the server is bound to 127.0.0.1."""
+        assert server.url.startswith("http://127.0.0.1:")
+
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [
+            (["--workers", "0"], "a positive integer"),
+            (["--workers", "two"], "a positive integer"),
+            (["--max-queue", "-1"], "a non-negative integer"),
+        ],
+    )
+    def test_invalid_cli_settings(self, argv, expected, capsys):
+        """Test that invalid pool settings of ``serve`` are rejected by argparse."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["serve"] + argv)
+        assert exc_info.value.code == 2
+        assert f"expected {expected}" in capsys.readouterr().err
+
+    def test_invalid_settings(self):
+        """Test that invalid pool settings are rejected before anything starts."""
+        with pytest.raises(ValueError):
+            ConversionServer(workers=-1)
+        with pytest.raises(ValueError):
+            ConversionServer(max_queue=-1)
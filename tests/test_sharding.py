@@ -0,0 +1,163 @@
+"""Tests for runtime-balanced sharding."""
+
+import pytest
+
+from robotframework_browser_recorder.cli.main import main
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.sharding import (
+    RuntimeWeights,
+    plan_shards,
+    suite_name,
+    write_shards,
+)
+from robotframework_browser_recorder.suite import SuiteBuilder, SuiteTest
+
+OUTPUT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<robot generator="Robot 7.0" generated="2024-01-01T00:00:00.000000" rpa="false" schemaversion="5">
+<suite id="s1" name="Suite" source="/tmp/suite.robot">
+<test id="s1-t1" name="Login" line="10">
+<kw name="New Page" owner="Browser">
+<arg>https://example.com</arg>
+<status status="PASS" start="2024-01-01T00:00:00.000000" elapsed="3.000"/>
+</kw>
+<kw name="Click" owner="Browser">
+<status status="PASS" start="2024-01-01T00:00:03.000000" elapsed="0.500"/>
+</kw>
+<kw name="Click" owner="Browser">
+<status status="PASS" start="2024-01-01T00:00:03.500000" elapsed="0.300"/>
+</kw>
+<status status="PASS" start="2024-01-01T00:00:00.000000" elapsed="5.800"/>
+</test>
+<status status="PASS" start="2024-01-01T00:00:00.000000" elapsed="6.000"/>
+</suite>
+<errors>
+</errors>
+</robot>
+"""
+
+
+def make_test(name, gotos=0, clicks=0):
+    """Return a test with the given number of navigations and clicks."""
+    actions = [Action("goto", value="https://example.com") for _ in range(gotos)]
+    actions += [Action("click", "text=Next") for _ in range(clicks)]
+    return SuiteTest(name=name, actions=actions)
+
+
+class TestRuntimeWeights:
+    """Test cases for RuntimeWeights."""
+
+    def test_estimate(self):
+        """Test that every kind of step adds its weight."""
+        weights = RuntimeWeights(test=1, goto=2, wait=3, interaction=0.5)
+        actions = [
+            Action("goto", value="https://example.com"),
+            Action("wait_for_load_state", value="networkidle"),
+            Action("click", "#a"),
+            Action("fill", "#b", "x"),
+        ]
+        assert weights.estimate(actions) == 7
+
+    def test_parse(self):
+        """Test that weights are parsed from name=value pairs."""
+        weights = RuntimeWeights.parse("goto=2.5, wait=0")
+        assert weights == RuntimeWeights(goto=2.5, wait=0)
+
+    @pytest.mark.parametrize("spec", ["speed=1", "goto=fast", "goto=-1"])
+    def test_parse_invalid(self, spec):
+        """Test that unknown names and bad values are rejected."""
+        with pytest.raises(ValueError):
+            RuntimeWeights.parse(spec)
+
+    def test_from_output_xml(self, tmp_path):
+        """Test that weights are learned from keyword timings."""
+        pytest.importorskip("robot")
+        output = tmp_path / "output.xml"
+        output.write_text(OUTPUT_XML)
+
+        weights = RuntimeWeights.from_output_xml([str(output)], RuntimeWeights(wait=9))
+
+        assert weights.goto == pytest.approx(3.0)
+        assert weights.interaction == pytest.approx(0.4)
+        assert weights.test == pytest.approx(2.0)
+        assert weights.wait == 9
+
+
+class TestShards:
+    """Test cases for planning and writing shards."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.weights = RuntimeWeights(test=0, goto=1, wait=1, interaction=1)
+
+    def test_plan_balances_runtime(self):
+        """Test that shards get roughly equal runtimes."""
+        tests = [make_test(f"T{size}", clicks=size) for size in (8, 7, 6, 5, 4, 3, 2, 1)]
+        shards = plan_shards(tests, 3, self.weights)
+
+        runtimes = [shard.runtime for shard in shards]
+        assert sum(runtimes) == 36
+        assert max(runtimes) <= 13
+        assert sorted(test.name for shard in shards for test in shard.tests) == sorted(
+            test.name for test in tests
+        )
+
+    def test_plan_keeps_test_order(self):
+        """Test that tests keep their order within a shard."""
+        tests = [make_test("A", clicks=1), make_test("B", clicks=5), make_test("C", clicks=1)]
+        shards = plan_shards(tests, 2, self.weights)
+        assert [[test.name for test in shard.tests] for shard in shards] == [["B"], ["A", "C"]]
+
+    def test_plan_drops_empty_shards(self):
+        """Test that no empty shards are planned for few tests."""
+        assert len(plan_shards([make_test("A")], 4)) == 1
+        with pytest.raises(ValueError):
+            plan_shards([], 0)
+
+    def test_suite_name(self):
+        """Test that suite names follow Robot Framework's rules."""
+        assert suite_name("out/shard_01.robot") == "Shard 01"
+        assert suite_name("/tmp/02__my_Tests") == "my Tests"
+        assert suite_name("suites/release.2024") == "Release.2024"
+
+    def test_write_shards_to_dotted_directory(self, tmp_path):
+        """Test that the ordering file names a dotted output directory in full."""
+        builder = SuiteBuilder()
+        builder.tests = [make_test("A"), make_test("B")]
+        output = tmp_path / "release.2024"
+        write_shards(builder, str(output), 2)
+        assert sorted((output / "pabot_order.txt").read_text().splitlines()) == [
+            "--suite Release.2024.Shard 01",
+            "--suite Release.2024.Shard 02",
+        ]
+
+    def test_write_shards(self, tmp_path):
+        """Test that shard suites and a pabot ordering file are written."""
+        builder = SuiteBuilder()
+        builder.tests = [make_test("A", gotos=1), make_test("B", gotos=3), make_test("C")]
+        output = tmp_path / "shards"
+
+        shards, ordering = write_shards(builder, str(output), 2, self.weights)
+
+        assert [path for path, _ in shards] == [
+            str(output / "shard_01.robot"),
+            str(output / "shard_02.robot"),
+        ]
+        assert "\nB\n" in (output / "shard_01.robot").read_text()
+        assert (output / "pabot_order.txt").read_text() == (
+            "--suite Shards.Shard 01\n--suite Shards.Shard 02\n"
+        )
+        assert ordering == str(output / "pabot_order.txt")
+
+    def test_cli(self, tmp_path):
+        """Test that the suite command writes shards."""
+        for name in ("one", "two", "three"):
+            (tmp_path / f"{name}.py").write_text('    page.goto("https://example.com")\n')
+        output = tmp_path / "out"
+
+        main(["suite", str(tmp_path), "--shards", "2", "-o", str(output), "--weights", "goto=2"])
+
+        assert sorted(path.name for path in output.iterdir()) == [
+            "pabot_order.txt",
+            "shard_01.robot",
+            "shard_02.robot",
+        ]
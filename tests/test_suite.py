@@ -0,0 +1,118 @@
+"""Tests for assembling recordings into one suite."""
+
+import pytest
+
+from robotframework_browser_recorder.cli.main import main
+from robotframework_browser_recorder.converter.actions import Action
+from robotframework_browser_recorder.keywords import KeywordExtractor
+from robotframework_browser_recorder.suite import SuiteBuilder
+
+LOGIN = """from playwright.sync_api import Playwright, sync_playwright, expect
+
+
+def run(playwright: Playwright) -> None:
+    page.goto("https://example.com/login")
+    page.get_by_label("Email").fill("user@example.com")
+    page.get_by_role("button", name="Sign in").click()
+"""
+
+SEARCH = """    page.goto("https://example.com/search")
+    page.get_by_placeholder("Search").fill("robot")
+"""
+
+EXPECTED = """*** Settings ***
+Library    Browser
+Suite Setup    New Browser    firefox    headless=True
+Suite Teardown    Close Browser    ALL
+Test Setup    New Context    viewport={'width': 1920, 'height': 1080}
+Test Teardown    Close Context
+
+
+*** Test Cases ***
+Login
+    New Page    https://example.com/login
+    Fill Text    Email    user@example.com
+    Click    role=button[name='Sign in']
+
+Search
+    New Page    https://example.com/search
+    Fill Text    placeholder=Search    robot
+"""
+
+
+class TestSuiteBuilder:
+    """Test cases for SuiteBuilder."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.builder = SuiteBuilder(browser="firefox", headless=True)
+
+    def test_build(self):
+        """Test that the browser is launched once and every test gets a context."""
+        self.builder.add(LOGIN, "Login")
+        self.builder.add(SEARCH, "Search")
+        suite = self.builder.build()
+        assert suite == EXPECTED
+        assert suite.count("New Browser") == 1
+
+    def test_duplicate_names_are_numbered(self):
+        """Test that repeated test names are made unique."""
+        names = [self.builder.add(LOGIN, "Login").name for _ in range(3)]
+        assert names == ["Login", "Login 2", "Login 3"]
+
+    def test_page_is_opened_without_initial_goto(self):
+        """Test that a test not starting with a navigation opens a page first."""
+        self.builder.add_actions([Action("click", "#menu")], "Menu")
+        assert "Menu\n    New Page\n    Click    #menu\n" in self.builder.build()
+
+    def test_suite_is_valid_robot(self):
+        """Test that the assembled suite parses cleanly."""
+        pytest.importorskip("robot")
+        from robotframework_browser_recorder.validation import validate_robot
+
+        self.builder.add(LOGIN, "Login")
+        self.builder.add_actions([], "Empty Recording")
+        assert validate_robot(self.builder.build()) == []
+
+    def test_cli(self, tmp_path):
+        """Test that the suite command writes one test per script."""
+        (tmp_path / "login.py").write_text(LOGIN)
+        (tmp_path / "search.py").write_text(SEARCH)
+        output = tmp_path / "out" / "suite.robot"
+
+        main(["suite", str(tmp_path), "--output", str(output), "-b", "firefox", "--headless"])
+
+        assert output.read_text() == EXPECTED
+
+    def test_extract_keywords(self):
+        """Test that steps repeated across tests are moved to a keyword."""
+        pytest.importorskip("robot")
+        from robotframework_browser_recorder.validation import validate_robot
+
+        self.builder.keyword_extractor = KeywordExtractor()
+        self.builder.add(LOGIN, "Login")
+        self.builder.add(LOGIN + SEARCH, "Login And Search")
+        suite = self.builder.build()
+
+        assert "Login\n    Recorded Steps 1\n\n" in suite
+        assert "Login And Search\n    Recorded Steps 1\n    New Page    https" in suite
+        assert suite.endswith(
+            "*** Keywords ***\n"
+            "Recorded Steps 1\n"
+            "    New Page    https://example.com/login\n"
+            "    Fill Text    Email    user@example.com\n"
+            "    Click    role=button[name='Sign in']\n"
+        )
+        assert validate_robot(suite) == []
+
+    def test_cli_extract_keywords(self, tmp_path):
+        """Test that the suite command extracts keywords on request."""
+        (tmp_path / "login.py").write_text(LOGIN)
+        (tmp_path / "login_again.py").write_text(LOGIN)
+        output = tmp_path / "suite.robot"
+
+        main(["suite", str(tmp_path), "--output", str(output), "--extract-keywords"])
+
+        suite = output.read_text()
+        assert "*** Keywords ***\nRecorded Steps 1\n" in suite
+        assert suite.count("Fill Text") == 1
@@ -0,0 +1,141 @@
+"""Tests for validation of generated tests with Robot Framework's parser."""
+
+import pytest
+
+from robotframework_browser_recorder.batch import BatchConverter
+from robotframework_browser_recorder.converter.optimizer import ActionOptimizer
+from robotframework_browser_recorder.converter.playwright_to_robot import (
+    PlaywrightToRobotConverter,
+)
+from robotframework_browser_recorder.validation import (
+    source_line_map,
+    validate_file,
+    validate_robot,
+)
+
+pytest.importorskip("robot")
+
+VALID = """from playwright.sync_api import Playwright, sync_playwright, expect
+
+def run(playwright: Playwright) -> None:
+    page.goto("https://example.com")
+    page.get_by_role("button", name="Sign in").click()
+    page.get_by_label("Email").fill("user@example.com")
+    expect(page).to_have_title("Shop")
+"""
+
+INVALID = """from playwright.sync_api import Playwright, sync_playwright, expect
+
+def run(playwright: Playwright) -> None:
+    page.goto("https://example.com")
+    page.click("#submit")
+    page.fill("[name=q]", "two    spaces")
+    page.fill("[name=q]", "${not closed")
+"""
+
+
+class TestValidation:
+    """Test cases for validate_robot and validate_file."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = PlaywrightToRobotConverter()
+
+    def test_valid_test_has_no_issues(self):
+        """Test that a regular conversion passes validation."""
+        assert validate_robot(self.converter.convert(VALID)) == []
+
+    def test_parser_errors(self):
+        """Test that errors of Robot Framework's parser are reported."""
+        issues = validate_robot("*** Test Cases ***\nEmpty\n*** Bogus ***\n")
+        assert issues
+        assert issues[0].line == 2
+
+    def test_issues_are_mapped_to_statements(self, tmp_path):
+        """Test that issues point at the Playwright statement they came from."""
+        source = tmp_path / "flow.py"
+        source.write_text(INVALID)
+        robot_file = tmp_path / "flow.robot"
+        robot_file.write_text(self.converter.convert(INVALID))
+
+        issues = validate_file(str(robot_file), str(source), self.converter)
+
+        assert [(issue.line, issue.source_line) for issue in issues] == [
+            (10, 5),
+            (11, 6),
+            (12, 7),
+        ]
+        assert "comment" in issues[0].message
+        assert issues[0].statement == 'page.click("#submit")'
+        assert "unescaped separator" in issues[1].message
+        assert "not closed properly" in issues[2].message
+        assert f"{source}:5: page.click" in issues[0].format(str(robot_file), str(source))
+
+    def test_expected_value_with_separator(self):
+        """Test that a ``to_have_value`` value split into extra cells is reported."""
+        code = 'expect(page.locator("[name=q]")).to_have_value("two    spaces")\n'
+        issues = validate_robot(self.converter.convert(code))
+        assert [issue.line for issue in issues] == [9]
+        assert "'Get Property' expects 4 arguments, got 5." in issues[0].message
+        assert "unescaped separator" in issues[0].message
+
+    def test_source_line_map_skips_unconverted_lines(self):
+        """Test that only lines producing Robot steps are mapped."""
+        mapping = source_line_map(self.converter, VALID)
+        assert mapping[9] == (4, 'page.goto("https://example.com")')
+        assert mapping[12] == (7, 'expect(page).to_have_title("Shop")')
+        assert len(mapping) == 4
+
+    def test_source_line_map_follows_the_optimizer(self):
+        """Test that steps removed or merged by the optimizer do not shift the map."""
+        code = """page.click("#user")
+page.fill("#user", "ann")
+page.fill("#user", "anneke")
+page.click("#submit")
+"""
+        converter = PlaywrightToRobotConverter(optimizer=ActionOptimizer())
+        mapping = source_line_map(converter, code)
+        assert mapping == {9: (3, 'page.fill("#user", "anneke")'), 10: (4, 'page.click("#submit")')}
+        assert converter.optimizer.removed == 0
+
+    def test_source_line_map_with_ast_parser(self):
+        """Test that statements split over several lines map to their first line."""
+        code = 'page.goto("https://example.com")\npage.fill(\n    "#user",\n    "ann",\n)\n'
+        mapping = source_line_map(PlaywrightToRobotConverter(parser="ast"), code)
+        assert mapping == {9: (1, 'page.goto("https://example.com")'), 10: (2, "page.fill(")}
+
+    def test_optimized_issues_are_mapped_to_statements(self, tmp_path):
+        """Test that issues in an optimized conversion point at the right statement."""
+        code = INVALID.replace('    page.click("#submit")\n', '    page.click("[name=q]")\n')
+        source = tmp_path / "flow.py"
+        source.write_text(code)
+        robot_file = tmp_path / "flow.robot"
+        converter = PlaywrightToRobotConverter(optimizer=ActionOptimizer())
+        robot_file.write_text(converter.convert(code))
+
+        issues = validate_file(str(robot_file), str(source), converter)
+
+        assert [(issue.line, issue.source_line) for issue in issues] == [(10, 7)]
+        assert issues[0].statement == 'page.fill("[name=q]", "${not closed")'
+
+
+class TestBatchValidation:
+    """Test cases for validation in batch conversion."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_batch_reports_invalid_files(self, tmp_path, jobs):
+        """Test that batch conversion attaches issues per file."""
+        source_dir = tmp_path / "in"
+        source_dir.mkdir()
+        (source_dir / "good.py").write_text(VALID)
+        (source_dir / "bad.py").write_text(INVALID)
+
+        summary = BatchConverter(
+            output_dir=str(tmp_path / "out"), jobs=jobs, validate=True
+        ).convert([str(source_dir)])
+
+        issues = {result.source.rsplit("/", 1)[-1]: result.issues for result in summary.results}
+        assert issues["good.py"] == []
+        assert [issue.source_line for issue in issues["bad.py"]] == [5, 6, 7]
+        assert summary.invalid == 1
+        assert "1 invalid" in summary.format()